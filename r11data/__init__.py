@@ -1,17 +1,24 @@
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from r11data.utils.paths import env_path
+"""R11Data: Releven Data/Graph Integration."""
 
+from typing import TYPE_CHECKING
 
-class Settings(BaseSettings):
-    """Main settings class."""
 
-    model_config = SettingsConfigDict(env_file=env_path)
+if TYPE_CHECKING:
+    from r11data.utils.settings import Settings
 
-    GRAPHDB_USER: str
-    GRAPHDB_PASSWD: str
+    settings: Settings
 
-    WISSKI_USER: str
-    WISSKI_PASSWD: str
 
+def __getattr__(name: str):
+    """Instantiate Settings lazily on first access of r11data.settings.
 
-settings = Settings()
+    This keeps pydantic-settings and .env parsing out of import time.
+    """
+    if name == "settings":
+        from r11data.utils.settings import Settings
+
+        settings = Settings()
+        globals()["settings"] = settings
+        return settings
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -1,12 +1,44 @@
 """ABCs for R11Data."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import ExitStack
+from pathlib import Path
+import tempfile
+from typing import cast
 
-from rdflib import Graph
+from loguru import logger
+from r11data.utils.delta import compute_delta
+from r11data.utils.paths import cache
+from r11data.utils.sinks import (
+    NTriplesSink,
+    TripleSink,
+    _OutputFormat,
+    make_sink,
+    output_suffixes,
+)
+from r11data.utils.tracing import tracer
+from r11data.utils.upload import GraphStoreSink
+from rdflib import RDF, RDFS, XSD, Graph, Namespace
 
 
 class _ABCRunner(ABC):
-    """ABC for R11Data Runners."""
+    """ABC for R11Data Runners.
+
+    Runners can stream their output: generate_graphs yields (sub)graphs
+    which persist_stream writes to a TripleSink as soon as they are produced.
+
+    If delta is True, persist_stream additionally diffs the output
+    against the previous run and writes a SPARQL UPDATE changeset (see compute_delta).
+
+    If upload is set, persist_stream additionally uploads the output
+    to a triple store while it is generated (see GraphStoreSink).
+    """
+
+    output_format: _OutputFormat = "turtle"
+    namespaces: dict[str, Namespace] = {"rdf": RDF, "rdfs": RDFS, "xsd": XSD}
+    delta: bool = False
+    upload: GraphStoreSink | None = None
 
     @abstractmethod
     def persist(self) -> None:
@@ -15,3 +47,65 @@ class _ABCRunner(ABC):
     @abstractmethod
     def run(self) -> Graph:
         raise NotImplementedError
+
+    def generate_graphs(self) -> Iterator[Graph]:
+        """Generate the runner output incrementally.
+
+        The default implementation yields the result of run;
+        runners should override this to yield partial graphs.
+        """
+        yield self.run()
+
+    def persist_stream(self, output_file: Path) -> Path:
+        """Stream the output of generate_graphs to output_file.
+
+        The file suffix is determined by output_format;
+        changesets are written next to output_file with an '.ru' suffix.
+        """
+        output_file = output_file.with_suffix(output_suffixes[self.output_format])
+        sink = make_sink(output_file, self.output_format, self.namespaces)
+
+        with ExitStack() as stack:
+            stack.enter_context(sink)
+            sinks: list[TripleSink | GraphStoreSink] = [sink]
+            nt_sink: TripleSink = sink
+
+            if self.delta and self.output_format != "nt":
+                temp_dir = stack.enter_context(tempfile.TemporaryDirectory())
+                nt_sink = NTriplesSink(Path(temp_dir) / output_file.stem)
+                sinks.append(stack.enter_context(nt_sink))
+
+            if self.upload is not None:
+                sinks.append(stack.enter_context(self.upload))
+
+            for graph in self.generate_graphs():
+                for _sink in sinks:
+                    with tracer.span(f"write {type(_sink).__name__}", "serialize"):
+                        _sink.write(graph)
+
+            if self.delta:
+                nt_sink.close()
+                with tracer.span("compute delta"):
+                    self._persist_delta(nt_sink.path, output_file)
+
+        if self.upload is not None:
+            stats = self.upload.stats
+            logger.info(
+                f"Uploaded {stats.triples} triples in {stats.chunks} chunks "
+                f"({stats.bytes} bytes gzipped) to '{self.upload.endpoint}'."
+            )
+
+        return output_file
+
+    def _persist_delta(self, ntriples_file: Path, output_file: Path) -> Path:
+        """Diff N-Triples output against the previous run and write the changeset."""
+        snapshot_file = cast(Path, cache) / "snapshots" / f"{output_file.stem}.nt"
+        changeset_file = output_file.with_suffix(".ru")
+
+        stats = compute_delta(ntriples_file, snapshot_file, changeset_file)
+        logger.info(
+            f"Delta for '{output_file.name}': {stats.deleted} deletions, "
+            f"{stats.inserted} insertions."
+        )
+
+        return changeset_file
@@ -0,0 +1,9 @@
+"""Offline benchmark suite for R11Data hot paths.
+
+Benchmarks are registered in r11data.benchmarks.suite and run with
+
+    python -m r11data.benchmarks [names ...] [--compare baseline.json]
+
+Remote endpoints are replaced by a local stand-in (see StandInEndpoint),
+so benchmarks need no network access.
+"""
@@ -0,0 +1,90 @@
+"""CLI for the R11Data benchmark suite."""
+
+import argparse
+import datetime
+from pathlib import Path
+import sys
+from typing import cast
+
+from r11data.benchmarks import suite  # noqa: F401
+from r11data.benchmarks.harness import (
+    benchmarks,
+    compare_results,
+    load_results,
+    run_benchmark,
+    save_results,
+)
+from r11data.utils.paths import cache
+
+
+parser = argparse.ArgumentParser(
+    prog="r11data.benchmarks",
+    description="Run offline benchmarks for R11Data hot paths.",
+)
+parser.add_argument(
+    "benchmarks",
+    nargs="*",
+    help=f"Benchmarks to run (default: all); one of {', '.join(benchmarks)}.",
+)
+parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per benchmark.")
+parser.add_argument("--warmup", type=int, default=1, help="Untimed warmup rounds.")
+parser.add_argument(
+    "--output",
+    type=Path,
+    default=None,
+    help="Results file (default: .cache/benchmarks/<timestamp>.json).",
+)
+parser.add_argument(
+    "--compare",
+    type=Path,
+    default=None,
+    metavar="BASELINE",
+    help="Compare median timings against a BASELINE results file.",
+)
+parser.add_argument(
+    "--threshold",
+    type=float,
+    default=0.2,
+    help="Relative slowdown against BASELINE which counts as a regression.",
+)
+
+
+if __name__ == "__main__":
+    parsed_args = parser.parse_args()
+    names: list[str] = parsed_args.benchmarks or list(benchmarks)
+
+    if unknown := set(names) - benchmarks.keys():
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    results = []
+    for name in names:
+        result = run_benchmark(name, parsed_args.rounds, parsed_args.warmup)
+        summary = result.summary()
+        print(
+            f"{name:<24} median {summary['median']:9.4f}s  "
+            f"min {summary['min']:9.4f}s  "
+            f"{summary['items_per_second'] or 0:12.1f} items/s"
+        )
+        results.append(result)
+
+    timestamp = datetime.datetime.now().strftime("%Y%m%dT%H%M%S")
+    output_file = (
+        parsed_args.output or cast(Path, cache) / "benchmarks" / f"{timestamp}.json"
+    )
+    save_results(results, output_file)
+    print(f"Results written to '{output_file}'.")
+
+    if parsed_args.compare is not None:
+        comparisons = compare_results(
+            load_results(parsed_args.compare), load_results(output_file)
+        )
+        regressions = [c for c in comparisons if c.ratio > 1 + parsed_args.threshold]
+
+        for comparison in comparisons:
+            marker = "REGRESSION" if comparison in regressions else ""
+            print(
+                f"{comparison.name:<24} {comparison.baseline:9.4f}s -> "
+                f"{comparison.current:9.4f}s ({comparison.ratio:6.2f}x) {marker}"
+            )
+
+        sys.exit(bool(regressions))
@@ -0,0 +1,141 @@
+"""Benchmark registry, timing and result comparison."""
+
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import asdict, dataclass
+import datetime
+import gc
+import json
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import time
+from typing import NamedTuple
+
+
+class BenchmarkCase(NamedTuple):
+    """A timed callable and the number of items it processes per call."""
+
+    func: Callable[[], object]
+    items: int
+
+
+_Setup = Callable[[], Iterator[BenchmarkCase]]
+
+benchmarks: dict[str, Callable[[], AbstractContextManager[BenchmarkCase]]] = {}
+
+
+def benchmark(name: str) -> Callable[[_Setup], _Setup]:
+    """Register a benchmark.
+
+    The decorated function is a generator which prepares the benchmark,
+    yields a single BenchmarkCase and cleans up afterwards (cf. contextmanager);
+    only calls of the case's func are timed.
+    """
+
+    def _decorator(setup: _Setup) -> _Setup:
+        benchmarks[name] = contextmanager(setup)
+        return setup
+
+    return _decorator
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of a benchmark in seconds per round."""
+
+    name: str
+    items: int
+    rounds: list[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.rounds)
+
+    def summary(self) -> dict:
+        """Get the result with summary statistics."""
+        return {
+            **asdict(self),
+            "min": min(self.rounds),
+            "median": self.median,
+            "mean": statistics.mean(self.rounds),
+            "stdev": statistics.stdev(self.rounds) if len(self.rounds) > 1 else 0.0,
+            "items_per_second": self.items / self.median if self.median else None,
+        }
+
+
+def run_benchmark(name: str, rounds: int = 5, warmup: int = 1) -> BenchmarkResult:
+    """Run a registered benchmark for warmup + rounds calls and time the rounds."""
+    with benchmarks[name]() as case:
+        for _ in range(warmup):
+            case.func()
+
+        timings = []
+        for _ in range(rounds):
+            gc.collect()
+            start = time.perf_counter()
+            case.func()
+            timings.append(time.perf_counter() - start)
+
+    return BenchmarkResult(name=name, items=case.items, rounds=timings)
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def save_results(results: list[BenchmarkResult], output_file: Path) -> Path:
+    """Write results and run metadata as JSON."""
+    document = {
+        "created": datetime.datetime.now(datetime.UTC).isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {result.name: result.summary() for result in results},
+    }
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, "w") as f:
+        json.dump(document, f, indent=4)
+
+    return output_file
+
+
+def load_results(results_file: Path) -> dict[str, dict]:
+    """Load the per-benchmark results of a results file."""
+    with open(results_file) as f:
+        return json.load(f)["results"]
+
+
+class Comparison(NamedTuple):
+    """Median timings of a benchmark in a baseline and a current run."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def compare_results(
+    baseline: dict[str, dict], current: dict[str, dict]
+) -> list[Comparison]:
+    """Compare median timings of benchmarks present in both runs."""
+    return [
+        Comparison(name, baseline[name]["median"], current[name]["median"])
+        for name in current
+        if name in baseline
+    ]
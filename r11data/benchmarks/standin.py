@@ -0,0 +1,171 @@
+"""Local stand-in SPARQL endpoint for offline benchmarks."""
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import re
+import threading
+import time
+from typing import Self
+from urllib.parse import parse_qs, urlparse
+
+
+_Responder = Callable[[str], bytes]
+
+_form = "application/x-www-form-urlencoded"
+
+_select_pattern = re.compile(
+    r"select\s+(?:distinct\s+)?(.+?)\s*where", re.IGNORECASE | re.DOTALL
+)
+
+
+def select_variables(query: str) -> list[str]:
+    """Get the projected variables of a SPARQL SELECT query."""
+    match = _select_pattern.search(query)
+    if match is None:
+        return []
+    return re.findall(r"\?(\w+)", match.group(1))
+
+
+def select_response(variables: Iterable[str], rows: Iterable[Mapping]) -> bytes:
+    """Serialize rows as a SPARQL JSON results document.
+
+    Row values starting with 'http' are serialized as URIs, other values as literals.
+    """
+    bindings = [
+        {
+            name: {
+                "type": "uri" if str(value).startswith("http") else "literal",
+                "value": str(value),
+            }
+            for name, value in row.items()
+        }
+        for row in rows
+    ]
+    document = {"head": {"vars": list(variables)}, "results": {"bindings": bindings}}
+    return json.dumps(document).encode("utf-8")
+
+
+def uri_responder(query: str) -> bytes:
+    """Answer every SELECT query with a single row of query-derived URIs."""
+    variables = select_variables(query)
+    digest = hashlib.sha1(query.encode("utf-8")).hexdigest()[:12]
+    row = {
+        name: f"https://r11.eu/rdf/resource/standin-{digest}-{name}"
+        for name in variables
+    }
+    return select_response(variables, [row])
+
+
+@dataclass
+class StandInRequest:
+    """Request received by a StandInEndpoint; header names are lowercased."""
+
+    method: str
+    params: dict[str, list[str]]
+    headers: dict[str, str]
+    body: bytes
+
+
+class StandInEndpoint:
+    """SPARQL endpoint stand-in served from a local thread.
+
+    Queries (GET or form-encoded POST) are answered by responder;
+    other requests (e.g. Graph Store Protocol uploads) are answered with 204 No Content.
+    latency (in seconds) is added to every response to model network round-trips;
+    the first failures requests are answered with 503 Service Unavailable.
+
+    All requests are recorded in received.
+    """
+
+    def __init__(
+        self,
+        responder: _Responder = uri_responder,
+        latency: float = 0,
+        failures: int = 0,
+    ):
+        self.responder = responder
+        self.latency = latency
+        self.failures = failures
+        self.requests = 0
+        self.received: list[StandInRequest] = []
+
+        self._server: ThreadingHTTPServer | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("StandInEndpoint is not running.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}/sparql"
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Serve on a free local port."""
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                self._respond()
+
+            def do_POST(self) -> None:
+                self._respond()
+
+            def do_DELETE(self) -> None:
+                self._respond()
+
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                request = StandInRequest(
+                    self.command,
+                    parse_qs(urlparse(self.path).query, keep_blank_values=True),
+                    {name.lower(): value for name, value in self.headers.items()},
+                    self.rfile.read(length),
+                )
+                if self.headers.get_content_type() == _form:
+                    request.params |= parse_qs(request.body.decode("utf-8"))
+
+                with endpoint._lock:
+                    endpoint.requests += 1
+                    endpoint.received.append(request)
+                    failing = endpoint.failures > 0
+                    if failing:
+                        endpoint.failures -= 1
+
+                if endpoint.latency:
+                    time.sleep(endpoint.latency)
+
+                if failing or "query" not in request.params:
+                    self.send_response(503 if failing else 204)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                body = endpoint.responder(request.params["query"][0])
+                self.send_response(200)
+                self.send_header("Content-Type", "application/sparql-results+json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
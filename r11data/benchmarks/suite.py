@@ -0,0 +1,311 @@
+"""Benchmarks for R11Data hot paths.
+
+SPARQL resolution is served by a local StandInEndpoint with the response cache bypassed,
+so benchmarks measure client-side processing plus local HTTP round-trips.
+"""
+
+from collections.abc import Iterator
+import calendar
+from contextlib import contextmanager
+import hashlib
+import itertools
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import cast
+from xml.sax.saxutils import escape
+
+from hypothesis import HealthCheck, Phase, given, settings
+from hypothesis import strategies as st
+import pandas as pd
+from r11data.benchmarks.harness import BenchmarkCase, benchmark
+from r11data.benchmarks.standin import (
+    StandInEndpoint,
+    select_response,
+    select_variables,
+)
+from r11data.utils.endpoints import override_endpoints
+from r11data.utils.paths import data_kekaumenos
+from r11data.utils.sparql_cache import CacheMode, sparql_cache
+from rdflib import Graph
+
+
+# -- date strings --
+_month_names = calendar.month_name[1:]
+
+
+def _range(elements: st.SearchStrategy) -> st.SearchStrategy[str]:
+    """Strategy for single values or ranges ('a-b' or 'a/b') of elements."""
+    return st.one_of(
+        elements.map(str),
+        st.tuples(elements, st.sampled_from("-/"), elements).map(
+            lambda t: f"{t[0]}{t[1]}{t[2]}"
+        ),
+    )
+
+
+@st.composite
+def r11_date_strings(draw: st.DrawFn) -> str:
+    """Strategy for R11 death date values, e.g. 'J 1043, April 11-12 [TAQ]'.
+
+    Mostly well-formed values (which may still be invalid dates),
+    mixed with 'UNDATED' and unstructured text.
+    """
+    kind = draw(st.sampled_from(["date"] * 8 + ["undated", "text"]))
+
+    if kind == "undated":
+        return "UNDATED"
+    if kind == "text":
+        return draw(st.text(max_size=20))
+
+    value = " ".join(
+        [
+            draw(st.sampled_from(["J", "J", "AM", "A", "X"])),
+            draw(_range(st.integers(1, 7000))),
+        ]
+    )
+
+    if draw(st.booleans()):
+        value += f", {draw(_range(st.sampled_from(_month_names)))}"
+        if draw(st.booleans()):
+            value += f" {draw(_range(st.integers(1, 31)))}"
+
+    if draw(st.booleans()):
+        value += f" [{draw(st.sampled_from(['TPQ', 'TAQ', 'XYZ']))}]"
+
+    return value
+
+
+def generate_date_strings(n: int = 2000) -> list[str]:
+    """Generate (up to) n date strings; generation is derandomized, i.e. reproducible."""
+    values: list[str] = []
+
+    @settings(
+        max_examples=n,
+        database=None,
+        derandomize=True,
+        phases=[Phase.generate],
+        suppress_health_check=list(HealthCheck),
+        deadline=None,
+    )
+    @given(r11_date_strings())
+    def _collect(value: str) -> None:
+        values.append(value)
+
+    _collect()
+    return values
+
+
+@benchmark("date_parser")
+def _date_parser() -> Iterator[BenchmarkCase]:
+    from r11data.tabular.deaths.date_cache import parse_date
+
+    date_strings = generate_date_strings()
+
+    def _parse():
+        for date_string in date_strings:
+            parse_date(date_string)
+
+    yield BenchmarkCase(_parse, len(date_strings))
+
+
+@benchmark("bulk_date_parser")
+def _bulk_date_parser() -> Iterator[BenchmarkCase]:
+    from r11data.tabular.deaths.bulk_date_parser import parse_dates
+
+    date_strings = pd.Series(generate_date_strings())
+    yield BenchmarkCase(lambda: parse_dates(date_strings), len(date_strings))
+
+
+# -- deaths row rules --
+@contextmanager
+def _standin_deaths() -> Iterator[StandInEndpoint]:
+    """Serve deaths URI lookups from a stand-in with the response cache bypassed."""
+    # the stand-in does not check credentials
+    for variable in ("GRAPHDB_USER", "GRAPHDB_PASSWD", "WISSKI_USER", "WISSKI_PASSWD"):
+        os.environ.setdefault(variable, "benchmark")
+
+    cache_mode = sparql_cache.mode
+    sparql_cache.mode = CacheMode.bypass
+
+    try:
+        with StandInEndpoint() as endpoint, override_endpoints(releven=endpoint.url):
+            yield endpoint
+    finally:
+        sparql_cache.mode = cache_mode
+
+
+def _generate_row_graphs() -> list[Graph]:
+    from r11data.tabular.deaths.runner import converters
+
+    return list(
+        itertools.chain.from_iterable(
+            converter._generate_graphs() for converter in converters
+        )
+    )
+
+
+@benchmark("row_rules")
+def _row_rules() -> Iterator[BenchmarkCase]:
+    from r11data.tabular.deaths.runner import converters
+
+    rows = sum(len(converter._df) for converter in converters)
+
+    with _standin_deaths():
+        yield BenchmarkCase(_generate_row_graphs, rows)
+
+
+def _row_graphs() -> list[Graph]:
+    with _standin_deaths():
+        return _generate_row_graphs()
+
+
+def _merge(row_graphs: list[Graph]) -> Graph:
+    from r11data.tabular.deaths.utils.namespaces import R11NamespaceManager
+
+    graph = Graph()
+    R11NamespaceManager(graph)
+
+    for row_graph in row_graphs:
+        graph += row_graph
+
+    return graph
+
+
+@benchmark("graph_merge")
+def _graph_merge() -> Iterator[BenchmarkCase]:
+    row_graphs = _row_graphs()
+    yield BenchmarkCase(lambda: _merge(row_graphs), len(row_graphs))
+
+
+@benchmark("turtle_serialization")
+def _turtle_serialization() -> Iterator[BenchmarkCase]:
+    graph = _merge(_row_graphs())
+    yield BenchmarkCase(lambda: graph.serialize(format="turtle"), len(graph))
+
+
+@benchmark("turtle_sink")
+def _turtle_sink() -> Iterator[BenchmarkCase]:
+    from r11data.tabular.deaths.runner import DeathsRunner
+    from r11data.utils.sinks import TurtleSink
+
+    row_graphs = _row_graphs()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+
+        def _write():
+            with TurtleSink(
+                Path(temp_dir) / "deaths.ttl", DeathsRunner.namespaces
+            ) as sink:
+                for row_graph in row_graphs:
+                    sink.write(row_graph)
+
+        yield BenchmarkCase(_write, sum(map(len, row_graphs)))
+
+
+# -- Kekaumenos --
+def _load_saws_extract(file_name: str) -> list[dict]:
+    with open(cast(Path, data_kekaumenos) / file_name, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def saws_response(file_name: str) -> bytes:
+    """Reconstruct a SAWS SPARQL response (?object ?p ?o) from a persisted extract.
+
+    Text content is wrapped in TEI XML as served by the SAWS store.
+    """
+    from r11data.kekaumenos.models import KekaumenosSAWSDataField
+
+    predicates = {
+        name: field.validation_alias or "http://www.w3.org/2000/01/rdf-schema#label"
+        for name, field in KekaumenosSAWSDataField.model_fields.items()
+    }
+    text_content = predicates["has_text_content"]
+
+    rows = [
+        {
+            "object": model["node_id"],
+            "p": predicates[name],
+            "o": (
+                '<div xmlns="http://www.tei-c.org/ns/1.0">'
+                f"<seg>{escape(value)}</seg></div>"
+                if predicates[name] == text_content
+                else value
+            ),
+        }
+        for model in _load_saws_extract(file_name)
+        for name, value in model["data"].items()
+        if value is not None
+    ]
+
+    return select_response(["object", "p", "o"], rows)
+
+
+@benchmark("saws_processing")
+def _saws_processing() -> Iterator[BenchmarkCase]:
+    from r11data.kekaumenos.utils.utils import group_iterator, strip_xml_nodes
+    from r11data.utils.sparql_results import iter_bindings
+
+    responses = [
+        saws_response(file_name)
+        for file_name in ("kekaumenos_eng.json", "kekaumenos_grc.json")
+    ]
+    bindings = sum(
+        len(json.loads(response)["results"]["bindings"]) for response in responses
+    )
+
+    def _process():
+        for response in responses:
+            group_iterator(strip_xml_nodes(iter_bindings([response])), by="object")
+
+    yield BenchmarkCase(_process, bindings)
+
+
+def _releven_rows() -> list[dict[str, str]]:
+    """Get RELEVEN Kekaumenos bindings from excerpts of SAWS Greek segments.
+
+    Every third segment yields a contained excerpt, every seventh an unmatched text.
+    """
+    rows = []
+    for index, model in enumerate(_load_saws_extract("kekaumenos_grc.json")):
+        text = model["data"]["has_text_content"].strip()
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+        if index % 3 == 0:
+            excerpt = text[len(text) // 3 : len(text) // 3 + 40]
+        elif index % 7 == 0:
+            excerpt = f"{digest} {text[:40][::-1]}"
+        else:
+            continue
+
+        rows.append(
+            {
+                "e33": f"https://r11.eu/rdf/resource/standin-{digest}",
+                "text": excerpt,
+                "label": f"Kekaumenos {index}",
+            }
+        )
+
+    return rows
+
+
+def _releven_responder(query: str) -> bytes:
+    return select_response(select_variables(query), _releven_rows())
+
+
+@benchmark("generate_matches")
+def _generate_matches() -> Iterator[BenchmarkCase]:
+    from r11data.kekaumenos.runner import generate_matches
+
+    cache_mode = sparql_cache.mode
+    sparql_cache.mode = CacheMode.bypass
+
+    try:
+        with (
+            StandInEndpoint(_releven_responder) as endpoint,
+            override_endpoints(releven_2025=endpoint.url),
+        ):
+            yield BenchmarkCase(lambda: list(generate_matches()), len(_releven_rows()))
+    finally:
+        sparql_cache.mode = cache_mode
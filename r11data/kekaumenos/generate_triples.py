@@ -1,9 +1,13 @@
 from collections.abc import Iterator
 import itertools
 import json
+from pathlib import Path
+from typing import cast
 
 from lodkit import NamespaceGraph, URIConstructorFactory, _Triple, ttl
+from r11data.utils.minting import minter
 from r11data.utils.paths import output
+from r11data.utils.sinks import TurtleSink
 from rdflib import Graph, Namespace, RDF, RDFS, URIRef
 
 
@@ -37,7 +41,7 @@ def aleks_triples() -> Iterator[_Triple]:
 
 def generate_relation_triples(data: dict) -> Iterator[_Triple]:
     return ttl(
-        mkuri(),
+        mkuri(minter.hash_value("relation", data["r11_uri"], data["saws_uri"])),
         (RDF.type, crm.E13_Attribute_Assignment),
         (crm.P14_carried_out_by, mkuri(orcid_aleks)),
         (crm.P140_assigned_attribute_to, URIRef(data["r11_uri"])),
@@ -46,28 +50,36 @@ def generate_relation_triples(data: dict) -> Iterator[_Triple]:
     )
 
 
-def generate_kekaumenos_graph() -> Graph:
+def generate_kekaumenos_triple_chunks() -> Iterator[list[_Triple]]:
+    """Generate Kekaumenos triples in chunks of one relation each."""
     with open("./data/matches_selected_items.json") as f:
         json_data = json.load(f)
 
-        triples = itertools.chain(
-            *map(generate_relation_triples, json_data), aleks_triples()
-        )
+    for data in json_data:
+        yield list(generate_relation_triples(data))
+
+    yield list(aleks_triples())
+
+
+def generate_kekaumenos_graph() -> Graph:
+    triples = itertools.chain.from_iterable(generate_kekaumenos_triple_chunks())
 
-        graph = KekaumenosGraph()
+    graph = KekaumenosGraph()
 
-        for triple in triples:
-            graph.add(triple)
+    for triple in triples:
+        graph.add(triple)
 
-        return graph
+    return graph
 
 
 def persist_kekaumenos_graph() -> None:
-    kekaumenos_graph: Graph = generate_kekaumenos_graph()
     kekaumenos_path = output / "kekaumenos/kekaumenos_graph.ttl"
+    namespaces = {"rdf": RDF, "rdfs": RDFS, **KekaumenosGraph._bindings}
 
-    with open(kekaumenos_path, "w") as f:  # type: ignore
-        f.write(kekaumenos_graph.serialize())
+    with TurtleSink(cast(Path, kekaumenos_path), namespaces) as sink:
+        for triples in generate_kekaumenos_triple_chunks():
+            sink.write(triples)
 
 
-persist_kekaumenos_graph()
+if __name__ == "__main__":
+    persist_kekaumenos_graph()
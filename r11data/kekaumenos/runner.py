@@ -1,11 +1,13 @@
 """Runner for R11data Kekaumenos data extraction and generation."""
 
+import argparse
 from collections.abc import Iterator
 from collections.abc import Callable
 import csv
 from functools import partial
 import json
 import re
+from pathlib import Path
 from typing import Annotated
 from typing import Any
 
@@ -15,13 +17,16 @@ from r11data.kekaumenos.sparql.kekaumenos_queries import (
     kekaumenos_eng_query,
     kekaumenos_grc_query,
 )
+from r11data.kekaumenos.utils.fuzzy import FuzzyIndex
+from r11data.kekaumenos.utils.matching import AhoCorasick
 from r11data.kekaumenos.utils.utils import (
-    get_bindings_from_response,
     group_iterator,
-    httpx_run_sparql_query,
+    stream_sparql_bindings,
     strip_xml_nodes,
 )
+from r11data.utils.endpoints import endpoints
 from r11data.utils.paths import data_kekaumenos
+from r11data.utils.tracing import format_summary, tracer
 import toolz
 
 
@@ -30,18 +35,21 @@ kekaumenos_components: Annotated[
 ] = [
     partial(group_iterator, by="object"),
     strip_xml_nodes,
-    get_bindings_from_response,
-    httpx_run_sparql_query,
+    stream_sparql_bindings,
 ]
 
 
 def generate_kekaumenos_models(query: str) -> Iterator[KekaumenosSAWSModel]:
     """Query the SAWS store and instantiate KekaumenosSAWSModel instances from the SPARQL response."""
     kekaumenos_compose = toolz.compose(*kekaumenos_components)(
-        endpoint="https://ancientwisdoms.ac.uk/sesame/repositories/saws", query=query
+        endpoint=endpoints["saws"], query=query
     )
     for node_id, data in kekaumenos_compose.items():
-        yield KekaumenosSAWSModel(node_id=node_id, data=KekaumenosSAWSDataField(**data))
+        with tracer.span("validate saws model", "saws", node_id=node_id):
+            model = KekaumenosSAWSModel(
+                node_id=node_id, data=KekaumenosSAWSDataField(**data)
+            )
+        yield model
 
 
 def persist_kekaumenos_json_to_file(
@@ -89,10 +97,7 @@ def get_releven_kekaumenos_bindings():
     }
     """
 
-    response = httpx_run_sparql_query(
-        endpoint="https://graphdb.r11.eu/repositories/RELEVEN_2025", query=query
-    )
-    bindings = get_bindings_from_response(response)
+    bindings = stream_sparql_bindings(endpoint=endpoints["releven_2025"], query=query)
 
     return bindings
 
@@ -107,20 +112,66 @@ def get_saws_bindings():
 
 
 def generate_matches():
+    """Generate (r11, saws) matches where the RELEVEN text is contained in the SAWS text.
+
+    An Aho-Corasick automaton is built over all RELEVEN texts,
+    so every SAWS segment is scanned only once.
+    Matches are yielded in RELEVEN binding order, then SAWS binding order.
+    """
+    with tracer.span("load kekaumenos bindings"):
+        r11_bindings = [
+            tuple(binding.values()) for binding in get_releven_kekaumenos_bindings()
+        ]
+        saws_bindings = [tuple(binding.values()) for binding in get_saws_bindings()]
+
+    with tracer.span("build automaton", texts=len(r11_bindings)):
+        automaton = AhoCorasick(r11_text for _, r11_text, _ in r11_bindings)
+
+    with tracer.span("match saws texts", texts=len(saws_bindings)):
+        matches = sorted(
+            (r11_index, saws_index)
+            for saws_index, (_, saws_text) in enumerate(saws_bindings)
+            for r11_index in automaton.contained(saws_text)
+        )
+
+    for r11_index, saws_index in matches:
+        r11_uri, r11_text, r11_label = r11_bindings[r11_index]
+        saws_uri, saws_text = saws_bindings[saws_index]
+
+        yield {
+            "r11_uri": r11_uri,
+            "r11_text": r11_text,
+            "r11_label": r11_label,
+            "saws_uri": saws_uri,
+            "saws_text": saws_text,
+        }
+
+
+def generate_fuzzy_matches(top_k: int = 5, threshold: float = 0.5):
+    """Generate approximate (r11, saws) matches with similarity scores.
+
+    Texts are compared after normalization (diacritics, editorial sigla,
+    case and whitespace); candidates come from a MinHash/LSH index (see FuzzyIndex).
+    For every RELEVEN text, up to top_k SAWS segments with score >= threshold
+    are yielded in descending score order.
+    """
+    saws_bindings = [tuple(binding.values()) for binding in get_saws_bindings()]
+    index = FuzzyIndex(saws_text for _, saws_text in saws_bindings)
+
     for r11_binding in get_releven_kekaumenos_bindings():
         r11_uri, r11_text, r11_label = r11_binding.values()
 
-        for saws_binding in get_saws_bindings():
-            saws_uri, saws_text = saws_binding.values()
+        for saws_index, score in index.query(r11_text, top_k, threshold):
+            saws_uri, saws_text = saws_bindings[saws_index]
 
-            if r11_text in saws_text:
-                yield {
-                    "r11_uri": r11_uri,
-                    "r11_text": r11_text,
-                    "r11_label": r11_label,
-                    "saws_uri": saws_uri,
-                    "saws_text": saws_text,
-                }
+            yield {
+                "r11_uri": r11_uri,
+                "r11_text": r11_text,
+                "r11_label": r11_label,
+                "saws_uri": saws_uri,
+                "saws_text": saws_text,
+                "score": score,
+            }
 
 
 def color_match(saws_text, match):
@@ -128,16 +179,102 @@ def color_match(saws_text, match):
     return pattern.sub(r'<span style="color: red">\g<0></span>', saws_text)
 
 
-with open("./template.html") as template, open("./matches.html", "w") as output:
-    template = Template(template.read())
-    rendered = template.render(data=list(generate_matches()), color_match=color_match)
+def persist_matches(
+    fuzzy: bool = False, top_k: int = 5, threshold: float = 0.5
+) -> None:
+    """Render matches to matches.html and write them to matches.csv.
+
+    If fuzzy is set, approximate matches with scores are persisted
+    (see generate_fuzzy_matches) instead of exact containment matches.
+    Paths are relative to the working directory.
+    """
+    matches = list(
+        generate_fuzzy_matches(top_k=top_k, threshold=threshold)
+        if fuzzy
+        else generate_matches()
+    )
+
+    with (
+        open("./template.html") as template,
+        open("./matches.html", "w") as output,
+        tracer.span("render matches", matches=len(matches)),
+    ):
+        template = Template(template.read())
+        rendered = template.render(data=matches, color_match=color_match)
+
+        output.write(rendered)
+
+    with open("./matches.csv", "w") as csvfile:
+        fieldnames = ["r11_uri", "r11_text", "r11_label", "saws_uri", "saws_text"]
+        if fuzzy:
+            fieldnames.append("score")
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+
+        writer.writeheader()
+        writer.writerows(matches)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="kekaumenos", description="Persist Kekaumenos RELEVEN/SAWS matches."
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="TRACE_FILE",
+        type=Path,
+        default=None,
+        help="Record stage/query timings and write a Chrome trace to TRACE_FILE.",
+    )
+    parser.add_argument(
+        "--fuzzy",
+        action="store_true",
+        help="Persist approximate matches with similarity scores instead of exact matches.",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=5,
+        help="Persist up to TOP_K fuzzy matches per RELEVEN text (default: 5).",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="Minimum similarity score (0-1) of fuzzy matches (default: 0.5).",
+    )
+    parser.add_argument(
+        "--mirror",
+        metavar="DUMP",
+        type=Path,
+        nargs="+",
+        default=None,
+        help="Answer RELEVEN queries in-process from local RDF DUMP files.",
+    )
+    parsed_args = parser.parse_args()
+    tracer.enabled = parsed_args.trace is not None
 
-    output.write(rendered)
+    if not parsed_args.fuzzy and (
+        parsed_args.top_k != parser.get_default("top_k")
+        or parsed_args.threshold != parser.get_default("threshold")
+    ):
+        parser.error("--top-k and --threshold require --fuzzy.")
+    if parsed_args.top_k < 1:
+        parser.error("--top-k must be at least 1.")
+    if not 0 <= parsed_args.threshold <= 1:
+        parser.error("--threshold must be between 0 and 1.")
 
+    if parsed_args.mirror is not None:
+        from r11data.utils.mirror import MirrorStore, mount_mirror
 
-with open("./matches.csv", "w") as csvfile:
-    fieldnames = ["r11_uri", "r11_text", "r11_label", "saws_uri", "saws_text"]
-    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        mount_mirror(MirrorStore(*parsed_args.mirror), "releven", "releven_2025")
 
-    writer.writeheader()
-    writer.writerows(generate_matches())
+    try:
+        persist_matches(
+            fuzzy=parsed_args.fuzzy,
+            top_k=parsed_args.top_k,
+            threshold=parsed_args.threshold,
+        )
+    finally:
+        if parsed_args.trace is not None:
+            tracer.export(parsed_args.trace)
+            print(format_summary(tracer.summary()))
@@ -0,0 +1,173 @@
+"""Approximate (fuzzy) text matching for Kekaumenos alignment.
+
+Texts are normalized, shingled into character n-grams and MinHashed;
+an LSH index over sliding word windows of the SAWS segments generates candidates,
+which are then scored with vectorized MinHash signature comparison.
+"""
+
+from collections.abc import Iterable, Sequence
+import unicodedata
+import zlib
+
+import numpy as np
+
+
+# Mersenne prime 2**31 - 1; keeps (a * x + b) within uint64
+_PRIME = np.uint64((1 << 31) - 1)
+
+_SIGLA = str.maketrans("", "", "[]⟨⟩<>{}()†*|⸢⸣")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize a text for fuzzy matching.
+
+    Strips diacritics and editorial sigla, casefolds (this also maps final sigma)
+    and collapses whitespace.
+    """
+    decomposed = unicodedata.normalize("NFD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.translate(_SIGLA).casefold().split())
+
+
+def char_ngrams(text: str, n: int = 3) -> set[str]:
+    """Get the set of character n-grams of a (normalized) text.
+
+    The text is padded with spaces so that word boundaries are represented.
+    """
+    padded = f" {text} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i : i + n] for i in range(len(padded) - n + 1)}
+
+
+class MinHasher:
+    """MinHash signature generator over character n-grams."""
+
+    def __init__(self, num_perm: int = 64, n: int = 3, seed: int = 0) -> None:
+        self.num_perm = num_perm
+        self.n = n
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.integers(0, _PRIME, num_perm, dtype=np.uint64)[:, None]
+
+    def signature(self, text: str) -> np.ndarray:
+        """Compute the MinHash signature of a normalized text."""
+        hashes = (
+            np.fromiter(
+                (
+                    zlib.crc32(ngram.encode("utf-8"))
+                    for ngram in char_ngrams(text, self.n)
+                ),
+                dtype=np.uint64,
+            )
+            % _PRIME
+        )
+
+        return ((self._a * hashes + self._b) % _PRIME).min(axis=1).astype(np.uint32)
+
+
+class _WindowIndex:
+    """LSH index over word windows of a single size."""
+
+    def __init__(
+        self,
+        segments: Sequence[list[str]],
+        window_size: int,
+        hasher: MinHasher,
+        bands: int,
+    ) -> None:
+        stride = max(1, window_size // 2)
+        rows = hasher.num_perm // bands
+
+        window_segments: list[int] = []
+        signatures: list[np.ndarray] = []
+
+        for segment_index, words in enumerate(segments):
+            for start in range(0, max(len(words) - window_size, 0) + 1, stride):
+                window = " ".join(words[start : start + window_size])
+                window_segments.append(segment_index)
+                signatures.append(hasher.signature(window))
+
+        self.window_segments = np.array(window_segments, dtype=np.int64)
+        # without (non-empty) segments, there are no windows and no matches
+        self.signatures = (
+            np.vstack(signatures)
+            if signatures
+            else np.empty((0, hasher.num_perm), dtype=np.uint32)
+        )
+        self._band_slices = [slice(i * rows, (i + 1) * rows) for i in range(bands)]
+
+        self.buckets: list[dict[bytes, list[int]]] = [{} for _ in range(bands)]
+        for window_index, signature in enumerate(self.signatures):
+            for bucket, band in zip(self.buckets, self._band_slices):
+                bucket.setdefault(signature[band].tobytes(), []).append(window_index)
+
+    def candidates(self, signature: np.ndarray) -> np.ndarray:
+        """Get indices of windows sharing at least one LSH band with signature."""
+        candidates: set[int] = set()
+        for bucket, band in zip(self.buckets, self._band_slices):
+            candidates.update(bucket.get(signature[band].tobytes(), ()))
+        return np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+
+
+class FuzzyIndex:
+    """MinHash/LSH index for approximate matching of short texts against segments.
+
+    Segments are indexed as sliding word windows of several sizes;
+    a query is matched against the windows whose size best fits its word count.
+    The score of a segment is the highest estimated Jaccard similarity
+    of the query and any window of that segment.
+    """
+
+    def __init__(
+        self,
+        segments: Iterable[str],
+        *,
+        window_sizes: Sequence[int] = (1, 2, 4, 8, 16, 32),
+        num_perm: int = 64,
+        bands: int = 16,
+        n: int = 3,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands.")
+
+        self.hasher = MinHasher(num_perm=num_perm, n=n)
+        normalized = [normalize_text(segment).split() for segment in segments]
+        self.num_segments = len(normalized)
+
+        self.window_sizes = sorted(window_sizes)
+        self.indexes = {
+            size: _WindowIndex(normalized, size, self.hasher, bands)
+            for size in self.window_sizes
+        }
+
+    def _window_index(self, text: str) -> _WindowIndex:
+        word_count = len(text.split())
+        size = next(
+            (size for size in self.window_sizes if size >= word_count),
+            self.window_sizes[-1],
+        )
+        return self.indexes[size]
+
+    def query(
+        self, text: str, top_k: int = 5, threshold: float = 0.5
+    ) -> list[tuple[int, float]]:
+        """Get the top_k (segment_index, score) pairs with score >= threshold."""
+        normalized = normalize_text(text)
+        index = self._window_index(normalized)
+        signature = self.hasher.signature(normalized)
+
+        candidates = index.candidates(signature)
+        if not candidates.size:
+            return []
+
+        window_scores = (index.signatures[candidates] == signature).mean(axis=1)
+
+        segment_scores = np.zeros(self.num_segments)
+        np.maximum.at(segment_scores, index.window_segments[candidates], window_scores)
+
+        (matching,) = np.nonzero(segment_scores >= threshold)
+        ranked = matching[np.argsort(-segment_scores[matching], kind="stable")]
+
+        return [(int(i), float(segment_scores[i])) for i in ranked[:top_k]]
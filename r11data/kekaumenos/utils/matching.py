@@ -0,0 +1,87 @@
+"""Multi-pattern text matching for Kekaumenos alignment."""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton for multi-pattern substring search.
+
+    The automaton is built once over all patterns;
+    every text is then scanned in a single pass, yielding all contained patterns.
+    Like 'pattern in text', empty patterns are contained in every text.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns: list[str] = []
+        self._empty: list[int] = []
+
+        # state 0 is the root
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+
+        for pattern in patterns:
+            self._add(pattern)
+
+        self._build()
+
+    def _add(self, pattern: str) -> None:
+        """Add a pattern to the trie."""
+        index = len(self.patterns)
+        self.patterns.append(pattern)
+
+        if not pattern:
+            self._empty.append(index)
+            return
+
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+
+        self._output[state].append(index)
+
+    def _build(self) -> None:
+        """Compute failure links and merge outputs (breadth-first)."""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+
+                fail_target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail_target if fail_target != next_state else 0
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield (end_position, pattern_index) pairs for all pattern occurrences in text.
+
+        Note that empty patterns are never reported (see contained).
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for index in output[state]:
+                yield position, index
+
+    def contained(self, text: str) -> set[int]:
+        """Get the indices of all patterns contained in text (incl. empty patterns)."""
+        return {index for _, index in self.iter_matches(text)}.union(self._empty)
@@ -4,13 +4,14 @@ from collections.abc import Iterator
 
 import httpx
 from lxml import etree as et
+from r11data.utils.sparql_client import sparql_client
+from r11data.utils.sparql_results import iter_bindings
 
 
 def httpx_run_sparql_query(
     endpoint: str, query: str, headers: dict | None = None
 ) -> httpx.Response:
     """Run a SPARQL query against an endpoint using httpx."""
-    data = {"output": "json", "query": query}
     headers = (
         {
             "Accept": "application/sparql-results+json",
@@ -19,10 +20,16 @@ def httpx_run_sparql_query(
         else headers
     )
 
-    response = httpx.post(
+    content = sparql_client.query(
         endpoint,
-        headers=headers,
-        data=data,
+        query,
+        accept=headers.get("Accept", "application/sparql-results+json"),
+        params={"output": "json"},
+    )
+    response = httpx.Response(
+        200,
+        content=content,
+        request=httpx.Request("POST", endpoint),
     )
 
     return response
@@ -38,9 +45,21 @@ def get_bindings_from_dict(bindings_dict: dict) -> Iterator[dict]:
 
 
 def get_bindings_from_response(response: httpx.Response) -> Iterator[dict]:
-    """Generate flat result bindings from a response object."""
-    bindings_dict = response.json()
-    return get_bindings_from_dict(bindings_dict)
+    """Generate flat result bindings from a response object.
+
+    Bindings are parsed incrementally, the response is never loaded as a whole dict.
+    """
+    return iter_bindings(response.iter_bytes())
+
+
+def stream_sparql_bindings(endpoint: str, query: str) -> Iterator[dict]:
+    """Run a SPARQL query against an endpoint and lazily generate flat result bindings.
+
+    The response is streamed and parsed incrementally,
+    so bindings are available before the response is complete.
+    """
+    chunks = sparql_client.stream(endpoint, query, params={"output": "json"})
+    return iter_bindings(chunks)
 
 
 def extract_text_from_xml(xml: str) -> str:
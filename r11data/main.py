@@ -1,16 +1,32 @@
 """Entry point for r11data."""
 
 import argparse
-from types import SimpleNamespace
+from functools import partial
+from pathlib import Path
+import sys
+from typing import TYPE_CHECKING
 
 from loguru import logger
-from r11data.starlegs.runner import StarlegsRunner
-from r11data.tabular.deaths.runner import DeathsRunner
+from r11data.registry import get_runner_class, runner_dependencies, runner_registry
+from r11data.scheduler import job_order
+from r11data.utils.minting import minter
+from r11data.utils.progress import progress
+from r11data.utils.sparql_cache import CacheMode, sparql_cache
+from r11data.utils.tracing import format_summary, tracer
 
 
-runners = SimpleNamespace()
-runners.deaths = DeathsRunner()
-runners.starlegs = StarlegsRunner()
+if TYPE_CHECKING:
+    from r11data.utils.upload import GraphStoreSink
+
+
+def runner_dependency(value: str) -> tuple[str, str]:
+    """Parse a 'runner:dependency' CLI argument."""
+    name, _, dependency = value.partition(":")
+    if not {name, dependency} <= runner_registry.keys():
+        raise argparse.ArgumentTypeError(
+            f"Expected 'RUNNER:DEPENDENCY' with registered runners, got '{value}'."
+        )
+    return name, dependency
 
 
 parser = argparse.ArgumentParser(
@@ -18,13 +34,281 @@ parser = argparse.ArgumentParser(
     description="Invoke R11Data RDF generation runners.",
 )
 
-parser.add_argument("runner", choices=runners.__dict__.keys(), nargs="+")
+parser.add_argument("runner", choices=runner_registry.keys(), nargs="+")
+parser.add_argument(
+    "--batch-size",
+    type=int,
+    default=None,
+    help="Resolve deaths URIs in blocks of BATCH_SIZE rows (one query per block).",
+)
+parser.add_argument(
+    "--max-workers",
+    type=int,
+    default=None,
+    help="Process up to MAX_WORKERS deaths rows (or --batch-size blocks) concurrently.",
+)
+parser.add_argument(
+    "--incremental",
+    action="store_true",
+    help="Only regenerate deaths rows added or changed since the last run.",
+)
+parser.add_argument(
+    "--starlegs-concurrency",
+    type=int,
+    default=None,
+    help="Run up to STARLEGS_CONCURRENCY starlegs queries concurrently.",
+)
+parser.add_argument(
+    "--starlegs-mode",
+    choices=["construct", "count", "insert"],
+    default="construct",
+    help=(
+        "Download starlegs construct results (default), or insert them server-side "
+        "into a named graph with SPARQL updates ('count' is a dry run of 'insert')."
+    ),
+)
+parser.add_argument(
+    "--starlegs-partitions",
+    type=int,
+    default=None,
+    help="Split starlegs construct queries into STARLEGS_PARTITIONS subject-hash partitions.",
+)
+parser.add_argument(
+    "--starlegs-resume",
+    action="store_true",
+    help="Resume a failed partitioned starlegs run from its checkpoint.",
+)
+parser.add_argument(
+    "--output-format",
+    choices=["turtle", "nt"],
+    default="turtle",
+    help="Serialization format for streamed runner output.",
+)
+parser.add_argument(
+    "--deterministic-uris",
+    action="store_true",
+    help="Mint content-derived URIs, so identical input yields identical output.",
+)
+parser.add_argument(
+    "--delta",
+    action="store_true",
+    help="Write a SPARQL UPDATE changeset against the previous run's output.",
+)
+parser.add_argument(
+    "--upload",
+    metavar="ENDPOINT",
+    default=None,
+    help="Upload runner output to a Graph Store Protocol/SPARQL Update ENDPOINT.",
+)
+parser.add_argument(
+    "--upload-protocol",
+    choices=["gsp", "update"],
+    default="gsp",
+    help="Upload via the Graph Store Protocol or SPARQL Update INSERT DATA.",
+)
+parser.add_argument(
+    "--upload-chunk-size",
+    type=int,
+    default=50_000,
+    help="Upload gzip-compressed chunks of UPLOAD_CHUNK_SIZE triples.",
+)
+parser.add_argument(
+    "--upload-workers",
+    type=int,
+    default=4,
+    help="Upload up to UPLOAD_WORKERS chunks concurrently.",
+)
+parser.add_argument(
+    "--named-graphs",
+    action="store_true",
+    help="Upload into (and replace) a named graph per runner.",
+)
+parser.add_argument(
+    "--mirror",
+    metavar="DUMP",
+    type=Path,
+    nargs="+",
+    default=None,
+    help="Answer RELEVEN queries (and updates) in-process from local RDF DUMP files.",
+)
+parser.add_argument(
+    "--trace",
+    metavar="TRACE_FILE",
+    type=Path,
+    default=None,
+    help="Record stage/row/query timings and write a Chrome trace to TRACE_FILE.",
+)
+parser.add_argument(
+    "--jobs",
+    type=int,
+    default=1,
+    help="Run up to JOBS runners concurrently in separate processes.",
+)
+parser.add_argument(
+    "--after",
+    metavar="RUNNER:DEPENDENCY",
+    type=runner_dependency,
+    action="append",
+    default=[],
+    help="Only start RUNNER after DEPENDENCY succeeded (in addition to registered dependencies).",
+)
+parser.add_argument(
+    "--no-progress",
+    action="store_true",
+    help="Disable the live progress view (only shown on terminals).",
+)
+parser.add_argument(
+    "--cache",
+    type=CacheMode,
+    choices=list(CacheMode),
+    default=CacheMode.use,
+    help="Use, bypass or refresh the on-disk SPARQL response cache.",
+)
 
 
-if __name__ == "__main__":
-    args: list[str] = parser.parse_args().__dict__["runner"]
+def runner_options(name: str, parsed_args: argparse.Namespace) -> dict:
+    """Get runner constructor arguments from parsed CLI arguments."""
+    match name:
+        case "deaths":
+            return {
+                "batch_size": parsed_args.batch_size,
+                "max_workers": parsed_args.max_workers,
+                "incremental": parsed_args.incremental,
+            }
+        case "starlegs":
+            return {
+                "max_concurrency": parsed_args.starlegs_concurrency,
+                "mode": parsed_args.starlegs_mode,
+                "partitions": parsed_args.starlegs_partitions,
+                "resume": parsed_args.starlegs_resume,
+            }
+        case _:
+            return {}
+
+
+def upload_sink(name: str, parsed_args: argparse.Namespace) -> "GraphStoreSink | None":
+    """Get the upload sink for a runner from parsed CLI arguments."""
+    if parsed_args.upload is None:
+        return None
+
+    from r11data.utils.sparql_client import graphdb_auth
+    from r11data.utils.upload import GraphStoreSink, runner_graph
 
-    for arg in args:
-        runner = getattr(runners, arg)
-        logger.info(f"Invoking '{arg}' runner.")
+    return GraphStoreSink(
+        parsed_args.upload,
+        graph=runner_graph(name) if parsed_args.named_graphs else None,
+        protocol=parsed_args.upload_protocol,
+        chunk_size=parsed_args.upload_chunk_size,
+        max_workers=parsed_args.upload_workers,
+        clear=parsed_args.named_graphs,
+        auth=graphdb_auth(),
+    )
+
+
+def configure(parsed_args: argparse.Namespace) -> None:
+    """Configure caching, URI minting, tracing, progress and mirrors."""
+    sparql_cache.mode = parsed_args.cache
+    minter.deterministic = parsed_args.deterministic_uris
+    tracer.enabled = parsed_args.trace is not None
+    progress.enabled = sys.stderr.isatty() and not parsed_args.no_progress
+
+    if parsed_args.mirror is not None:
+        from r11data.utils.mirror import MirrorStore, mount_mirror
+
+        mount_mirror(
+            MirrorStore(*parsed_args.mirror),
+            "releven",
+            "releven_2025",
+            "releven_statements",
+        )
+
+
+def run_runner(name: str, parsed_args: argparse.Namespace) -> None:
+    """Invoke a runner and persist its output."""
+    with tracer.span(f"{name} runner"):
+        runner_class = get_runner_class(name)
+        runner = runner_class(**runner_options(name, parsed_args))
+        runner.output_format = parsed_args.output_format
+        runner.delta = parsed_args.delta
+        runner.upload = upload_sink(name, parsed_args)
+        logger.info(f"Invoking '{name}' runner.")
         runner.persist()
+
+
+def report(parsed_args: argparse.Namespace) -> None:
+    """Export the trace and print the throughput summary (if enabled)."""
+    if parsed_args.trace is not None:
+        tracer.export(parsed_args.trace)
+        logger.info(
+            f"Trace written to '{parsed_args.trace}'.\n"
+            + format_summary(tracer.summary())
+        )
+
+    if progress.enabled:
+        from rich.console import Console
+
+        Console(stderr=True).print(progress.summary_table())
+
+
+def run_job(name: str, parsed_args: argparse.Namespace) -> None:
+    """Configure a scheduler job process and run a single runner (see run_jobs)."""
+    configure(parsed_args)
+    try:
+        run_runner(name, parsed_args)
+    finally:
+        report(parsed_args)
+
+
+def job_args(name: str, parsed_args: argparse.Namespace) -> argparse.Namespace:
+    """Get CLI arguments for a runner job, i.e. without live progress and per-runner traces."""
+    args = argparse.Namespace(**vars(parsed_args))
+    args.no_progress = True
+
+    if args.trace is not None:
+        args.trace = args.trace.with_stem(f"{args.trace.stem}-{name}")
+
+    return args
+
+
+def dependencies(parsed_args: argparse.Namespace) -> dict[str, set[str]]:
+    """Get registered runner dependencies merged with --after dependencies."""
+    _dependencies = {name: set(names) for name, names in runner_dependencies.items()}
+    for name, dependency in parsed_args.after:
+        _dependencies.setdefault(name, set()).add(dependency)
+
+    return _dependencies
+
+
+if __name__ == "__main__":
+    parsed_args = parser.parse_args()
+    if parsed_args.starlegs_mode != "construct" and (
+        parsed_args.starlegs_partitions is not None or parsed_args.starlegs_resume
+    ):
+        parser.error(
+            "--starlegs-partitions and --starlegs-resume require --starlegs-mode construct."
+        )
+    if parsed_args.starlegs_resume and parsed_args.starlegs_partitions is None:
+        parser.error("--starlegs-resume requires --starlegs-partitions.")
+
+    args: list[str] = job_order(parsed_args.runner, dependencies(parsed_args))
+
+    if parsed_args.jobs > 1 and len(args) > 1:
+        from r11data.scheduler import format_reports, run_jobs
+
+        reports = run_jobs(
+            {arg: partial(run_job, arg, job_args(arg, parsed_args)) for arg in args},
+            max_jobs=parsed_args.jobs,
+            dependencies=dependencies(parsed_args),
+        )
+        logger.info(format_reports(reports))
+
+        if any(job_report.status != "succeeded" for job_report in reports):
+            sys.exit(1)
+    else:
+        configure(parsed_args)
+        try:
+            with progress.live():
+                for arg in args:
+                    run_runner(arg, parsed_args)
+        finally:
+            report(parsed_args)
@@ -0,0 +1,47 @@
+"""Lazy runner registry for R11Data.
+
+Runners are registered by name as "module:class" references
+and only imported when resolved, so the CLI imports only the runners it invokes.
+
+Runners can declare dependencies on other runners (e.g. if a runner queries
+data another runner uploads); concurrent runs respect them (see r11data.scheduler).
+"""
+
+from collections.abc import Iterable
+import importlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from r11data.abcs import _ABCRunner
+
+
+runner_registry: dict[str, str] = {
+    "deaths": "r11data.tabular.deaths.runner:DeathsRunner",
+    "starlegs": "r11data.starlegs.runner:StarlegsRunner",
+}
+
+runner_dependencies: dict[str, set[str]] = {}
+
+
+def register_runner(name: str, reference: str, depends_on: Iterable[str] = ()) -> None:
+    """Register a runner class under name by a 'module:class' reference.
+
+    depends_on names runners which must succeed before the runner is started.
+    """
+    if ":" not in reference:
+        raise ValueError(f"Runner reference must be 'module:class', got '{reference}'.")
+    runner_registry[name] = reference
+    runner_dependencies[name] = set(depends_on)
+
+
+def get_runner_class(name: str) -> type["_ABCRunner"]:
+    """Import and return the runner class registered under name."""
+    try:
+        reference = runner_registry[name]
+    except KeyError:
+        raise KeyError(f"No runner registered under '{name}'.") from None
+
+    module_name, _, class_name = reference.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
@@ -0,0 +1,189 @@
+"""Concurrent runner scheduling for R11Data.
+
+Jobs run in separate (spawned) processes, so a failing or crashing runner
+does not affect other runners. A job is started once all its dependencies
+have succeeded; jobs with failed or skipped dependencies are skipped.
+
+Every job reports its wall time and peak memory (max. resident set size).
+"""
+
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass
+import graphlib
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+import sys
+import time
+from typing import Literal
+
+from loguru import logger
+
+
+try:
+    import resource
+except ImportError:  # pragma: no cover; not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+_JobStatus = Literal["pending", "running", "succeeded", "failed", "skipped"]
+
+
+@dataclass
+class JobReport:
+    """Outcome of a scheduled job; peak_memory is in bytes."""
+
+    name: str
+    status: _JobStatus = "pending"
+    seconds: float | None = None
+    peak_memory: int | None = None
+    error: str | None = None
+
+
+def peak_memory() -> int | None:
+    """Get the peak resident set size of the current process in bytes (if available)."""
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _run_job(target: Callable[[], object], connection: Connection) -> None:
+    """Run target in a job process and send (peak memory, error) to the scheduler."""
+    error = None
+
+    try:
+        target()
+    except BaseException as e:
+        logger.exception("Job failed.")
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        connection.send((peak_memory(), error))
+        connection.close()
+
+    if error is not None:
+        sys.exit(1)
+
+
+@dataclass
+class _RunningJob:
+    report: JobReport
+    process: BaseProcess
+    connection: Connection
+    started: float
+
+
+def job_order(
+    jobs: Collection[str], dependencies: Mapping[str, Collection[str]]
+) -> list[str]:
+    """Order jobs topologically, ignoring dependencies on jobs not scheduled.
+
+    Raises graphlib.CycleError for circular dependencies.
+    """
+    sorter: graphlib.TopologicalSorter[str] = graphlib.TopologicalSorter()
+    for name in jobs:
+        sorter.add(name, *(d for d in dependencies.get(name, ()) if d in jobs))
+
+    return list(sorter.static_order())
+
+
+def run_jobs(
+    jobs: Mapping[str, Callable[[], object]],
+    *,
+    max_jobs: int = 1,
+    dependencies: Mapping[str, Collection[str]] | None = None,
+) -> list[JobReport]:
+    """Run jobs in up to max_jobs concurrent processes and report their outcomes.
+
+    Job callables must be picklable (e.g. module-level functions or partials thereof).
+    Dependencies map job names to names of jobs which must succeed first;
+    dependencies on jobs not given are ignored.
+    """
+    dependencies = dependencies or {}
+    context = multiprocessing.get_context("spawn")
+
+    reports = {name: JobReport(name) for name in jobs}
+    pending = job_order(jobs, dependencies)
+    running: dict[int, _RunningJob] = {}
+
+    def _start(name: str) -> None:
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_run_job, args=(jobs[name], sender), name=f"r11data-{name}"
+        )
+
+        logger.info(f"Starting job '{name}'.")
+        process.start()
+        sender.close()
+
+        reports[name].status = "running"
+        running[process.sentinel] = _RunningJob(
+            reports[name], process, receiver, time.perf_counter()
+        )
+
+    def _finish(job: _RunningJob) -> None:
+        job.process.join()
+        report = job.report
+        report.seconds = time.perf_counter() - job.started
+
+        try:
+            report.peak_memory, report.error = job.connection.recv()
+        except EOFError:
+            report.error = f"Process exited with code {job.process.exitcode}."
+        job.connection.close()
+
+        report.status = "succeeded" if job.process.exitcode == 0 else "failed"
+        log = logger.info if report.status == "succeeded" else logger.error
+        log(f"Job '{report.name}' {report.status} after {report.seconds:.1f}s.")
+
+    try:
+        while pending or running:
+            for name in list(pending):
+                _dependencies = [d for d in dependencies.get(name, ()) if d in jobs]
+
+                if failed := [
+                    d
+                    for d in _dependencies
+                    if reports[d].status in ("failed", "skipped")
+                ]:
+                    pending.remove(name)
+                    reports[name].status = "skipped"
+                    reports[name].error = f"Dependencies failed: {', '.join(failed)}"
+                    logger.warning(f"Skipping job '{name}'. {reports[name].error}")
+                elif len(running) < max_jobs and all(
+                    reports[d].status == "succeeded" for d in _dependencies
+                ):
+                    pending.remove(name)
+                    _start(name)
+
+            if running:
+                for sentinel in wait(list(running)):
+                    _finish(running.pop(sentinel))  # type: ignore[arg-type]
+    finally:
+        for job in running.values():
+            job.process.terminate()
+            job.process.join()
+            job.report.status = "failed"
+            job.report.error = "Terminated."
+
+    return list(reports.values())
+
+
+def format_reports(reports: Collection[JobReport]) -> str:
+    """Format job reports as a plain-text report."""
+    lines = ["Job report:"]
+    for report in reports:
+        seconds = "-" if report.seconds is None else f"{report.seconds:.1f}s"
+        memory = (
+            "-"
+            if report.peak_memory is None
+            else f"{report.peak_memory / 1024**2:.0f} MiB"
+        )
+        line = f"    {report.name}: {report.status}, {seconds} wall time, {memory} peak"
+        if report.error is not None:
+            line += f" ({report.error})"
+        lines.append(line)
+
+    return "\n".join(lines)
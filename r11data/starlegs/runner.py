@@ -1,57 +1,409 @@
 """Runner for R11data starlegs generation."""
 
-from collections.abc import Iterable
-from itertools import chain
-from typing import Iterator
+import asyncio
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import chain, islice
+from pathlib import Path
+from typing import Iterator, Literal, cast
 
-from SPARQLWrapper import SPARQLWrapper
-from r11data import settings
+from loguru import logger
 from r11data.abcs import _ABCRunner
 from r11data.starlegs.utils._types import StarlegsQuery
-from r11data.starlegs.utils.sparql_templates import p140_queries, p141_queries
+from r11data.starlegs.utils.checkpoint import PartitionCheckpoint
+from r11data.starlegs.utils.sparql_templates import (
+    count_queries,
+    insert_queries,
+    p140_queries,
+    p141_queries,
+    partition_queries,
+)
 from r11data.starlegs.utils.starlegs_logging import (
+    _starlegs_count_new_assertions,
+    starlegs_final_count_log,
     starlegs_final_graph_log,
     starlegs_subgraph_log,
+    starlegs_update_log,
 )
-from r11data.utils.paths import output_starlegs
-from rdflib import Graph
+from r11data.utils.endpoints import endpoints
+from r11data.utils.paths import cache, output_starlegs
+from r11data.utils.progress import progress
+from r11data.utils.sparql_client import graphdb_auth, sparql_client
+from r11data.utils.sparql_results import iter_bindings
+from r11data.utils.tracing import tracer
+from r11data.utils.upload import runner_graph
+from rdflib import RDF, RDFS, XSD, Graph, Namespace
 
 
-def starlegs(queries: Iterable[StarlegsQuery]) -> Graph:
-    """Run starlegs construct queries and accumulate results into a Graph instance."""
-    _graph = Graph()
+_StarlegsMode = Literal["construct", "count", "insert"]
+
 
-    sparql = SPARQLWrapper("https://graphdb.r11.eu/repositories/RELEVEN")
-    sparql.setCredentials(user=settings.GRAPHDB_USER, passwd=settings.PASSWD)
+def generate_starlegs_graphs(queries: Iterable[StarlegsQuery]) -> Iterator[Graph]:
+    """Run starlegs construct queries and yield (and log) the result graphs."""
+    endpoint = endpoints["releven"]
 
     for query in queries:
         _query: StarlegsQuery = query
         _target_class: str | None = query.metadata.get("target_class", None)
 
-        sparql.setQuery(str(_query))
-        result_graph = sparql.queryAndConvert()
+        result_data = sparql_client.query(
+            endpoint, str(_query), accept="text/turtle", auth=graphdb_auth
+        )
+        with tracer.span("parse construct result", target_class=_target_class):
+            result_graph = Graph().parse(data=result_data, format="turtle")
 
         starlegs_subgraph_log(subgraph=result_graph, target_class=_target_class)
-        _graph += result_graph
+        yield result_graph
+
+
+def starlegs(queries: Iterable[StarlegsQuery]) -> Graph:
+    """Run starlegs construct queries and accumulate results into a Graph instance."""
+    _graph = Graph()
+
+    for result_graph in generate_starlegs_graphs(queries):
+        with tracer.span("merge result graph"):
+            _graph += result_graph
+
+    starlegs_final_graph_log(_graph)
+    return _graph
+
+
+async def _starlegs_construct(
+    semaphore: asyncio.Semaphore, endpoint: str, query: StarlegsQuery
+) -> tuple[StarlegsQuery, Graph]:
+    """Run a single starlegs construct query and parse the result into a Graph."""
+    async with semaphore:
+        result_data = await sparql_client.aquery(
+            endpoint, str(query), accept="text/turtle", auth=graphdb_auth
+        )
+
+    with tracer.span(
+        "parse construct result", target_class=query.metadata.get("target_class")
+    ):
+        return query, Graph().parse(data=result_data, format="turtle")
+
+
+async def agenerate_starlegs_graphs(
+    queries: Iterable[StarlegsQuery],
+    max_concurrency: int = 4,
+) -> AsyncIterator[Graph]:
+    """Run starlegs construct queries concurrently and yield (and log) the result graphs.
+
+    At most max_concurrency queries are in flight at once;
+    result graphs are yielded in order of arrival.
+    """
+    endpoint = endpoints["releven"]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    tasks = [_starlegs_construct(semaphore, endpoint, query) for query in queries]
+
+    try:
+        for task in asyncio.as_completed(tasks):
+            query, result_graph = await task
+            _target_class: str | None = query.metadata.get("target_class", None)
+
+            starlegs_subgraph_log(subgraph=result_graph, target_class=_target_class)
+            yield result_graph
+    finally:
+        # the async connection pool is bound to the running event loop
+        await sparql_client.aclose()
+
+
+async def starlegs_async(
+    queries: Iterable[StarlegsQuery],
+    max_concurrency: int = 4,
+) -> Graph:
+    """Run starlegs construct queries concurrently and accumulate results into a Graph.
+
+    See agenerate_starlegs_graphs.
+    """
+    _graph = Graph()
+
+    async for result_graph in agenerate_starlegs_graphs(queries, max_concurrency):
+        with tracer.span("merge result graph"):
+            _graph += result_graph
 
     starlegs_final_graph_log(_graph)
     return _graph
 
 
+def _partition_label(query: StarlegsQuery) -> str | None:
+    target_class = query.metadata.get("target_class")
+    if "partition" not in query.metadata:
+        return target_class
+
+    partition, partitions = query.metadata["partition"], query.metadata["partitions"]
+    return f"{target_class} (partition {partition + 1}/{partitions})"
+
+
+def _construct_partition(
+    endpoint: str, query: StarlegsQuery, checkpoint: PartitionCheckpoint
+) -> Graph:
+    """Run a starlegs partition query and record the result graph in checkpoint."""
+    result_data = sparql_client.query(
+        endpoint, str(query), accept="text/turtle", auth=graphdb_auth
+    )
+    with tracer.span("parse construct result", target_class=_partition_label(query)):
+        result_graph = Graph().parse(data=result_data, format="turtle")
+
+    checkpoint.set(endpoint, str(query), result_graph)
+    return result_graph
+
+
+def generate_partitioned_starlegs_graphs(
+    queries: Iterable[StarlegsQuery],
+    checkpoint: PartitionCheckpoint,
+    max_workers: int = 1,
+) -> Iterator[Graph]:
+    """Run starlegs partition queries and yield (and log) the result graphs.
+
+    Partitions recorded in checkpoint are read back instead of being queried;
+    up to max_workers partitions are queried concurrently and result graphs
+    are yielded in order of completion.
+    A failing partition does not abort the run: remaining partitions are still
+    run and recorded, a RuntimeError naming the failed partitions is raised at the end.
+    """
+    endpoint = endpoints["releven"]
+    pending: list[StarlegsQuery] = []
+    failed: list[str | None] = []
+
+    for query in queries:
+        if (result_graph := checkpoint.get(endpoint, str(query))) is None:
+            pending.append(query)
+            continue
+
+        starlegs_subgraph_log(
+            subgraph=result_graph, target_class=_partition_label(query)
+        )
+        yield result_graph
+
+    if len(checkpoint):
+        logger.info(
+            f"Resuming starlegs run from checkpoint, {len(pending)} partitions pending."
+        )
+
+    queued = iter(pending)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = {
+            executor.submit(_construct_partition, endpoint, query, checkpoint): query
+            for query in islice(queued, max_workers)
+        }
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                query = in_flight.pop(future)
+                if (next_query := next(queued, None)) is not None:
+                    future_query = executor.submit(
+                        _construct_partition, endpoint, next_query, checkpoint
+                    )
+                    in_flight[future_query] = next_query
+
+                try:
+                    result_graph = future.result()
+                except Exception as e:
+                    failed.append(_partition_label(query))
+                    logger.error(
+                        f"Starlegs partition {_partition_label(query)} failed: {e!r}"
+                    )
+                    continue
+
+                starlegs_subgraph_log(
+                    subgraph=result_graph, target_class=_partition_label(query)
+                )
+                yield result_graph
+
+    if failed:
+        raise RuntimeError(
+            f"{len(failed)} starlegs partitions failed: {', '.join(map(str, failed))}. "
+            "Completed partitions are checkpointed, rerun with resume to continue."
+        )
+
+
+def _iterate_async(async_iterator: AsyncIterator[Graph]) -> Iterator[Graph]:
+    """Consume an async iterator in a private event loop from synchronous code."""
+    loop = asyncio.new_event_loop()
+
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(async_iterator.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def starlegs_server_side(graph: str, dry_run: bool = False) -> Counter[str]:
+    """Run starlegs queries as SPARQL updates inserting into graph on the store.
+
+    Constructed triples never leave the store: per query, the triples
+    which would be inserted are counted (per predicate) first;
+    unless dry_run, graph is cleared beforehand and the insert update is executed.
+    Since queries exclude existing assertions, dry runs count triples
+    generated by several queries for each query.
+    """
+    query_endpoint = endpoints["releven"]
+    update_endpoint = endpoints["releven_statements"]
+
+    if not dry_run:
+        sparql_client.update(
+            update_endpoint, f"CLEAR SILENT GRAPH <{graph}>", auth=graphdb_auth
+        )
+
+    queries = list(zip(count_queries(), insert_queries(graph)))
+    count_mapping: Counter[str] = Counter()
+
+    with progress.task(
+        "starlegs counts" if dry_run else "starlegs updates", len(queries)
+    ):
+        for count_query, insert_query in queries:
+            result_data = sparql_client.query(
+                query_endpoint, str(count_query), auth=graphdb_auth, cached=False
+            )
+            counts: Counter[str] = Counter(
+                {
+                    binding["p"].rpartition("/")[-1]: int(binding["count"])
+                    for binding in iter_bindings([result_data])
+                    # empty results can yield a single (unbound) group
+                    if "p" in binding
+                }
+            )
+
+            if not dry_run and counts.total():
+                sparql_client.update(
+                    update_endpoint, str(insert_query), auth=graphdb_auth
+                )
+
+            starlegs_update_log(
+                counts, count_query.metadata.get("target_class"), dry_run=dry_run
+            )
+            count_mapping.update(counts)
+            progress.advance(triples=counts.total())
+
+    starlegs_final_count_log(count_mapping=count_mapping, total=count_mapping.total())
+    return count_mapping
+
+
 class StarlegsRunner(_ABCRunner):
-    """Runner for Starleg assertions."""
+    """Runner for Starleg assertions.
+
+    In the default "construct" mode, construct results are downloaded
+    and persisted locally. In "insert" mode, the queries are run server-side
+    as SPARQL updates inserting into graph (see starlegs_server_side),
+    "count" is the dry run of "insert"; neither writes local output.
+
+    If partitions is given, construct queries are split into partitions
+    (see partition_queries) which are run and checkpointed independently
+    (see generate_partitioned_starlegs_graphs); if resume is True,
+    partitions completed by a failed previous run are not run again.
+    """
 
     queries: Iterator[StarlegsQuery] = chain(p140_queries, p141_queries)
+    namespaces = {
+        "rdf": RDF,
+        "rdfs": RDFS,
+        "xsd": XSD,
+        "crm": Namespace("http://www.cidoc-crm.org/cidoc-crm/"),
+    }
+
+    checkpoint_dir = cast(Path, cache) / "starlegs" / "partitions"
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        mode: _StarlegsMode = "construct",
+        graph: str = runner_graph("starlegs"),
+        partitions: int | None = None,
+        resume: bool = False,
+    ) -> None:
+        """Initialize a StarlegsRunner.
+
+        If max_concurrency is given, queries are run concurrently (see starlegs_async).
+        Partitions (and resume) are only supported in "construct" mode.
+        """
+        if mode != "construct" and (partitions is not None or resume):
+            raise ValueError(
+                f"Starlegs partitions and resume require 'construct' mode, got '{mode}'."
+            )
+        if resume and partitions is None:
+            raise ValueError("Resuming a starlegs run requires partitions.")
+
+        self.max_concurrency = max_concurrency
+        self.mode = mode
+        self.graph = graph
+        self.partitions = partitions
+        self.resume = resume
 
     def persist(self) -> None:
-        """Run the conversion and persist the result in r11data/output."""
-        graph = self.run()
-        output_file = output_starlegs / "starlegs.ttl"
+        """Run the conversion and persist the result in r11data/output.
 
-        with open(output_file, "w") as f:  # type: ignore
-            f.write(graph.serialize())
+        In "count" and "insert" mode, the result is persisted in the store instead.
+        """
+        if self.mode != "construct":
+            starlegs_server_side(self.graph, dry_run=self.mode == "count")
+            return
+
+        output_file = cast(Path, output_starlegs / "starlegs.ttl")
+        self.persist_stream(output_file)
 
     def run(self) -> Graph:
         """Run the deaths table to RDF conversion."""
-        graph = starlegs(self.queries)
+        if self.partitions is not None:
+            graph = Graph()
+            for result_graph in self.generate_graphs():
+                graph += result_graph
+            return graph
+
+        if self.max_concurrency is None:
+            return starlegs(self.queries)
+
+        graph = asyncio.run(
+            starlegs_async(self.queries, max_concurrency=self.max_concurrency)
+        )
         return graph
+
+    def generate_graphs(self) -> Iterator[Graph]:
+        """Generate starlegs result graphs per query and log a final report."""
+        queries = list(self.queries)
+        checkpoint: PartitionCheckpoint | None = None
+
+        if self.partitions is not None:
+            checkpoint = PartitionCheckpoint(self.checkpoint_dir)
+            queries = [
+                partition_query
+                for query in queries
+                for partition_query in partition_queries(query, self.partitions)
+            ]
+            if not self.resume:
+                checkpoint.clear()
+
+            graphs = generate_partitioned_starlegs_graphs(
+                queries, checkpoint, max_workers=self.max_concurrency or 1
+            )
+        elif self.max_concurrency is None:
+            graphs = generate_starlegs_graphs(queries)
+        else:
+            graphs = _iterate_async(
+                agenerate_starlegs_graphs(queries, self.max_concurrency)
+            )
+
+        count_mapping: Counter[str] = Counter()
+        seen: set[int] = set()
+
+        with progress.task("starlegs queries", total=len(queries)):
+            for graph in graphs:
+                count_mapping.update(_starlegs_count_new_assertions(graph, seen))
+                progress.advance(triples=len(graph))
+                yield graph
+
+        starlegs_final_count_log(
+            count_mapping=count_mapping, total=count_mapping.total()
+        )
+        if checkpoint is not None:
+            # the partitioned run is complete, i.e. there is nothing to resume
+            checkpoint.clear()
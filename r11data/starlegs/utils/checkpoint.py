@@ -0,0 +1,45 @@
+"""Checkpoints for resuming partitioned starlegs runs."""
+
+from pathlib import Path
+import shutil
+
+from r11data.utils.sparql_cache import cache_key
+from rdflib import Graph
+
+
+class PartitionCheckpoint:
+    """On-disk record of completed starlegs partitions.
+
+    Results of completed partitions are stored as N-Triples files in directory,
+    keyed by endpoint and (normalized) partition query. A failed run can be resumed:
+    completed partitions are read back instead of being queried again.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def _path(self, endpoint: str, query: str) -> Path:
+        return self.directory / f"{cache_key(endpoint, query)[:32]}.nt"
+
+    def get(self, endpoint: str, query: str) -> Graph | None:
+        """Get the result graph of a completed partition (if recorded)."""
+        path = self._path(endpoint, query)
+        if not path.exists():
+            return None
+        return Graph().parse(path, format="nt")
+
+    def set(self, endpoint: str, query: str, graph: Graph) -> None:
+        """Record the result graph of a completed partition."""
+        path = self._path(endpoint, query)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_file = path.with_suffix(".tmp")
+        graph.serialize(temp_file, format="nt", encoding="utf-8")
+        temp_file.replace(path)
+
+    def __len__(self) -> int:
+        return len(list(self.directory.glob("*.nt"))) if self.directory.exists() else 0
+
+    def clear(self) -> None:
+        """Remove all recorded partitions."""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -6,17 +6,19 @@ from string import Template
 from r11data.starlegs.utils._types import StarlegsQuery
 
 
-_base_sparql_template: str = """
+_prefixes: str = """
 PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
 PREFIX crm: <http://www.cidoc-crm.org/cidoc-crm/>
 PREFIX star: <https://r11.eu/ns/star/>
 PREFIX sdhss: <https://r11.eu/ns/prosopography/>
+"""
 
-construct {
+_construct_pattern: str = """
     ?o crm:P14_carried_out_by ?agent .
     ?o crm:P17_was_motivated_by ?source .
-}
-where {
+"""
+
+_where_pattern: str = """
     ?e13_initial a star:$target_class ;
     	$common_connector ?common .
 
@@ -28,9 +30,31 @@ where {
 
     minus {?o crm:P14_carried_out_by ?agent}
     minus {?o crm:P17_was_motivated_by ?source}
-}
 """
 
+_base_sparql_template: str = (
+    f"{_prefixes}\nconstruct {{{_construct_pattern}}}\nwhere {{{_where_pattern}}}\n"
+)
+
+# server-side variant of the construct query, inserting into graph $graph
+_insert_sparql_template: str = (
+    f"{_prefixes}\ninsert {{\n    graph <$graph> {{{_construct_pattern}    }}\n}}\n"
+    f"where {{{_where_pattern}}}\n"
+)
+
+# number of distinct triples the construct query generates per predicate
+_count_sparql_template: str = f"""{_prefixes}
+select ?p (count(*) as ?count)
+where {{
+    select distinct ?o ?p ?value
+    where {{{_where_pattern}
+        values ?p {{crm:P14_carried_out_by crm:P17_was_motivated_by}}
+        bind(if(?p = crm:P14_carried_out_by, ?agent, ?source) as ?value)
+        filter (bound(?value))
+    }}
+}}
+group by ?p
+"""
 
 _p140_sparql_template: str = Template(_base_sparql_template).safe_substitute(
     common_connector="crm:P140_assigned_attribute_to"
@@ -43,17 +67,75 @@ _p140_template: Template = Template(_p140_sparql_template)
 _p141_template: Template = Template(_p141_sparql_template)
 
 
+_p140_target_classes: list[str] = [
+    "E13_sdhss_P13",
+    "E13_sdhss_P26",
+    "E13_sdhss_P36",
+    "E13_crm_P41",
+]
+_p141_target_classes: list[str] = ["E13_sdhss_P38"]
+
+
 p140_queries: Iterator[StarlegsQuery] = map(
     lambda x: StarlegsQuery(_p140_template.substitute(target_class=x), target_class=x),
-    [
-        "E13_sdhss_P13",
-        "E13_sdhss_P26",
-        "E13_sdhss_P36",
-        "E13_crm_P41",
-    ],
+    _p140_target_classes,
 )
 
 p141_queries: Iterator[StarlegsQuery] = map(
     lambda x: StarlegsQuery(_p141_template.substitute(target_class=x), target_class=x),
-    ["E13_sdhss_P38"],
+    _p141_target_classes,
 )
+
+
+def _starlegs_queries(template: str, **substitutions: str) -> Iterator[StarlegsQuery]:
+    """Instantiate a starlegs query template for all P140 and P141 target classes."""
+    for common_connector, target_classes in (
+        ("crm:P140_assigned_attribute_to", _p140_target_classes),
+        ("crm:P141_assigned", _p141_target_classes),
+    ):
+        _template = Template(
+            Template(template).safe_substitute(common_connector=common_connector)
+        )
+        for target_class in target_classes:
+            yield StarlegsQuery(
+                _template.substitute(target_class=target_class, **substitutions),
+                target_class=target_class,
+            )
+
+
+def insert_queries(graph: str) -> Iterator[StarlegsQuery]:
+    """Get SPARQL Update counterparts of the starlegs construct queries.
+
+    Updates insert the constructed triples into the named graph.
+    """
+    return _starlegs_queries(_insert_sparql_template, graph=graph)
+
+
+def count_queries() -> Iterator[StarlegsQuery]:
+    """Get queries counting the triples of the starlegs construct queries per predicate."""
+    return _starlegs_queries(_count_sparql_template)
+
+
+def partition_queries(
+    query: StarlegsQuery, partitions: int, variable: str = "o"
+) -> Iterator[StarlegsQuery]:
+    """Split a starlegs construct query into partitions by subject-hash buckets.
+
+    Partition i only matches subjects (?o) whose MD5 hash falls into bucket i
+    (by the first two hex digits), so partitions are disjoint, stable between runs
+    and together yield the result of query. The filter is appended to the
+    (outermost) where clause, i.e. query must end with it.
+    """
+    if not 1 <= partitions <= 256:
+        raise ValueError(f"partitions must be between 1 and 256, got {partitions}.")
+
+    head, _, _ = str(query).rstrip().rpartition("}")
+
+    for partition in range(partitions):
+        buckets = ", ".join(f'"{b:02x}"' for b in range(partition, 256, partitions))
+        yield StarlegsQuery(
+            f"{head}\n    filter (substr(md5(str(?{variable})), 1, 2) in ({buckets}))\n}}\n",
+            **query.metadata,
+            partition=partition,
+            partitions=partitions,
+        )
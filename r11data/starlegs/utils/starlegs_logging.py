@@ -7,7 +7,7 @@ from loguru import logger
 from r11data.utils.paths import logs
 from rdflib import Graph
 
-logger.add(sink=logs / "starlegs.log")
+logger.add(sink=logs / "starlegs.log", delay=True)
 
 
 def _starlegs_count_assertions(graph: Graph) -> dict[str, int]:
@@ -15,6 +15,23 @@ def _starlegs_count_assertions(graph: Graph) -> dict[str, int]:
     return c
 
 
+def _starlegs_count_new_assertions(graph: Graph, seen: set[int]) -> dict[str, int]:
+    """Count the assertions of graph not in seen and add them to seen.
+
+    Different construct queries can return the same triples; like a merged graph,
+    accumulated counts thus only count distinct triples (tracked by hash).
+    """
+    c: Counter[str] = Counter()
+
+    for triple in graph:
+        key = hash(triple)
+        if key not in seen:
+            seen.add(key)
+            c[triple[1].rpartition("/")[-1]] += 1
+
+    return c
+
+
 def _starlegs_create_count_log(count_mapping: dict[str, int], indent: int = 4) -> str:
     output = io.StringIO()
 
@@ -37,12 +54,34 @@ def starlegs_subgraph_log(subgraph: Graph, target_class: str | None):
     logger.info(_log_message)
 
 
+def starlegs_update_log(
+    count_mapping: dict[str, int], target_class: str | None, dry_run: bool
+):
+    """Logger for intermediary server-side starlegs results (see starlegs_server_side)."""
+    total = sum(count_mapping.values())
+
+    _log_message = (
+        f"Running starlegs {'count' if dry_run else 'update'}{'.' if target_class is None else f' for {target_class} instances.'}\n"
+        f"{'Counted' if dry_run else 'Inserted'} {total} assertions{':' if total else '.'}\n"
+        f"{_starlegs_create_count_log(count_mapping=count_mapping)}"
+    )
+
+    logger.info(_log_message)
+
+
 def starlegs_final_graph_log(graph: Graph):
     """Logger for final report on starlegs construction."""
     count_mapping = _starlegs_count_assertions(graph)
+    starlegs_final_count_log(count_mapping=count_mapping, total=len(graph))
+
+
+def starlegs_final_count_log(count_mapping: dict[str, int], total: int):
+    """Logger for final report on starlegs construction from accumulated counts.
 
+    Used for streamed starlegs runs where no final graph is available.
+    """
     _log_message = (
-        f"Starlegs run finished generating {len(graph)} assertions:\n"
+        f"Starlegs run finished generating {total} assertions:\n"
         f"{_starlegs_create_count_log(count_mapping=count_mapping)}"
     )
 
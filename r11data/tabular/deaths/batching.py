@@ -0,0 +1,67 @@
+"""Batched URI resolution for deaths RowGraphConverters."""
+
+from collections.abc import Callable, Generator
+
+import pandas as pd
+from r11data.tabular.deaths.concurrency import ordered_map
+from r11data.tabular.deaths.rules import query_key
+from r11data.tabular.deaths.utils.utils import get_uris_from_service_batched
+from rdflib import Graph
+from tabulardf import RowGraphConverter
+
+
+class BatchedRowGraphConverter(RowGraphConverter):
+    """RowGraphConverter which resolves row URIs in blocks.
+
+    Instead of sending one SPARQL query per row, the (pbw_desc, name, code) keys
+    of batch_size rows are resolved in a single VALUES-driven query;
+    the results are then passed to row_rule as 'query_results'.
+
+    If max_workers is given, up to max_workers blocks are processed concurrently;
+    row graphs are still generated in deterministic row order.
+    """
+
+    def __init__(
+        self,
+        dataframe: pd.DataFrame,
+        *,
+        row_rule: Callable[..., Graph],
+        query_template: str,
+        batch_size: int = 100,
+        max_workers: int | None = None,
+        graph: Graph | None = None,
+    ) -> None:
+        """Initialize a BatchedRowGraphConverter instance."""
+        super().__init__(dataframe=dataframe, row_rule=row_rule, graph=graph)
+        self.query_template = query_template
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+
+    def _block_graphs(self, start: int) -> list[Graph]:
+        """Resolve the URIs of the block starting at row start and convert its rows."""
+        block = self._df.iloc[start : start + self.batch_size]
+        rows = [row.to_dict() for _, row in block.iterrows()]
+
+        query_results = get_uris_from_service_batched(
+            self.query_template, map(query_key, rows)
+        )
+
+        return [
+            self._row_rule(row_dict, query_results=query_results) for row_dict in rows
+        ]
+
+    def _generate_graphs(self) -> Generator[Graph, None, None]:
+        """Construct a generator of subgraphs for merging.
+
+        Rows are processed in blocks of batch_size;
+        every block issues exactly one SPARQL query.
+        """
+        starts = range(0, len(self._df), self.batch_size)
+        blocks = (
+            map(self._block_graphs, starts)
+            if self.max_workers is None
+            else ordered_map(self._block_graphs, starts, self.max_workers)
+        )
+
+        for graphs in blocks:
+            yield from graphs
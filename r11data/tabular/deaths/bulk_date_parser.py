@@ -0,0 +1,256 @@
+"""Vectorized bulk parsing of R11 date entries.
+
+parse_dates processes a whole pandas.Series of raw date strings at once,
+with the same semantics as R11DateParser:
+components are extracted with the R11DateParser regexes using vectorized string operations
+and R11DateEntry validation is replicated column-wise on NumPy arrays.
+
+Rows that fail validation (or are not representable, e.g. non-string values)
+are only marked in an error mask; R11DateParser remains the authority for those
+and e.g. generates the error messages.
+"""
+
+from collections.abc import Hashable
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+from r11data.tabular.deaths.calendars import jd_converters
+from r11data.tabular.deaths.date_parser import R11DateEntry
+
+
+# cf. R11DateParser._split_date_part (re.match semantics, hence the anchor)
+_date_part_pattern = r"^(\w+)?(?:/|-(\w+))?"
+_known_limit_pattern = r"\[(\w+)\]$"
+
+# restrict integers to plain ASCII digits and int64-safe magnitudes
+_int_pattern = r"[0-9]{1,9}"
+
+_calendars = R11DateEntry._calendars
+_known_limit_values = R11DateEntry._known_limit_values
+_month_index_mapping = R11DateEntry._month_index_mapping
+
+# month lengths indexed by month (index 0 is padding, index 13 for Armenian epagomenal days)
+_month_lengths = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31, 0])
+
+
+class ParsedDate(NamedTuple):
+    """Julian day duration and known limit of a successfully parsed date entry."""
+
+    jd_begin: int
+    jd_end: int
+    known_limit: str | None
+
+
+class BulkDates(NamedTuple):
+    """Column-wise results of bulk date parsing.
+
+    All arrays are aligned with the input series;
+    values of rows flagged in the error mask are meaningless.
+    """
+
+    jd_begin: np.ndarray
+    jd_end: np.ndarray
+    known_limit: np.ndarray
+    error: np.ndarray
+
+
+def _gregorian_month_length(years: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """Vectorized calendar._monthlen."""
+    leap = ((years % 4 == 0) & (years % 100 != 0)) | (years % 400 == 0)
+    return _month_lengths[months] + ((months == 2) & leap)
+
+
+def _julian_month_length(years: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """Vectorized convertdate.julian.month_length."""
+    return _month_lengths[months] + ((months == 2) & (years % 4 == 0))
+
+
+def _armenian_month_length(months: np.ndarray) -> np.ndarray:
+    """Month lengths of the (moveable) Armenian calendar."""
+    return np.where(months == 13, 5, 30)
+
+
+def _to_jd(
+    calendars: np.ndarray, years: np.ndarray, months: np.ndarray, days: np.ndarray
+) -> np.ndarray:
+    """Vectorized R11DateParser._jd_converters (incl. int truncation)."""
+    jd = np.select(
+        [calendars == name for name in jd_converters],
+        [converter(years, months, days) for converter in jd_converters.values()],
+    )
+    return np.trunc(jd).astype(np.int64)
+
+
+def _split_date_part(parts: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Vectorized R11DateParser._split_date_part."""
+    extracted = parts.str.extract(_date_part_pattern)
+    return extracted[0], extracted[1]
+
+
+def _to_ints(values: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert string components to (ints, present mask, invalid mask)."""
+    present = values.notna().to_numpy()
+    valid = values.str.fullmatch(_int_pattern, na=False).to_numpy(dtype=bool)
+    ints = pd.to_numeric(values.where(valid), errors="coerce").fillna(0)
+
+    return ints.to_numpy(dtype=np.int64), present, present & ~valid
+
+
+def _to_months(values: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert month names to (month indices, present mask, invalid mask)."""
+    present = values.notna().to_numpy()
+    indices = values.map(_month_index_mapping)
+    valid = indices.notna().to_numpy()
+
+    return indices.fillna(0).to_numpy(dtype=np.int64), present, present & ~valid
+
+
+def parse_dates(dates: pd.Series) -> BulkDates:
+    """Parse a series of raw R11 date strings.
+
+    Returns Julian day durations and known limits for every row
+    together with an error mask; output for valid rows is identical to R11DateParser.
+    """
+    dates = dates.reset_index(drop=True)
+    is_str = dates.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+    strings = dates.where(is_str).astype(object)
+
+    # object dtype, since components absent in all rows would be float NaN columns
+    parts = strings.str.split(" ", expand=True).reindex(columns=range(4)).astype(object)
+
+    calendars = parts[0].fillna("").to_numpy(dtype=object)
+    year_begin, year_end = map(_to_ints, _split_date_part(parts[1]))
+    month_begin, month_end = map(_to_months, _split_date_part(parts[2]))
+    day_begin, day_end = map(_to_ints, _split_date_part(parts[3]))
+
+    known_limits = strings.str.extract(_known_limit_pattern)[0]
+    known_limit_present = known_limits.notna().to_numpy()
+
+    yb, yb_present, yb_invalid = year_begin
+    ye, ye_present, ye_invalid = year_end
+    mb, mb_present, mb_invalid = month_begin
+    me, me_present, me_invalid = month_end
+    db, db_present, db_invalid = day_begin
+    de, de_present, de_invalid = day_end
+
+    is_armenian = calendars == "A"
+
+    # -- field validation (cf. R11DateEntry validators) --
+    error = (
+        ~is_str
+        | ~np.isin(calendars, _calendars)
+        | ~yb_present
+        | yb_invalid
+        | ye_invalid
+        | mb_invalid
+        | me_invalid
+        | db_invalid
+        | de_invalid
+        | (known_limit_present & ~known_limits.isin(_known_limit_values).to_numpy())
+    )
+
+    error |= ye_present & (ye < yb)
+
+    # R11DateEntry requires month_begin for month_end/day comparisons
+    error |= (me_present | db_present | de_present) & ~mb_present
+    error |= me_present & ~ye_present & (me < mb)
+
+    mb_checked = np.where(mb_present, mb, 1)
+    begin_month_length = _gregorian_month_length(yb, mb_checked)
+    error |= (db_present & (db > begin_month_length)) | (
+        de_present & (de > begin_month_length)
+    )
+
+    # -- value completion (cf. R11DateEntry._complete_values) --
+    year_end_final = np.where(ye_present & (ye != 0), ye, yb)
+    month_end_final = np.where(
+        me_present, me, np.where(mb_present, mb, np.where(is_armenian, 13, 12))
+    )
+    day_end_default = np.where(
+        month_end_final == 13,
+        5,
+        np.where(
+            is_armenian,
+            30,
+            _gregorian_month_length(year_end_final, np.clip(month_end_final, 1, 12)),
+        ),
+    )
+    day_end_final = np.where(
+        de_present & (de != 0),
+        de,
+        np.where(db_present & (db != 0), db, day_end_default),
+    )
+    month_begin_final = mb_checked
+    day_begin_final = np.where(db_present & (db != 0), db, 1)
+
+    # lexicographic begin > end check
+    error |= (yb > year_end_final) | (
+        (yb == year_end_final)
+        & (
+            (month_begin_final > month_end_final)
+            | (
+                (month_begin_final == month_end_final)
+                & (day_begin_final > day_end_final)
+            )
+        )
+    )
+
+    # -- calendar validity (cf. convertdate legal_date/_valid_date) --
+    error |= np.where(
+        is_armenian,
+        (yb < 1)
+        | (day_begin_final > _armenian_month_length(month_begin_final))
+        | (day_end_final > _armenian_month_length(month_end_final)),
+        (day_begin_final > _julian_month_length(yb, month_begin_final))
+        | (
+            day_end_final
+            > _julian_month_length(year_end_final, np.clip(month_end_final, 1, 12))
+        ),
+    )
+
+    jd_begin = _to_jd(calendars, yb, month_begin_final, day_begin_final)
+    jd_end = _to_jd(calendars, year_end_final, month_end_final, day_end_final)
+
+    known_limit = known_limits.astype(object).where(known_limit_present, None)
+
+    return BulkDates(
+        jd_begin=np.where(error, 0, jd_begin),
+        jd_end=np.where(error, 0, jd_end),
+        known_limit=known_limit.to_numpy(dtype=object),
+        error=error,
+    )
+
+
+class DateLookup:
+    """Lookup of bulk-parsed date entries by raw date value.
+
+    Only successfully parsed values are stored;
+    for unknown or invalid values get returns None.
+    """
+
+    def __init__(self) -> None:
+        self._dates: dict[Hashable, ParsedDate] = {}
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def update(self, dates: pd.Series) -> None:
+        """Bulk parse the unique values of dates and store the valid results."""
+        unique_dates = pd.Series(dates.unique(), dtype=object)
+        bulk_dates = parse_dates(unique_dates)
+
+        for date_value, jd_begin, jd_end, known_limit, error in zip(
+            unique_dates, *bulk_dates
+        ):
+            if not error:
+                self._dates[date_value] = ParsedDate(
+                    int(jd_begin), int(jd_end), known_limit
+                )
+
+    def get(self, date_value: Hashable) -> ParsedDate | None:
+        """Get the ParsedDate for a raw date value if available."""
+        return self._dates.get(date_value)
+
+
+date_lookup = DateLookup()
@@ -0,0 +1,155 @@
+"""Calendar conversion engine based on precomputed Julian day lookup tables.
+
+For every supported calendar, the Julian days of all month starts
+within a year range are precomputed as NumPy arrays;
+conversion of a date to a Julian day then is an O(1) lookup (month start + day offset).
+
+Conversion functions work on scalars and (element-wise) on arrays;
+years/months outside of the table range are computed with the closed-form formulas
+the tables are generated from (cf. convertdate.julian.to_jd, convertdate.armenian.to_jd).
+"""
+
+from collections.abc import Callable
+import math
+from typing import overload
+
+import convertdate
+import numpy as np
+import numpy.typing as npt
+
+
+_ArrayLike = npt.ArrayLike
+
+byzantine_julian_days_delta = 5509 * 365 + math.floor(5509 / 4) + 1
+
+
+def _julian_formula(years, months, days) -> np.ndarray:
+    """Vectorized convertdate.julian.to_jd (without validation)."""
+    years, months, days = np.broadcast_arrays(years, months, days)
+    shift = months <= 2
+    years = np.where(shift, years - 1, years)
+    months = np.where(shift, months + 12, months)
+
+    return (
+        np.floor(365.25 * (years + 4716))
+        + np.floor(30.6001 * (months + 1))
+        + days
+        - 1524.5
+    )
+
+
+def _armenian_formula(years, months, days) -> np.ndarray:
+    """Vectorized convertdate.armenian.to_jd (moveable calendar, without validation)."""
+    years, months, days = np.broadcast_arrays(years, months, days)
+    return convertdate.armenian.EPOCH + 365 * years + (months - 1) * 30 + days
+
+
+class CalendarTable:
+    """Month-start Julian day lookup table for a calendar.
+
+    Scalar conversions are validated with the calendar's convertdate validator,
+    array conversions are not validated.
+    """
+
+    def __init__(
+        self,
+        formula: Callable[..., np.ndarray],
+        validator: Callable[[int, int, int], object],
+        years: range,
+        months: int,
+    ) -> None:
+        self.formula = formula
+        self.validator = validator
+        self.first_year = years.start
+        self.last_year = years.stop - 1
+        self.months = months
+
+        year_grid, month_grid = np.meshgrid(
+            np.arange(years.start, years.stop),
+            np.arange(1, months + 1),
+            indexing="ij",
+        )
+        self.month_starts: np.ndarray = formula(year_grid, month_grid, 1)
+        # nested lists avoid NumPy scalar overhead for scalar lookups
+        self._month_starts_list: list[list[float]] = self.month_starts.tolist()
+
+    def _in_range(self, years, months):
+        return (
+            (years >= self.first_year)
+            & (years <= self.last_year)
+            & (months >= 1)
+            & (months <= self.months)
+        )
+
+    @overload
+    def to_jd(self, year: int, month: int, day: int) -> float: ...
+
+    @overload
+    def to_jd(
+        self, year: _ArrayLike, month: _ArrayLike, day: _ArrayLike
+    ) -> np.ndarray: ...
+
+    def to_jd(self, year, month, day):
+        """Convert a date (or arrays of dates) to Julian days."""
+        if isinstance(year, int) and isinstance(month, int) and isinstance(day, int):
+            self.validator(year, month, day)
+
+            if not (
+                self.first_year <= year <= self.last_year and 1 <= month <= self.months
+            ):
+                return float(self.formula(year, month, day))
+
+            month_start = self._month_starts_list[year - self.first_year][month - 1]
+            return month_start + day - 1
+
+        years, months, days = np.broadcast_arrays(year, month, day)
+        in_range = self._in_range(years, months)
+
+        year_index = np.clip(
+            years - self.first_year, 0, self.last_year - self.first_year
+        )
+        month_index = np.clip(months - 1, 0, self.months - 1)
+        jd = self.month_starts[year_index, month_index] + days - 1
+
+        if not in_range.all():
+            jd = np.where(in_range, jd, self.formula(years, months, days))
+
+        return jd
+
+
+# AM years are passed to the Julian calendar directly (see byzantine_to_jd)
+julian_table = CalendarTable(
+    _julian_formula,
+    convertdate.julian.legal_date,
+    years=range(0, 8000),
+    months=12,
+)
+
+armenian_table = CalendarTable(
+    _armenian_formula,
+    convertdate.armenian._valid_date,
+    years=range(1, 2000),
+    months=13,
+)
+
+
+def julian_to_jd(year, month, day):
+    """Convert a Julian calendar date to a Julian day."""
+    return julian_table.to_jd(year, month, day)
+
+
+def byzantine_to_jd(year, month, day):
+    """Convert a Byzantine (AM) date to a Julian day."""
+    return julian_table.to_jd(year, month, day) - byzantine_julian_days_delta
+
+
+def armenian_to_jd(year, month, day):
+    """Convert an Armenian (moveable) calendar date to a Julian day."""
+    return armenian_table.to_jd(year, month, day)
+
+
+jd_converters: dict[str, Callable] = {
+    "AM": byzantine_to_jd,
+    "A": armenian_to_jd,
+    "J": julian_to_jd,
+}
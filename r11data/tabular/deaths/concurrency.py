@@ -0,0 +1,60 @@
+"""Concurrent row processing for deaths RowGraphConverters."""
+
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+import pandas as pd
+from rdflib import Graph
+from tabulardf import RowGraphConverter
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_map(
+    f: Callable[[T], R], iterable: Iterable[T], max_workers: int
+) -> Iterator[R]:
+    """Map f over iterable in a thread pool and yield results in input order.
+
+    At most max_workers calls are in flight at once,
+    so results are produced lazily and memory stays bounded.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        window: deque[Future[R]] = deque()
+
+        for item in iterable:
+            if len(window) >= max_workers:
+                yield window.popleft().result()
+            window.append(executor.submit(f, item))
+
+        while window:
+            yield window.popleft().result()
+
+
+class ConcurrentRowGraphConverter(RowGraphConverter):
+    """RowGraphConverter which applies row_rule to max_workers rows concurrently.
+
+    Row rules block on network lookups (see get_uris_from_service);
+    running several rows at once overlaps those waits.
+    Row graphs are still generated in deterministic row order.
+    """
+
+    def __init__(
+        self,
+        dataframe: pd.DataFrame,
+        *,
+        row_rule: Callable[..., Graph],
+        max_workers: int = 8,
+        graph: Graph | None = None,
+    ) -> None:
+        """Initialize a ConcurrentRowGraphConverter instance."""
+        super().__init__(dataframe=dataframe, row_rule=row_rule, graph=graph)
+        self.max_workers = max_workers
+
+    def _generate_graphs(self) -> Generator[Graph, None, None]:
+        """Construct a generator of subgraphs for merging in row order."""
+        rows = (row.to_dict() for _, row in self._df.iterrows())
+        yield from ordered_map(self._row_rule, rows, self.max_workers)
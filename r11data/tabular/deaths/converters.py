@@ -1,5 +1,11 @@
 """TabulaRDF Converters for R11."""
 
+from r11data.tabular.deaths.batching import BatchedRowGraphConverter
+from r11data.tabular.deaths.bulk_date_parser import date_lookup
+from r11data.tabular.deaths.query_templates import (
+    editor_deaths_batch_template,
+    source_deaths_batch_template,
+)
 from r11data.tabular.deaths.rules import (
     aa_editor_row_rule,
     mr_editor_row_rule,
@@ -11,9 +17,20 @@ from r11data.tabular.deaths.tables.partitions import (
     source_partition_aa,
     source_partition_mr,
 )
+from r11data.utils.tracing import tracer
 from tabulardf import RowGraphConverter
 
 
+# bulk parse death dates once; row rules look them up in generate_e2_triples
+for partition in (
+    source_partition_aa,
+    source_partition_mr,
+    editor_partition_aa,
+    editor_partition_mr,
+):
+    with tracer.span("bulk parse dates", rows=len(partition)):
+        date_lookup.update(partition["Death date"])
+
 source_converter_aa = RowGraphConverter(
     dataframe=source_partition_aa,
     row_rule=source_row_rule,
@@ -33,3 +50,29 @@ editor_converter_mr = RowGraphConverter(
     dataframe=editor_partition_mr,
     row_rule=mr_editor_row_rule,
 )
+
+
+# -- batched converters --
+batched_source_converter_aa = BatchedRowGraphConverter(
+    dataframe=source_partition_aa,
+    row_rule=source_row_rule,
+    query_template=source_deaths_batch_template,
+)
+
+batched_source_converter_mr = BatchedRowGraphConverter(
+    dataframe=source_partition_mr,
+    row_rule=source_row_rule,
+    query_template=source_deaths_batch_template,
+)
+
+batched_editor_converter_aa = BatchedRowGraphConverter(
+    dataframe=editor_partition_aa,
+    row_rule=aa_editor_row_rule,
+    query_template=editor_deaths_batch_template,
+)
+
+batched_editor_converter_mr = BatchedRowGraphConverter(
+    dataframe=editor_partition_mr,
+    row_rule=mr_editor_row_rule,
+    query_template=editor_deaths_batch_template,
+)
@@ -0,0 +1,142 @@
+"""Memoization of R11DateParser outcomes.
+
+Death date values recur across tables and partitions;
+DateParserCache stores parsing outcomes (including failures) per raw date value
+in a bounded LRU which can optionally be persisted to disk.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+import hashlib
+import inspect
+from pathlib import Path
+import pickle
+import threading
+from typing import NamedTuple, cast
+
+import convertdate
+from pydantic import ValidationError
+from r11data.tabular.deaths import calendars, date_parser
+from r11data.tabular.deaths.bulk_date_parser import ParsedDate
+from r11data.tabular.deaths.date_parser import InvalidDateException, R11DateParser
+from r11data.utils.paths import cache
+
+
+class DateParseFailure(NamedTuple):
+    """Failed R11DateParser outcome; message is the string of the raised exception."""
+
+    message: str
+
+
+DateOutcome = ParsedDate | DateParseFailure
+
+
+def parse_date(date_value: str) -> DateOutcome:
+    """Parse a raw date value with R11DateParser and return the outcome.
+
+    Only validation errors are turned into DateParseFailures;
+    other exceptions propagate (and are not cached).
+    """
+    try:
+        parser = R11DateParser(date_value)
+        jd_begin, jd_end = parser.jd_duration
+    except (InvalidDateException, ValidationError) as e:
+        return DateParseFailure(str(e))
+
+    return ParsedDate(jd_begin, jd_end, parser.date_entry.known_limit)
+
+
+def _parser_version() -> str:
+    """Hash the date_parser and calendars sources and the convertdate version.
+
+    Persisted outcomes of other versions are discarded.
+    """
+    version = hashlib.sha256()
+    for module in (date_parser, calendars):
+        version.update(inspect.getsource(module).encode("utf-8"))
+    version.update(convertdate.__version__.encode("utf-8"))
+    return version.hexdigest()
+
+
+class DateParserCache:
+    """Bounded LRU cache for R11DateParser outcomes.
+
+    If path is given, the cache is loaded from path on first access and written by save.
+    Hit/miss counters are kept for run reports.
+    """
+
+    def __init__(self, maxsize: int = 4096, path: Path | None = None) -> None:
+        self.maxsize = maxsize
+        self.path = path
+
+        self.hits = 0
+        self.misses = 0
+
+        self._outcomes: OrderedDict[Hashable, DateOutcome] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def outcomes(self) -> OrderedDict[Hashable, DateOutcome]:
+        """Lazily initialize the LRU, loading persisted outcomes if available."""
+        if self._outcomes is None:
+            self._outcomes = OrderedDict(self._load())
+        return self._outcomes
+
+    def _load(self) -> list[tuple[Hashable, DateOutcome]]:
+        if self.path is None:
+            return []
+
+        try:
+            with open(self.path, "rb") as f:
+                version, outcomes = pickle.load(f)
+        except (FileNotFoundError, pickle.UnpicklingError, EOFError, ValueError):
+            return []
+
+        return outcomes[-self.maxsize :] if version == _parser_version() else []
+
+    def save(self) -> None:
+        """Persist the cached outcomes to path (if given)."""
+        if self.path is None or self._outcomes is None:
+            return
+
+        with self._lock:
+            outcomes = list(self._outcomes.items())
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.path.with_suffix(".tmp")
+        with open(temp_file, "wb") as f:
+            pickle.dump((_parser_version(), outcomes), f)
+        temp_file.replace(self.path)
+
+    def get(self, date_value: str) -> DateOutcome:
+        """Get the outcome for a raw date value, parsing it on cache miss."""
+        with self._lock:
+            outcomes = self.outcomes
+            if date_value in outcomes:
+                self.hits += 1
+                outcomes.move_to_end(date_value)
+                return outcomes[date_value]
+
+        outcome = parse_date(date_value)
+
+        with self._lock:
+            self.misses += 1
+            outcomes[date_value] = outcome
+            if len(outcomes) > self.maxsize:
+                outcomes.popitem(last=False)
+
+        return outcome
+
+    def clear(self) -> None:
+        """Drop all cached outcomes and reset the counters."""
+        with self._lock:
+            self._outcomes = OrderedDict()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get hit/miss counters and the current cache size."""
+        size = 0 if self._outcomes is None else len(self._outcomes)
+        return {"hits": self.hits, "misses": self.misses, "size": size}
+
+
+date_parser_cache = DateParserCache(path=cast(Path, cache) / "date_parser.pickle")
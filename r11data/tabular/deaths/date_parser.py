@@ -7,9 +7,8 @@ from contextlib import suppress
 import re
 from typing import ClassVar, Optional
 
-import convertdate
 from pydantic import BaseModel, field_validator, model_validator
-from r11data.tabular.deaths.utils.utils import byzantine_to_jd
+from r11data.tabular.deaths.calendars import jd_converters
 from toolz.dicttoolz import valfilter
 
 
@@ -203,11 +202,7 @@ class R11DateParser:
     capture groups are used to instantiate an R11DateEntry dataclass.
     """
 
-    _jd_converters = {
-        "AM": byzantine_to_jd,
-        "A": convertdate.armenian.to_jd,
-        "J": convertdate.julianday.from_julian,
-    }
+    _jd_converters = jd_converters
 
     def __init__(self, date_value: str):
         """Initialize a R11DateParser.
@@ -3,7 +3,6 @@
 from functools import partial
 import itertools
 from typing import Mapping
-from uuid import uuid1
 
 from rdflib import Graph, URIRef
 
@@ -14,7 +13,7 @@ from r11data.tabular.deaths.query_templates import (
 import r11data.tabular.deaths.triple_generators.deaths_editor_triple_generators as de
 import r11data.tabular.deaths.triple_generators.deaths_source_triple_generators as ds
 from r11data.tabular.deaths.triple_generators.metadata_triple_generator import (
-    _generate_nodes_metadata,
+    run_provenance,
 )
 from r11data.tabular.deaths.utils.namespaces import sd
 from r11data.tabular.deaths.utils.utils import (
@@ -23,6 +22,9 @@ from r11data.tabular.deaths.utils.utils import (
     remove_parens,
     skipif,
 )
+from r11data.utils.minting import minter
+from r11data.utils.progress import progress
+from r11data.utils.tracing import tracer
 
 
 SKIP_VALUES = {
@@ -38,22 +40,51 @@ SKIP_VALUES = {
     "Source loc": ["2.178.5"],
 }
 
-skip = skipif(skip_callback=Graph, **SKIP_VALUES)
 
-generate_nodes_metadata = _generate_nodes_metadata()
+def skipped_row() -> Graph:
+    """Count a skipped row for progress reporting and return an empty graph."""
+    progress.skip()
+    return Graph()
+
+
+skip = skipif(skip_callback=skipped_row, **SKIP_VALUES)
+
+
+def row_trace_args(row_data: Mapping, **kwargs) -> dict[str, str]:
+    """Get span args identifying a row for per-row cost attribution."""
+    return {
+        "name": row_data["Name"],
+        "code": row_data["Code"],
+        "source": row_data["Source"],
+        "death_date": row_data["Death date"],
+    }
+
+
+def query_key(row_data: Mapping) -> tuple[str, str, str]:
+    """Get the (pbw_desc, name, code) key for URI lookups from row data."""
+    pbw_desc = getmap(row_data, ("Description in PBW", "Description"))
+    return pbw_desc, remove_parens(row_data["Name"]), row_data["Code"]
 
 
 @skip
-def source_row_rule(row_data: Mapping) -> Graph:
+@tracer.traced("source row", category="row", args=row_trace_args)
+def source_row_rule(
+    row_data: Mapping,
+    *,
+    query_results: Mapping[tuple[str, str, str], dict[str, URIRef]] | None = None,
+) -> Graph:
     """Callable responsible for generating a row graph in RowGraphConverter.
 
+    If query_results is given (see BatchedRowGraphConverter),
+    URIs are looked up by query_key instead of being queried per row.
+
     See https://github.com/lu-pl/tabulardf#callable-converters.
     """
     # -- bindings --
-    e13_subject_uri = sd[str(uuid1())]
+    e13_subject_uri = sd[minter("source e13", row_data)]
 
     _date_value = row_data["Death date"]
-    temporal_entity_uri = sd[str(uuid1())]
+    temporal_entity_uri = sd[minter("source e52", row_data)]
 
     pbw_desc = getmap(row_data, ("Description in PBW", "Description"))
 
@@ -64,8 +95,16 @@ def source_row_rule(row_data: Mapping) -> Graph:
         row_data["Source"],
     )
 
-    query_result = get_uris_from_service(
-        source_deaths_template, pbw_desc=pbw_desc, name=name, code=code, source=source
+    query_result = (
+        get_uris_from_service(
+            source_deaths_template,
+            pbw_desc=pbw_desc,
+            name=name,
+            code=code,
+            source=source,
+        )
+        if query_results is None
+        else query_results.get(query_key(row_data))
     )
 
     # -- graph generation --
@@ -74,13 +113,13 @@ def source_row_rule(row_data: Mapping) -> Graph:
     # skip the entry if the query returns an empty set
     # this gets logged in get_uris_from_service
     if not query_result:
+        progress.fail()
         return graph
 
     triples = itertools.chain(
-        ds.generate_jd_trs_triples(),
         ds.generate_e13_triples(e13_subject_uri, temporal_entity_uri, **query_result),
         ds.generate_e2_triples(temporal_entity_uri, _date_value),
-        generate_nodes_metadata(e13_subject_uri),
+        run_provenance.link(e13_subject_uri),
     )
 
     for triple in triples:
@@ -90,13 +129,19 @@ def source_row_rule(row_data: Mapping) -> Graph:
 
 
 @skip
-def _editor_row_rule(row_data: Mapping, *, actor_p14) -> Graph:
+@tracer.traced("editor row", category="row", args=row_trace_args)
+def _editor_row_rule(
+    row_data: Mapping,
+    *,
+    actor_p14,
+    query_results: Mapping[tuple[str, str, str], dict[str, URIRef]] | None = None,
+) -> Graph:
     """Callable responsible for generating a row graph in RowGraphConverter."""
     # -- bindings --
-    passage_uri = sd[str(uuid1())]
-    e13_r15_uri = sd[str(uuid1())]
-    e13_p4_uri = sd[str(uuid1())]
-    temporal_entity_uri = sd[str(uuid1())]
+    passage_uri = sd[minter("editor passage", actor_p14, row_data)]
+    e13_r15_uri = sd[minter("editor e13 r15", actor_p14, row_data)]
+    e13_p4_uri = sd[minter("editor e13 p4", actor_p14, row_data)]
+    temporal_entity_uri = sd[minter("editor e52", actor_p14, row_data)]
 
     date_value = row_data["Death date"]
     pbw_desc = getmap(row_data, ("Description in PBW", "Description"))
@@ -108,14 +153,23 @@ def _editor_row_rule(row_data: Mapping, *, actor_p14) -> Graph:
         row_data["Source"],
     )
 
-    query_result = get_uris_from_service(
-        editor_deaths_template, pbw_desc=pbw_desc, name=name, code=code, source=source
+    query_result = (
+        get_uris_from_service(
+            editor_deaths_template,
+            pbw_desc=pbw_desc,
+            name=name,
+            code=code,
+            source=source,
+        )
+        if query_results is None
+        else query_results.get(query_key(row_data))
     )
 
     # -- graph generation --
     graph = Graph()
 
     if not query_result:
+        progress.fail()
         return graph
 
     triples = itertools.chain(
@@ -131,7 +185,7 @@ def _editor_row_rule(row_data: Mapping, *, actor_p14) -> Graph:
             passage_uri,
         ),
         ds.generate_e2_triples(temporal_entity_uri, date_value),
-        generate_nodes_metadata(e13_p4_uri, e13_r15_uri),
+        run_provenance.link(e13_p4_uri, e13_r15_uri),
     )
 
     for triple in triples:
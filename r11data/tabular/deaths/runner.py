@@ -1,21 +1,42 @@
 """Runner for R11data deaths conversions."""
 
+from collections.abc import Iterator
+import itertools
 from pathlib import Path
 from typing import cast
 
 from r11data.abcs import _ABCRunner
+from r11data.tabular.deaths.batching import BatchedRowGraphConverter
+from r11data.tabular.deaths.concurrency import ConcurrentRowGraphConverter
+from r11data.tabular.deaths.date_cache import date_parser_cache
+from r11data.tabular.deaths.incremental import IncrementalRowGraphConverter, RowManifest
+from r11data.tabular.deaths.triple_generators.deaths_source_triple_generators import (
+    generate_jd_trs_triples,
+)
+from r11data.tabular.deaths.triple_generators.metadata_triple_generator import (
+    run_provenance,
+)
 from r11data.tabular.deaths.converters import (
+    batched_editor_converter_aa,
+    batched_editor_converter_mr,
+    batched_source_converter_aa,
+    batched_source_converter_mr,
     editor_converter_aa,
     editor_converter_mr,
     source_converter_aa,
     source_converter_mr,
 )
-from r11data.tabular.deaths.utils.namespaces import R11NamespaceManager
-from r11data.utils.paths import output_tabular
-from rdflib import Graph
+from r11data.tabular.deaths.utils.loggers import logger
+from r11data.tabular.deaths.utils.namespaces import R11NamespaceManager, _namespaces
+from r11data.utils.paths import cache, output_tabular
+from r11data.utils.progress import progress
+from r11data.utils.tracing import tracer
+from rdflib import RDF, RDFS, TIME, XSD, Graph
 from tabulardf import RowGraphConverter
 
 
+converter_keys: tuple[str, ...] = ("source_aa", "source_mr", "editor_aa", "editor_mr")
+
 converters: tuple[RowGraphConverter, ...] = (
     source_converter_aa,
     source_converter_mr,
@@ -23,6 +44,13 @@ converters: tuple[RowGraphConverter, ...] = (
     editor_converter_mr,
 )
 
+batched_converters: tuple[BatchedRowGraphConverter, ...] = (
+    batched_source_converter_aa,
+    batched_source_converter_mr,
+    batched_editor_converter_aa,
+    batched_editor_converter_mr,
+)
+
 
 class DeathsRunner(_ABCRunner):
     """Runner for deaths table conversions.
@@ -30,23 +58,112 @@ class DeathsRunner(_ABCRunner):
     Note: There is a known bug in tabulardf which causes RowGraphConverters
     to be inadvertently stateful between runs (RowGraphs are iadded to the interal graph object).
     The problem can be circumvented by calling a private RowGraphConverter method though.
+
+    If batch_size is given, URIs are resolved in blocks of batch_size rows
+    with a single SPARQL query per block (see BatchedRowGraphConverter).
+    If max_workers is given, up to max_workers blocks (or, without batch_size, rows)
+    are processed concurrently (see ConcurrentRowGraphConverter).
+
+    Every run records a row manifest (see RowManifest);
+    if incremental is True, only rows added or changed since the last run are regenerated.
+
+    Provenance is run-scoped (see RunProvenance): the execution metadata
+    and static vocabulary triples are emitted once per run, row graphs only link to it.
     """
 
+    namespaces = {**_namespaces, "rdf": RDF, "rdfs": RDFS, "xsd": XSD, "time": TIME}
+
+    manifest_path = cast(Path, cache) / "manifests" / "deaths.json"
+
+    def __init__(
+        self,
+        batch_size: int | None = None,
+        max_workers: int | None = None,
+        incremental: bool = False,
+    ) -> None:
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.incremental = incremental
+
     def persist(self) -> None:
         """Run the conversion and persist the result in r11data/output."""
-        graph = self.run()
         output_file = cast(Path, output_tabular / "deaths.ttl")
-
-        with open(output_file, "w") as f:
-            f.write(graph.serialize())
+        self.persist_stream(output_file)
 
     def run(self) -> Graph:
         """Run the deaths table to RDF conversion."""
         graph = Graph()
         R11NamespaceManager(graph)
 
-        for converter in converters:
-            for row_graph in converter._generate_graphs():
+        for row_graph in self.generate_graphs():
+            with tracer.span("merge row graph"):
                 graph += row_graph
 
         return graph
+
+    def generate_graphs(self) -> Iterator[Graph]:
+        """Generate the run graph and row graphs for all converters.
+
+        Memoized date parser outcomes and the row manifest are persisted after the run.
+        """
+        yield self._generate_run_graph()
+
+        manifest = RowManifest(self.manifest_path, use_previous=self.incremental)
+
+        for key, converter in zip(converter_keys, self._converters()):
+            incremental_converter = IncrementalRowGraphConverter(
+                converter, manifest=manifest, key=key
+            )
+            with progress.task(f"deaths {key}", total=len(converter._df)):
+                for graph in incremental_converter._generate_graphs():
+                    progress.advance(triples=len(graph))
+                    yield graph
+
+        manifest.save()
+        logger.info(
+            f"Row manifest: {manifest.generated} rows generated, "
+            f"{manifest.reused} reused, {manifest.removed} removed."
+        )
+
+        date_parser_cache.save()
+        logger.info(
+            "Date parser cache: {hits} hits, {misses} misses, {size} entries.".format(
+                **date_parser_cache.stats()
+            )
+        )
+
+    def _generate_run_graph(self) -> Graph:
+        """Generate run-level triples, i.e. provenance and static vocabulary triples."""
+        run_provenance.start()
+
+        graph = Graph()
+        for triple in itertools.chain(
+            run_provenance.generate_run_triples(), generate_jd_trs_triples()
+        ):
+            graph.add(triple)
+
+        return graph
+
+    def _converters(self) -> tuple[RowGraphConverter, ...]:
+        """Get per-row, concurrent or batched converters.
+
+        See batch_size and max_workers.
+        """
+        if self.batch_size is None:
+            if self.max_workers is None:
+                return converters
+
+            return tuple(
+                ConcurrentRowGraphConverter(
+                    dataframe=converter._df,
+                    row_rule=converter._row_rule,
+                    max_workers=self.max_workers,
+                )
+                for converter in converters
+            )
+
+        for converter in batched_converters:
+            converter.batch_size = self.batch_size
+            converter.max_workers = self.max_workers
+
+        return batched_converters
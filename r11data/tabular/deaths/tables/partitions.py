@@ -1,23 +1,103 @@
-"""Dataframe partitions."""
+"""Dataframe partitions.
 
+Spreadsheets are parsed once and cached as columnar snapshots
+(pickled dataframes with categorical dtypes for low-cardinality columns)
+together with their precomputed 'Dating authority' partitions.
+Snapshots are keyed on the xlsx content hash, so edited spreadsheets are re-parsed.
+"""
+
+import hashlib
 import importlib.resources
+import io
+from pathlib import Path
+import pickle
+from typing import NamedTuple, cast
 
 import pandas as pd
+from r11data.utils.paths import cache
+from r11data.utils.tracing import tracer
 
 
 xlsx_path = importlib.resources.files("r11data.tabular.deaths.tables.xlsx")
+snapshot_path = cast(Path, cache) / "partitions"
+
+categorical_columns = ("Dating authority", "Source", "Outside Source")
+
+
+class SheetSnapshot(NamedTuple):
+    """Columnar snapshot of a sheet and its partitions.
+
+    Partition keys are case-folded 'Dating authority' values.
+    """
+
+    dataframe: pd.DataFrame
+    partitions: dict[str, pd.DataFrame]
+
+
+def compact_dtypes(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Convert categorical_columns of dataframe to categorical dtypes."""
+    columns = [column for column in categorical_columns if column in dataframe]
+    return dataframe.astype({column: "category" for column in columns})
+
+
+def partition_by_authority(dataframe: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """Partition dataframe by case-folded 'Dating authority' values.
+
+    Rows without a dating authority are dropped; row order is preserved.
+    """
+    keys = dataframe["Dating authority"].astype("string").str.casefold()
+    return {
+        str(key): partition
+        for key, partition in dataframe.groupby(keys, sort=False, observed=True)
+    }
+
+
+def load_sheet(file_name: str) -> SheetSnapshot:
+    """Load a SheetSnapshot for an xlsx file from the snapshot cache.
+
+    On cache miss, the xlsx file is parsed and the snapshot is written;
+    stale snapshots of the same file are removed.
+    """
+    content = (xlsx_path / file_name).read_bytes()
+    digest = hashlib.sha256(content + pd.__version__.encode()).hexdigest()[:16]
+
+    stem = Path(file_name).stem
+    snapshot_file = snapshot_path / f"{stem}-{digest}.pickle"
+
+    try:
+        with (
+            open(snapshot_file, "rb") as f,
+            tracer.span("load sheet snapshot", file=file_name),
+        ):
+            return pickle.load(f)
+    except (FileNotFoundError, pickle.UnpicklingError, EOFError):
+        pass
+
+    with tracer.span("read_excel", file=file_name):
+        dataframe = compact_dtypes(pd.read_excel(io.BytesIO(content)))
+    snapshot = SheetSnapshot(dataframe, partition_by_authority(dataframe))
+
+    snapshot_path.mkdir(parents=True, exist_ok=True)
+    for stale in snapshot_path.glob(f"{stem}-*.pickle"):
+        stale.unlink(missing_ok=True)
+
+    # write to a temporary file first, so concurrent readers never see partial files
+    temp_file = snapshot_file.with_suffix(".tmp")
+    with open(temp_file, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    temp_file.replace(snapshot_file)
+
+    return snapshot
 
-dataframe_aa = pd.read_excel(xlsx_path / "c11deaths-AA.xlsx")
-dataframe_mr = pd.read_excel(xlsx_path / "c11deaths-MR.xlsx")
 
-source_partition_aa = dataframe_aa.loc[dataframe_aa["Dating authority"] == "Source"]
+snapshot_aa = load_sheet("c11deaths-AA.xlsx")
+snapshot_mr = load_sheet("c11deaths-MR.xlsx")
 
-source_partition_mr = dataframe_mr.loc[
-    dataframe_mr["Dating authority"] == "source"  # lowercase!
-]
+dataframe_aa = snapshot_aa.dataframe
+dataframe_mr = snapshot_mr.dataframe
 
-editor_partition_aa = dataframe_aa.loc[dataframe_aa["Dating authority"] == "Editor"]
+source_partition_aa = snapshot_aa.partitions["source"]
+source_partition_mr = snapshot_mr.partitions["source"]
 
-editor_partition_mr = dataframe_mr.loc[
-    dataframe_mr["Dating authority"] == "editor"  # lowercase!
-]
+editor_partition_aa = snapshot_aa.partitions["editor"]
+editor_partition_mr = snapshot_mr.partitions["editor"]
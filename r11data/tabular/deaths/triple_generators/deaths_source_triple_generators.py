@@ -5,10 +5,11 @@ from typing import Callable, Iterator, Unpack
 
 from lodkit import ttl
 from lodkit.types import _Triple, _TripleObject
-from pydantic import ValidationError
-from r11data.tabular.deaths.date_parser import InvalidDateException, R11DateParser
+from r11data.tabular.deaths.bulk_date_parser import ParsedDate, date_lookup
+from r11data.tabular.deaths.date_cache import DateParseFailure, date_parser_cache
 from r11data.tabular.deaths.utils.loggers import logger
 from r11data.tabular.deaths.utils.namespaces import crm, sd, star
+from r11data.utils.tracing import tracer
 from rdflib import Literal, URIRef
 from rdflib.namespace import RDF, RDFS, TIME
 
@@ -57,9 +58,13 @@ def _generate_time_base(
 
 
 def _generate_time_triples(
-    temporal_entity_uri: URIRef, date_parser: R11DateParser
+    temporal_entity_uri: URIRef,
+    date_label: str,
+    jd_begin: int,
+    jd_end: int,
+    known_limit: str | None,
 ) -> Iterator[_Triple]:
-    """Logic for creating time triples based on an R11DateParser object.
+    """Logic for creating time triples based on Julian day values.
 
     -- cases --
     1. position (begin == end):
@@ -71,10 +76,7 @@ def _generate_time_triples(
       4.1 TAQ duration
       4.2 TPQ duration
     """
-    date_label = date_parser._date_value
-    jd_begin, jd_end = date_parser.jd_duration
     is_position: bool = jd_begin == jd_end
-    known_limit = date_parser.date_entry.known_limit
 
     jd = sd["JulianDay"]
 
@@ -126,16 +128,28 @@ def generate_e2_triples(
     Depending on the input data either
       - generate full time triples or
       - generate reduced time triples (given invalid input).
+
+    Date values that were bulk parsed (see bulk_date_parser.date_lookup)
+    are looked up; all other values are parsed with R11DateParser
+    and the outcomes (including failures) are memoized in date_parser_cache.
     """
-    try:
-        date_parser = R11DateParser(date_value)
-        time_triples = _generate_time_triples(temporal_entity_uri, date_parser)
+    if (parsed_date := date_lookup.get(date_value)) is not None:
+        return _generate_time_triples(temporal_entity_uri, date_value, *parsed_date)
+
+    with tracer.span("parse date", "date", date_value=date_value):
+        outcome = date_parser_cache.get(date_value)
 
-    except (InvalidDateException, ValidationError) as e:
-        logger.warning(
-            f"Could not create R11DateParser from value '{date_value}'.\n" f"{e}\n"
-        )
+    match outcome:
+        case ParsedDate() as parsed_date:
+            time_triples = _generate_time_triples(
+                temporal_entity_uri, date_value, *parsed_date
+            )
+        case DateParseFailure(message):
+            logger.warning(
+                f"Could not create R11DateParser from value '{date_value}'.\n"
+                f"{message}\n"
+            )
 
-        time_triples = _generate_time_base(temporal_entity_uri, date_value)
+            time_triples = _generate_time_base(temporal_entity_uri, date_value)
 
     return time_triples
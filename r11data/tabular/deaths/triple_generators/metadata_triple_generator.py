@@ -1,7 +1,6 @@
 """Metadata triple generator from r11cli."""
 
 from collections.abc import Iterator
-from collections.abc import Callable
 import datetime
 
 from lodkit import mkuri_factory, ttl
@@ -15,25 +14,41 @@ from rdflib.namespace import Namespace, RDF, XSD
 mkuri = mkuri_factory(Namespace("https://r11.eu/ns/star/"))
 
 
-def _generate_nodes_metadata() -> Callable[..., Iterator[_Triple]]:
-    """Generate metadata triples for a node."""
+class RunProvenance:
+    """Run-scoped provenance metadata.
 
-    r11tab = "https://github.com/erc-releven/" "DataModelSchemas/tree/main/r11tab"
+    A single D10_Software_Execution describes a run:
+    generate_run_triples yields the execution block (once per run),
+    link yields an L11_had_output triple per generated node.
+    """
+
+    r11tab = "https://github.com/erc-releven/DataModelSchemas/tree/main/r11tab"
 
     json_type = URIRef(
-        "https://vocabs.sshopencloud.eu/browse/"
-        "media-type/en/page/applicationslashjson"
+        "https://vocabs.sshopencloud.eu/browse/media-type/en/page/applicationslashjson"
     )
 
-    datetime_literal = Literal(
-        datetime.datetime.now().isoformat(), datatype=XSD.dateTime
-    )
+    def __init__(self) -> None:
+        self.execution_uri = mkuri("metadata d10")
+        self.started: datetime.datetime | None = None
+
+    def start(self) -> None:
+        """Record the start time of a run."""
+        self.started = datetime.datetime.now()
 
-    def _wrapper(*nodes: URIRef):
-        yield from ttl(
-            mkuri("metadata d10"),
+    def link(self, *nodes: URIRef) -> Iterator[_Triple]:
+        """Link nodes to the run execution."""
+        for node in nodes:
+            yield self.execution_uri, crmdig.L11_had_output, node
+
+    def generate_run_triples(self) -> Iterator[_Triple]:
+        """Generate metadata triples for the run execution."""
+        started = self.started or datetime.datetime.now()
+        datetime_literal = Literal(started.isoformat(), datatype=XSD.dateTime)
+
+        return ttl(
+            self.execution_uri,
             (RDF.type, crmdig.D10_Software_Execution),
-            (crmdig.L11_had_output, nodes),
             (
                 crm["P4_has_time-span"],
                 ttl(
@@ -52,7 +67,7 @@ def _generate_nodes_metadata() -> Callable[..., Iterator[_Triple]]:
                         ttl(
                             mkuri("metadata e42"),
                             (RDF.type, crm.E42_Identifier),
-                            (crm.P190_has_symbolic_value, Literal(r11tab)),
+                            (crm.P190_has_symbolic_value, Literal(self.r11tab)),
                         ),
                     ),
                 ),
@@ -67,7 +82,7 @@ def _generate_nodes_metadata() -> Callable[..., Iterator[_Triple]]:
                         ttl(
                             mkuri("metadata e73"),
                             (RDF.type, crm.E73_Information_Object),
-                            (crm.P2_has_type, json_type),
+                            (crm.P2_has_type, self.json_type),
                             (
                                 crm.P190_has_symbolic_content,
                                 Literal(get_system_information()),
@@ -78,4 +93,5 @@ def _generate_nodes_metadata() -> Callable[..., Iterator[_Triple]]:
             ),
         )
 
-    return _wrapper
+
+run_provenance = RunProvenance()
@@ -4,6 +4,8 @@ import importlib.resources
 import logging
 import logging.handlers
 
+from r11data.utils.progress import StderrHandler
+
 
 # log_path = importlib.resources.files("r11data.tabular.deaths.logs")
 log_path = importlib.resources.files("r11data.logs")
@@ -15,12 +17,12 @@ stream_formatter = logging.Formatter("%(levelname)s: %(message)s")
 
 # handlers
 rotating_handler = logging.handlers.RotatingFileHandler(
-    filename=log_file, maxBytes=2e6, backupCount=1
+    filename=log_file, maxBytes=2e6, backupCount=1, delay=True
 )
 rotating_handler.setLevel(logging.WARNING)
 rotating_handler.setFormatter(file_formatter)
 
-stream_handler = logging.StreamHandler()
+stream_handler = StderrHandler()
 stream_handler.setLevel(logging.INFO)
 stream_handler.setFormatter(stream_formatter)
 
@@ -4,24 +4,17 @@ from collections.abc import Callable, Container, Iterable, Mapping
 from contextlib import contextmanager
 import functools
 import json
-import math
-import operator
-import os
 import platform
 import re
 from typing import Any
 
-from SPARQLWrapper import JSON, SPARQLWrapper
-import convertdate
-from dotenv import load_dotenv
+from r11data.tabular.deaths.calendars import byzantine_to_jd  # noqa: F401
 from r11data.tabular.deaths.utils.loggers import logger
+from r11data.utils.endpoints import endpoints
+from r11data.utils.sparql_client import graphdb_auth, sparql_client
 from rdflib import Graph, URIRef
 
 
-load_dotenv()
-PASSWD = os.environ["PASSWD"]
-
-
 def get_uris_from_service(
     query_template: str,
     pbw_desc: str,
@@ -35,24 +28,15 @@ def get_uris_from_service(
     Constructs a SPARQL query and runs it against the WissKI service
     in order to obtain the URIs needed for triple generation in row_rule.
     """
-    endpoint: str = (
-        endpoint
-        if endpoint is not None
-        else "https://graphdb.r11.eu/repositories/RELEVEN"
-    )
+    endpoint: str = endpoint if endpoint is not None else endpoints["releven"]
 
     deaths_query: str = query_template.format(
         pbw_desc=pbw_desc.replace('"', '\\"'), name=name, code=code
     )
 
-    # sparqlwrapper setup + query
-    sparql = SPARQLWrapper(endpoint)
-    sparql.setReturnFormat(JSON)
-    sparql.setCredentials(user="admin", passwd=PASSWD)
-
-    sparql.setQuery(deaths_query)
-
-    sparql_result = sparql.queryAndConvert()
+    sparql_result = json.loads(
+        sparql_client.query(endpoint, deaths_query, auth=graphdb_auth)
+    )
 
     # bind or skip + log
     result_bindings = sparql_result["results"]["bindings"]
@@ -69,16 +53,66 @@ def get_uris_from_service(
     return result
 
 
-def byzantine_to_jd(year: int, month: int, day: int):
-    """..."""
-    byzantine_leap_days = math.floor(5509 / 4)
-    byzantine_julian_days_delta = 5509 * 365 + byzantine_leap_days + 1
+def get_uris_from_service_batched(
+    query_template: str,
+    keys: Iterable[tuple[str, str, str]],
+    endpoint: str | None = None,
+) -> dict[tuple[str, str, str], dict[str, URIRef]]:
+    """Get URIs for a block of (pbw_desc, name, code) keys from a remote endpoint.
+
+    Constructs a single VALUES-driven SPARQL query for all keys
+    and maps the result bindings back to their keys.
+    Templates group results by key, i.e. like the per-row templates ('limit 1'),
+    they return a single result per key;
+    keys without results are logged and absent from the returned mapping.
+    Bindings which do not match any key are logged and skipped.
+    """
+    endpoint: str = endpoint if endpoint is not None else endpoints["releven"]
 
-    julian_jd = convertdate.julian.to_jd(year=year, month=month, day=day)
+    # (pbw_desc, identifier) -> (pbw_desc, name, code)
+    key_mapping = {
+        (pbw_desc, f"{name} {code}"): (pbw_desc, name, code)
+        for pbw_desc, name, code in keys
+    }
 
-    result_jd = operator.sub(julian_jd, byzantine_julian_days_delta)
+    if not key_mapping:
+        return {}
 
-    return result_jd
+    values = "\n".join(
+        '            ("""{pbw_desc}"""@en "{identifier}")'.format(
+            pbw_desc=pbw_desc.replace('"', '\\"'), identifier=identifier
+        )
+        for pbw_desc, identifier in key_mapping
+    )
+    deaths_query: str = query_template.format(values=values)
+
+    sparql_result = json.loads(
+        sparql_client.query(endpoint, deaths_query, auth=graphdb_auth)
+    )
+
+    result: dict[tuple[str, str, str], dict[str, URIRef]] = {}
+
+    for binding in sparql_result["results"]["bindings"]:
+        pbw_desc = binding.pop("pbw_desc")["value"]
+        identifier = binding.pop("identifier")["value"]
+
+        if (key := key_mapping.get((pbw_desc, identifier))) is None:
+            logger.warning(
+                "The batched SPARQL query returned a binding for an unknown key:\n"
+                f"pbw_desc: {pbw_desc}, identifier: {identifier}\n"
+            )
+            continue
+
+        result.setdefault(key, {k: URIRef(v["value"]) for k, v in binding.items()})
+
+    for key in key_mapping.values():
+        if key not in result:
+            logger.warning(
+                "The batched SPARQL query returned empty for the following key:\n"
+                f"pbw_desc: {key[0]}, name: {key[1]}, code: {key[2]}\n"
+            )
+
+    return result
 
 
 def getmap(d: Mapping, keys: Iterable["str"], default: Any = None):
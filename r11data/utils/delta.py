@@ -0,0 +1,152 @@
+"""Delta computation between runner outputs as SPARQL UPDATE changesets.
+
+Outputs are compared as canonical N-Triples:
+lines are sorted with an external (on-disk) merge sort, so memory stays bounded,
+and sorted outputs are diffed in a single merge pass.
+"""
+
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from dataclasses import dataclass
+import heapq
+import itertools
+from pathlib import Path
+import tempfile
+from typing import IO, Literal
+
+
+_Change = tuple[Literal["-", "+"], str]
+
+
+@dataclass
+class DeltaStats:
+    """Numbers of deleted and inserted triples of a delta."""
+
+    deleted: int = 0
+    inserted: int = 0
+
+
+def _unique(lines: Iterable[str]) -> Iterator[str]:
+    """Drop consecutive duplicate lines."""
+    for line, _ in itertools.groupby(lines):
+        yield line
+
+
+def external_sort(
+    lines: Iterable[str], output_file: Path, chunk_size: int = 500_000
+) -> Path:
+    """Sort lines into output_file, keeping at most chunk_size lines in memory.
+
+    Sorted runs of chunk_size lines are spilled to temporary files
+    and k-way merged; duplicate lines are dropped.
+    """
+    lines = iter(lines)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        runs: list[Path] = []
+
+        while chunk := sorted(itertools.islice(lines, chunk_size)):
+            run = Path(temp_dir) / f"run-{len(runs)}.nt"
+            with open(run, "w", encoding="utf-8") as f:
+                f.writelines(_unique(chunk))
+            runs.append(run)
+
+        run_files = [open(run, encoding="utf-8") for run in runs]
+        try:
+            with open(output_file, "w", encoding="utf-8") as f:
+                f.writelines(_unique(heapq.merge(*run_files)))
+        finally:
+            for run_file in run_files:
+                run_file.close()
+
+    return output_file
+
+
+def diff_sorted(old: Iterable[str], new: Iterable[str]) -> Iterator[_Change]:
+    """Merge-diff two sorted, duplicate-free line streams.
+
+    Yields ('-', line) for lines only in old and ('+', line) for lines only in new.
+    """
+    old, new = iter(old), iter(new)
+    old_line, new_line = next(old, None), next(new, None)
+
+    while old_line is not None or new_line is not None:
+        if new_line is None or (old_line is not None and old_line < new_line):
+            yield "-", old_line  # type: ignore[misc]
+            old_line = next(old, None)
+        elif old_line is None or new_line < old_line:
+            yield "+", new_line
+            new_line = next(new, None)
+        else:
+            old_line, new_line = next(old, None), next(new, None)
+
+
+def _write_operations(
+    f: IO[str], operation: str, lines: Iterable[str], chunk_size: int
+) -> None:
+    """Write lines as operation blocks of at most chunk_size triples."""
+    lines = iter(lines)
+    while chunk := list(itertools.islice(lines, chunk_size)):
+        f.write(f"{operation} {{\n")
+        f.writelines(chunk)
+        f.write("};\n")
+
+
+def write_changeset(
+    changes: Iterable[_Change], changeset_file: Path, chunk_size: int = 10_000
+) -> DeltaStats:
+    """Write changes as a SPARQL UPDATE request of DELETE DATA/INSERT DATA operations.
+
+    Deletions precede insertions; each operation holds at most chunk_size triples.
+    Note that DELETE DATA does not allow blank nodes, so outputs should be bnode-free.
+    """
+    stats = DeltaStats()
+
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as insertions:
+        with open(changeset_file, "w", encoding="utf-8") as f:
+
+            def _deletions() -> Iterator[str]:
+                for change, line in changes:
+                    if change == "-":
+                        stats.deleted += 1
+                        yield line
+                    else:
+                        stats.inserted += 1
+                        insertions.write(line)
+
+            _write_operations(f, "DELETE DATA", _deletions(), chunk_size)
+
+            insertions.seek(0)
+            _write_operations(f, "INSERT DATA", insertions, chunk_size)
+
+    return stats
+
+
+def compute_delta(
+    ntriples_file: Path, snapshot_file: Path, changeset_file: Path
+) -> DeltaStats:
+    """Diff an N-Triples output against the snapshot of the previous run.
+
+    Writes the changeset to changeset_file and replaces the snapshot
+    with the sorted N-Triples of the current output.
+    If no snapshot exists, all triples are insertions.
+    """
+    snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+    sorted_file = snapshot_file.with_suffix(".sorted.tmp")
+
+    with open(ntriples_file, encoding="utf-8") as f:
+        external_sort(f, sorted_file)
+
+    with ExitStack() as stack:
+        old_lines: Iterable[str] = (
+            stack.enter_context(open(snapshot_file, encoding="utf-8"))
+            if snapshot_file.exists()
+            else ()
+        )
+        new_lines = stack.enter_context(open(sorted_file, encoding="utf-8"))
+
+        stats = write_changeset(diff_sorted(old_lines, new_lines), changeset_file)
+
+    sorted_file.replace(snapshot_file)
+
+    return stats
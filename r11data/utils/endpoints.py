@@ -0,0 +1,30 @@
+"""SPARQL endpoints queried by R11Data runners.
+
+Endpoints are looked up by name at call time,
+so they can be redirected (e.g. to a local stand-in) with override_endpoints.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+endpoints: dict[str, str] = {
+    "releven": "https://graphdb.r11.eu/repositories/RELEVEN",
+    "releven_statements": "https://graphdb.r11.eu/repositories/RELEVEN/statements",
+    "releven_2025": "https://graphdb.r11.eu/repositories/RELEVEN_2025",
+    "saws": "https://ancientwisdoms.ac.uk/sesame/repositories/saws",
+}
+
+
+@contextmanager
+def override_endpoints(**overrides: str) -> Iterator[None]:
+    """Temporarily redirect named endpoints."""
+    if unknown := overrides.keys() - endpoints.keys():
+        raise KeyError(f"Unknown endpoints: {sorted(unknown)}.")
+
+    previous = {name: endpoints[name] for name in overrides}
+    endpoints.update(overrides)
+    try:
+        yield
+    finally:
+        endpoints.update(previous)
@@ -0,0 +1,77 @@
+"""Import-time budget check for R11Data modules.
+
+Measures the import time of a module in a fresh interpreter using 'python -X importtime'
+and fails if it exceeds a budget, e.g.
+
+    python -m r11data.utils.import_budget r11data.main --budget 0.5
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+
+_importtime_pattern = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure_import_time(module: str) -> list[tuple[str, float, int]]:
+    """Import module in a fresh interpreter and get (module, seconds, depth) triples.
+
+    Seconds are cumulative, i.e. include nested imports;
+    depth 0 denotes imports at the top level of the import tree.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    timings = []
+    for line in result.stderr.splitlines():
+        match = _importtime_pattern.match(line)
+        if match is None:
+            continue
+
+        _, cumulative, indent, name = match.groups()
+        timings.append((name, int(cumulative) / 1e6, (len(indent) - 1) // 2))
+
+    return timings
+
+
+def check_import_budget(module: str, budget: float, top: int = 5) -> bool:
+    """Check that importing module takes at most budget seconds.
+
+    The slowest direct dependencies are reported.
+    """
+    timings = measure_import_time(module)
+    total = sum(seconds for _, seconds, depth in timings if depth == 0)
+    offenders = sorted(
+        ((name, seconds) for name, seconds, depth in timings if depth == 1),
+        key=lambda t: t[1],
+        reverse=True,
+    )
+
+    print(f"Importing '{module}' took {total:.3f}s (budget: {budget:.3f}s).")
+    for name, seconds in offenders[:top]:
+        print(f"    {name}: {seconds:.3f}s")
+
+    return total <= budget
+
+
+parser = argparse.ArgumentParser(
+    prog="import_budget",
+    description="Check the import time of modules against a budget.",
+)
+parser.add_argument("modules", nargs="+")
+parser.add_argument("--budget", type=float, default=0.5, help="Budget in seconds.")
+
+
+if __name__ == "__main__":
+    parsed_args = parser.parse_args()
+    results = [
+        check_import_budget(module, parsed_args.budget)
+        for module in parsed_args.modules
+    ]
+    sys.exit(not all(results))
@@ -0,0 +1,46 @@
+"""URI minting for R11Data runners."""
+
+from collections.abc import Mapping
+import json
+from uuid import NAMESPACE_URL, uuid1, uuid5
+
+
+_namespace = uuid5(NAMESPACE_URL, "https://r11.eu/rdf/")
+
+
+def _canonical(value: object) -> str:
+    """Get a canonical string representation for content-derived minting."""
+    if isinstance(value, Mapping):
+        return json.dumps(sorted(value.items()), default=str, ensure_ascii=False)
+    return str(value)
+
+
+class Minter:
+    """Minter for URI path segments.
+
+    By default, segments are random (uuid1);
+    if deterministic is True, segments are derived from the content passed to the minter,
+    so that identical input yields identical URIs across runs.
+    Content should identify the node, e.g. a role name and the row data it is derived from.
+    """
+
+    def __init__(self, deterministic: bool = False) -> None:
+        self.deterministic = deterministic
+
+    def __call__(self, *content: object) -> str:
+        """Mint a URI path segment."""
+        if not self.deterministic:
+            return str(uuid1())
+        return str(uuid5(_namespace, "\x1f".join(map(_canonical, content))))
+
+    def hash_value(self, *content: object) -> str | None:
+        """Get a hash value for lodkit mkuri callables.
+
+        Returns None (i.e. a random URI) unless deterministic is True.
+        """
+        if not self.deterministic:
+            return None
+        return "\x1f".join(map(_canonical, content))
+
+
+minter = Minter()
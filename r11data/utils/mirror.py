@@ -0,0 +1,146 @@
+"""Local mirror endpoints for R11Data runners.
+
+A MirrorStore loads RDF dumps of a repository into an in-memory, indexed rdflib store
+and evaluates SPARQL queries in-process. Mounted mirrors are queried through
+the shared SPARQLClient like remote endpoints, e.g.
+
+    mount_mirror(MirrorStore(Path("releven.nt")), "releven", "releven_2025")
+
+redirects all RELEVEN queries of the runners to the dump.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+import pickle
+import tempfile
+import threading
+from typing import cast
+
+from loguru import logger
+from r11data.utils.endpoints import endpoints
+from r11data.utils.paths import cache
+from r11data.utils.sparql_client import SPARQLClient, sparql_client
+from rdflib import Dataset
+from rdflib.util import guess_format
+
+
+_graph_formats: dict[str, str] = {
+    "text/turtle": "turtle",
+    "application/n-triples": "nt",
+    "application/rdf+xml": "xml",
+    "application/ld+json": "json-ld",
+}
+
+_result_formats: dict[str, str] = {
+    "application/sparql-results+json": "json",
+    "application/sparql-results+xml": "xml",
+    "text/csv": "csv",
+}
+
+
+class MirrorStore:
+    """In-process SPARQL endpoint over RDF dumps.
+
+    Dumps (N-Triples, Turtle, N-Quads, TriG, ...; formats are guessed from file suffixes)
+    are loaded lazily into a Dataset with default_union,
+    i.e. like GraphDB, the default graph is the union of all named graphs.
+    Loaded stores are snapshotted to snapshot_dir (keyed by dump paths, sizes and mtimes),
+    so subsequent loads skip parsing.
+    """
+
+    def __init__(
+        self,
+        *dumps: Path,
+        snapshot_dir: Path | None = cast(Path, cache) / "mirrors",
+    ) -> None:
+        self.dumps = dumps
+        self.snapshot_dir = snapshot_dir
+
+        self._dataset: Dataset | None = None
+        self._lock = threading.Lock()
+
+    def _snapshot_file(self) -> Path | None:
+        if self.snapshot_dir is None:
+            return None
+
+        key = hashlib.sha256()
+        for dump in self.dumps:
+            stat = dump.stat()
+            key.update(f"{dump.resolve()}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+        return self.snapshot_dir / f"{key.hexdigest()[:16]}.pickle"
+
+    def _load(self) -> Dataset:
+        snapshot_file = self._snapshot_file()
+
+        if snapshot_file is not None and snapshot_file.exists():
+            with open(snapshot_file, "rb") as f:
+                return pickle.load(f)
+
+        dataset = Dataset(default_union=True)
+        for dump in self.dumps:
+            logger.info(f"Loading mirror dump '{dump}'.")
+            dataset.parse(dump, format=guess_format(str(dump)))
+
+        if snapshot_file is not None:
+            snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            # unique temp file: concurrent processes may snapshot the same dumps
+            with tempfile.NamedTemporaryFile(
+                dir=snapshot_file.parent, suffix=".tmp", delete=False
+            ) as f:
+                pickle.dump(dataset, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, snapshot_file)
+
+        return dataset
+
+    @property
+    def dataset(self) -> Dataset:
+        """Lazily load the dumps (or their snapshot)."""
+        with self._lock:
+            if self._dataset is None:
+                self._dataset = self._load()
+            return self._dataset
+
+    def query(
+        self, query: str, accept: str = "application/sparql-results+json"
+    ) -> bytes:
+        """Evaluate a SPARQL query and serialize the result as a response body.
+
+        SELECT/ASK results are serialized according to accept (default: JSON),
+        CONSTRUCT/DESCRIBE results as RDF (default: Turtle).
+        """
+        dataset = self.dataset
+
+        with self._lock:
+            result = dataset.query(query)
+
+            if result.type in ("CONSTRUCT", "DESCRIBE"):
+                output_format = _graph_formats.get(accept, "turtle")
+            else:
+                output_format = _result_formats.get(accept, "json")
+
+            return cast(bytes, result.serialize(format=output_format))
+
+    def update(self, update: str) -> None:
+        """Apply a SPARQL Update to the loaded store.
+
+        Updates are not written back to the dumps or the snapshot.
+        """
+        dataset = self.dataset
+
+        with self._lock:
+            dataset.update(update)
+
+
+def mount_mirror(
+    store: MirrorStore, *names: str, client: SPARQLClient = sparql_client
+) -> str:
+    """Mount store on client and redirect the named endpoints (see endpoints) to it."""
+    url = f"mirror://{'+'.join(names) or 'default'}"
+
+    client.mirrors[url] = store
+    for name in names:
+        endpoints[name] = url
+
+    return url
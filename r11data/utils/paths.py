@@ -7,6 +7,7 @@ from importlib.resources.abc import Traversable
 r11data_base_path = files("r11data")
 
 env_path = r11data_base_path / "../.env"
+cache = r11data_base_path / "../.cache"
 
 output: Traversable = files("r11data.output")
 
@@ -0,0 +1,265 @@
+"""Progress reporting for R11Data runners.
+
+Runners report rows per task (e.g. per converter) to the global ProgressReporter;
+SPARQL requests in flight are tracked by the SPARQLClient.
+If enabled, live displays a rich progress view while the enclosed block runs;
+a throughput summary can be printed after the run.
+
+rich is imported lazily, so reporting adds no import-time cost.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import logging
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger as loguru_logger
+from r11data.utils.sparql_cache import sparql_cache
+
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress, TaskID
+    from rich.table import Table
+
+
+@dataclass
+class TaskStats:
+    """Counters of a progress task.
+
+    Skipped rows are rows excluded by rules, failed rows are rows
+    for which no triples could be generated (e.g. URI lookups returned empty).
+    """
+
+    name: str
+    total: int | None = None
+    rows: int = 0
+    triples: int = 0
+    skipped: int = 0
+    failed: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    finished: float | None = None
+
+    @property
+    def seconds(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def rate(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class ProgressReporter:
+    """Collector and (optionally) live display of runner progress."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+
+        self.tasks: list[TaskStats] = []
+        self.current: TaskStats | None = None
+        self.queries_in_flight = 0
+        self.queries = 0
+
+        self._progress: Progress | None = None
+        self._task_ids: dict[int, TaskID] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def task(self, name: str, total: int | None = None) -> Iterator[TaskStats]:
+        """Report rows of the enclosed block as a task."""
+        stats = TaskStats(name, total)
+        self.tasks.append(stats)
+        self.current = stats
+
+        if self._progress is not None:
+            self._task_ids[id(stats)] = self._progress.add_task(
+                name, total=total, **self._fields(stats)
+            )
+
+        try:
+            yield stats
+        finally:
+            stats.finished = time.perf_counter()
+            self.current = None
+            self._refresh(stats)
+
+    def advance(self, triples: int = 0) -> None:
+        """Count a processed row of the current task and its triples."""
+        if (stats := self.current) is None:
+            return
+
+        with self._lock:
+            stats.rows += 1
+            stats.triples += triples
+        self._refresh(stats)
+
+    def skip(self) -> None:
+        """Count a skipped row of the current task."""
+        if (stats := self.current) is not None:
+            with self._lock:
+                stats.skipped += 1
+
+    def fail(self) -> None:
+        """Count a failed row of the current task."""
+        if (stats := self.current) is not None:
+            with self._lock:
+                stats.failed += 1
+
+    @contextmanager
+    def query(self) -> Iterator[None]:
+        """Track a SPARQL request in flight."""
+        with self._lock:
+            self.queries_in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.queries_in_flight -= 1
+                self.queries += 1
+
+    @staticmethod
+    def _fields(stats: TaskStats) -> dict[str, Any]:
+        return {
+            "triples": stats.triples,
+            "skipped": stats.skipped,
+            "failed": stats.failed,
+            "rate": stats.rate,
+        }
+
+    def _refresh(self, stats: TaskStats) -> None:
+        if self._progress is None or (task_id := self._task_ids.get(id(stats))) is None:
+            return
+
+        self._progress.update(
+            task_id, completed=stats.rows, refresh=False, **self._fields(stats)
+        )
+
+    def status(self) -> str:
+        """Get a status line of SPARQL requests and cache hit rate."""
+        lookups = sparql_cache.hits + sparql_cache.misses
+        hit_rate = f"{sparql_cache.hits / lookups:.0%}" if lookups else "-"
+        triples = sum(stats.triples for stats in self.tasks)
+
+        return (
+            f"SPARQL: {self.queries_in_flight} in flight, {self.queries} done, "
+            f"cache hit rate {hit_rate} | {triples} triples emitted"
+        )
+
+    @contextmanager
+    def live(self, console: "Console | None" = None) -> Iterator[None]:
+        """Display live progress for the enclosed block (if enabled)."""
+        if not self.enabled:
+            yield
+            return
+
+        from rich.progress import (
+            BarColumn,
+            MofNCompleteColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            TimeRemainingColumn,
+        )
+
+        reporter = self
+
+        class _Progress(Progress):
+            def get_renderables(self):
+                yield from super().get_renderables()
+                yield reporter.status()
+
+        progress = _Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("{task.fields[rate]:.1f} rows/s"),
+            TextColumn("{task.fields[triples]} triples"),
+            TextColumn("{task.fields[skipped]} skipped, {task.fields[failed]} failed"),
+            TimeRemainingColumn(),
+            console=console,
+            redirect_stderr=True,
+            redirect_stdout=True,
+        )
+
+        _route_loguru_stderr()
+        with progress:
+            self._progress = progress
+            try:
+                yield
+            finally:
+                self._progress = None
+                self._task_ids.clear()
+
+    def summary_table(self) -> "Table":
+        """Get a throughput summary table of all tasks."""
+        from rich.table import Table
+
+        table = Table(title="Throughput", caption=self.status())
+        for column in ("task", "rows", "skipped", "failed", "triples", "seconds"):
+            table.add_column(column, justify="left" if column == "task" else "right")
+        table.add_column("rows/s", justify="right")
+
+        for stats in self.tasks:
+            table.add_row(
+                stats.name,
+                str(stats.rows),
+                str(stats.skipped),
+                str(stats.failed),
+                str(stats.triples),
+                f"{stats.seconds:.1f}",
+                f"{stats.rate:.1f}",
+            )
+
+        return table
+
+
+class StderrHandler(logging.StreamHandler):
+    """Stream handler writing to sys.stderr as of write time.
+
+    Stream handlers hold the stream they were created with;
+    rich.live only captures writes to the (replaced) sys.stderr,
+    so their log records would otherwise garble the live display.
+    """
+
+    @property  # type: ignore[override]
+    def stream(self) -> Any:  # noqa: D102
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, stream: Any) -> None:
+        pass
+
+
+def _stderr_sink(message: str) -> None:
+    """Loguru sink writing to sys.stderr as of write time (see StderrHandler)."""
+    sys.stderr.write(message)
+
+
+_loguru_routed = False
+
+
+def _route_loguru_stderr() -> None:
+    """Route loguru's pre-configured stderr handler through _stderr_sink (once).
+
+    The pre-configured handler (documented to have id 0) is replaced
+    by a sink with loguru's default level and format; if it has already been
+    removed, loguru is configured elsewhere and is left untouched.
+    """
+    global _loguru_routed
+    if _loguru_routed:
+        return
+    _loguru_routed = True
+
+    try:
+        loguru_logger.remove(0)
+    except ValueError:
+        return
+    loguru_logger.add(_stderr_sink, colorize=sys.stderr.isatty())
+
+
+progress = ProgressReporter()
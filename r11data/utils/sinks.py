@@ -0,0 +1,138 @@
+"""Streaming triple sinks for R11Data runners."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import IO, Literal, Self
+
+from lodkit import _Triple
+from rdflib import Graph, Namespace, URIRef
+from rdflib import Literal as RDFLiteral
+from rdflib.namespace import NamespaceManager
+from toolz import groupby
+
+
+_OutputFormat = Literal["turtle", "nt"]
+
+
+def _nt_literal(literal: RDFLiteral) -> str:
+    """Get the N-Triples form of a literal.
+
+    Unlike Literal.n3, lexical forms are always escaped onto a single line.
+    """
+    lexical = (
+        str(literal)
+        .replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace('"', '\\"')
+        .replace("\r", "\\r")
+    )
+
+    if literal.language:
+        return f'"{lexical}"@{literal.language}'
+    if literal.datatype:
+        return f'"{lexical}"^^<{literal.datatype}>'
+    return f'"{lexical}"'
+
+
+def nt_line(triple: _Triple) -> str:
+    """Format a triple as an N-Triples line (incl. the line break)."""
+    subject, predicate, obj = triple
+    _obj = _nt_literal(obj) if isinstance(obj, RDFLiteral) else obj.n3()
+    return f"{subject.n3()} {predicate.n3()} {_obj} .\n"
+
+
+class TripleSink(ABC):
+    """ABC for incremental triple writers.
+
+    Sinks are context managers; triples passed to write are written immediately,
+    so memory consumption is bounded by the size of a single write call.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file: IO[str] | None = None
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def file(self) -> IO[str]:
+        if self._file is None:
+            raise RuntimeError(f"{type(self).__name__} for '{self.path}' is not open.")
+        return self._file
+
+    def open(self) -> None:
+        """Open the output file and write a header if applicable."""
+        self._file = open(self.path, "w", encoding="utf-8")
+
+    def close(self) -> None:
+        """Flush and close the output file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @abstractmethod
+    def write(self, triples: Iterable[_Triple]) -> None:
+        raise NotImplementedError
+
+
+class NTriplesSink(TripleSink):
+    """Sink for writing N-Triples."""
+
+    def write(self, triples: Iterable[_Triple]) -> None:
+        """Write triples as N-Triples lines."""
+        self.file.writelines(map(nt_line, triples))
+
+
+class TurtleSink(TripleSink):
+    """Sink for writing prefix-compacted Turtle.
+
+    Prefixes must be known in advance since they are written as a header;
+    triples of a single write call are grouped by subject.
+    """
+
+    def __init__(self, path: Path, namespaces: Mapping[str, Namespace | str]) -> None:
+        super().__init__(path)
+
+        self.namespace_manager = NamespaceManager(Graph(), bind_namespaces="none")
+        for prefix, namespace in namespaces.items():
+            self.namespace_manager.bind(prefix, URIRef(namespace))
+
+    def open(self) -> None:
+        """Open the output file and write the prefix header."""
+        super().open()
+
+        for prefix, namespace in sorted(self.namespace_manager.namespaces()):
+            self.file.write(f"@prefix {prefix}: <{namespace}> .\n")
+        self.file.write("\n")
+
+    def write(self, triples: Iterable[_Triple]) -> None:
+        """Write triples as Turtle statements grouped by subject."""
+        n3 = self.namespace_manager
+
+        for subject, subject_triples in groupby(lambda t: t[0], triples).items():
+            predicate_objects = " ;\n    ".join(
+                f"{p.n3(n3)} {o.n3(n3)}" for _, p, o in subject_triples
+            )
+            self.file.write(f"{subject.n3(n3)} {predicate_objects} .\n\n")
+
+
+output_suffixes: dict[_OutputFormat, str] = {"turtle": ".ttl", "nt": ".nt"}
+
+
+def make_sink(
+    path: Path, output_format: _OutputFormat, namespaces: Mapping[str, Namespace]
+) -> TripleSink:
+    """Construct a TripleSink for an output format."""
+    match output_format:
+        case "turtle":
+            return TurtleSink(path, namespaces)
+        case "nt":
+            return NTriplesSink(path)
+        case _:
+            raise ValueError(f"Unknown output format '{output_format}'.")
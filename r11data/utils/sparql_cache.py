@@ -0,0 +1,223 @@
+"""Persistent on-disk SPARQL response cache for R11Data runners."""
+
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+import hashlib
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import IO, cast
+
+from r11data.utils.paths import cache
+
+
+class CacheMode(StrEnum):
+    """Cache modes.
+
+    - use: answer from the cache if possible, store responses otherwise
+    - bypass: neither read from nor write to the cache
+    - refresh: always query the endpoint and overwrite cached responses
+    """
+
+    use = "use"
+    bypass = "bypass"
+    refresh = "refresh"
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a SPARQL query for cache key generation.
+
+    Strips leading/trailing whitespace per line and drops empty lines,
+    so that template indentation does not affect cache keys.
+    Whitespace within lines (e.g. in literals) is left untouched.
+    """
+    lines = (line.strip() for line in query.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def cache_key(endpoint: str, query: str, variant: str = "") -> str:
+    """Compute a content-addressed cache key for an endpoint/query pair.
+
+    The variant argument allows to distinguish e.g. different return formats.
+    """
+    content = "\n".join((endpoint, variant, normalize_query(query)))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class SPARQLCache:
+    """SQLite-backed SPARQL response cache with TTL and size-based (LRU) eviction.
+
+    Responses are stored as raw bytes; the database connection is opened lazily.
+    The database is opened in WAL mode, so concurrent runner processes can share it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl: float = 7 * 24 * 60 * 60,
+        max_size: int = 512 * 1024**2,
+        mode: CacheMode = CacheMode.use,
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self.mode = mode
+
+        self.hits = 0
+        self.misses = 0
+
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Lazily open the SQLite database and create the responses table."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False
+            )
+            self._connection.execute("pragma journal_mode=wal")
+            self._connection.execute(
+                "create table if not exists responses ("
+                "key text primary key, endpoint text, body blob, "
+                "size integer, created real, accessed real)"
+            )
+        return self._connection
+
+    def get(self, key: str) -> bytes | None:
+        """Get a cached response body; expired entries are deleted."""
+        with self._lock, self.connection as connection:
+            row = connection.execute(
+                "select body, created from responses where key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            body, created = row
+            now = time.time()
+
+            if now - created > self.ttl:
+                connection.execute("delete from responses where key = ?", (key,))
+                return None
+
+            connection.execute(
+                "update responses set accessed = ? where key = ?", (now, key)
+            )
+            return body
+
+    def set(self, key: str, endpoint: str, body: bytes) -> None:
+        """Store a response body and evict least recently accessed entries."""
+        now = time.time()
+
+        with self._lock, self.connection as connection:
+            connection.execute(
+                "insert or replace into responses values (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, body, len(body), now, now),
+            )
+            self._evict(connection)
+
+    def set_file(
+        self, key: str, endpoint: str, file: IO[bytes], chunk_size: int = 1024**2
+    ) -> None:
+        """Store a response body from a (binary) file object, e.g. a spooled response.
+
+        The body is copied in chunks with incremental blob I/O,
+        so it is never held in memory as a whole.
+        """
+        size = file.seek(0, os.SEEK_END)
+        file.seek(0)
+        now = time.time()
+
+        with self._lock, self.connection as connection:
+            cursor = connection.execute(
+                "insert or replace into responses values (?, ?, zeroblob(?), ?, ?, ?)",
+                (key, endpoint, size, size, now, now),
+            )
+            with connection.blobopen("responses", "body", cursor.lastrowid) as blob:
+                while chunk := file.read(chunk_size):
+                    blob.write(chunk)
+
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete expired entries and LRU entries exceeding max_size."""
+        connection.execute(
+            "delete from responses where created < ?", (time.time() - self.ttl,)
+        )
+
+        (total_size,) = connection.execute(
+            "select coalesce(sum(size), 0) from responses"
+        ).fetchone()
+
+        if total_size <= self.max_size:
+            return
+
+        for key, size in connection.execute(
+            "select key, size from responses order by accessed asc"
+        ).fetchall():
+            connection.execute("delete from responses where key = ?", (key,))
+            total_size -= size
+            if total_size <= self.max_size:
+                break
+
+    def clear(self) -> None:
+        """Delete all cached responses."""
+        with self._lock, self.connection as connection:
+            connection.execute("delete from responses")
+
+    def fetch(
+        self,
+        endpoint: str,
+        query: str,
+        fetch: Callable[[], bytes],
+        variant: str = "",
+    ) -> bytes:
+        """Get a response body from the cache or run fetch and cache its result.
+
+        Behavior depends on the cache mode, see CacheMode.
+        """
+        if self.mode == CacheMode.bypass:
+            return fetch()
+
+        key = cache_key(endpoint, query, variant)
+
+        if self.mode == CacheMode.use and (body := self.get(key)) is not None:
+            self.hits += 1
+            return body
+
+        self.misses += 1
+        body = fetch()
+        self.set(key, endpoint, body)
+
+        return body
+
+    async def afetch(
+        self,
+        endpoint: str,
+        query: str,
+        fetch: Callable[[], Awaitable[bytes]],
+        variant: str = "",
+    ) -> bytes:
+        """Async version of SPARQLCache.fetch for coroutine fetch callables."""
+        if self.mode == CacheMode.bypass:
+            return await fetch()
+
+        key = cache_key(endpoint, query, variant)
+
+        if self.mode == CacheMode.use and (body := self.get(key)) is not None:
+            self.hits += 1
+            return body
+
+        self.misses += 1
+        body = await fetch()
+        self.set(key, endpoint, body)
+
+        return body
+
+
+sparql_cache = SPARQLCache(cast(Path, cache) / "sparql.sqlite")
@@ -0,0 +1,416 @@
+"""Shared pooled SPARQL client for R11Data runners."""
+
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import json
+import re
+import tempfile
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+from loguru import logger
+import r11data
+from r11data.utils.progress import progress
+from r11data.utils.sparql_cache import (
+    CacheMode,
+    SPARQLCache,
+    cache_key,
+    sparql_cache,
+)
+from r11data.utils.tracing import tracer
+
+
+if TYPE_CHECKING:
+    from r11data.utils.mirror import MirrorStore
+
+
+_Auth = tuple[str, str] | Callable[[], tuple[str, str]] | None
+
+# streamed responses are spooled to disk for caching beyond this size
+_max_spool_memory = 8 * 1024**2
+
+
+_prefix_pattern = re.compile(
+    r"^\s*prefix\s+\S*\s*<[^>]*>", re.IGNORECASE | re.MULTILINE
+)
+
+
+def _cache_variant(accept: str, params: dict | None) -> str:
+    """Get the cache key variant for a response format and additional form parameters.
+
+    Responses to the same query with different params (e.g. 'infer') are cached apart.
+    """
+    if not params:
+        return accept
+    return f"{accept}\n{json.dumps(params, sort_keys=True)}"
+
+
+def _query_excerpt(query: str, length: int = 500) -> str:
+    """Get a whitespace-normalized query excerpt without prefixes for trace spans."""
+    return " ".join(_prefix_pattern.sub("", query).split())[:length]
+
+
+def _resolve_auth(auth: _Auth) -> tuple[str, str] | None:
+    """Resolve lazy credentials, i.e. callables returning (user, password)."""
+    return auth() if callable(auth) else auth
+
+
+class SPARQLClient:
+    """Pooled SPARQL protocol client.
+
+    Queries are sent as form-encoded POST requests over keep-alive connection pools
+    (one sync, one async; both created lazily) with gzip negotiation.
+    Server errors (5xx) and transport errors (e.g. connection resets, timeouts)
+    are retried with exponential backoff; responses are routed through a SPARQLCache.
+
+    Endpoints registered in mirrors are answered (and updated) in-process
+    by a MirrorStore (uncached, see r11data.utils.mirror).
+    Credentials can be passed lazily as a callable (e.g. graphdb_auth),
+    so they are only resolved for requests which actually go over the network.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 300,
+        retries: int = 3,
+        backoff: float = 1,
+        max_connections: int = 10,
+        cache: SPARQLCache = sparql_cache,
+    ) -> None:
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_connections = max_connections
+        self.cache = cache
+
+        self.mirrors: dict[str, MirrorStore] = {}
+
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+
+    def _client_kwargs(self) -> dict:
+        return {
+            "timeout": self.timeout,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            "headers": {"Accept-Encoding": "gzip"},
+        }
+
+    @property
+    def client(self) -> httpx.Client:
+        """Lazily create the pooled sync httpx.Client."""
+        if self._client is None:
+            self._client = httpx.Client(**self._client_kwargs())
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Lazily create the pooled httpx.AsyncClient.
+
+        Note that the async client is bound to the event loop it is first used in.
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(**self._client_kwargs())
+        return self._async_client
+
+    def close(self) -> None:
+        """Close the sync connection pool."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Close the async connection pool."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    @staticmethod
+    def _is_retryable(exception: Exception) -> bool:
+        """Check if an exception indicates a transient failure."""
+        if isinstance(exception, httpx.HTTPStatusError):
+            return exception.response.status_code >= 500
+        return isinstance(exception, httpx.TransportError)
+
+    def _retry_delay(self, attempt: int, endpoint: str, exception: Exception) -> float:
+        delay = self.backoff * 2**attempt
+        logger.warning(
+            f"SPARQL request to '{endpoint}' failed ({exception!r}); "
+            f"retrying in {delay}s [{attempt + 1}/{self.retries}]."
+        )
+        return delay
+
+    def _send(
+        self, method: str, endpoint: str, auth: tuple[str, str] | None, **kwargs
+    ) -> httpx.Response:
+        attempt = 0
+
+        while True:
+            try:
+                response = self.client.request(method, endpoint, auth=auth, **kwargs)
+                response.raise_for_status()
+                return response
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                if attempt == self.retries or not self._is_retryable(e):
+                    raise
+                time.sleep(self._retry_delay(attempt, endpoint, e))
+                attempt += 1
+
+    def _post(
+        self, endpoint: str, data: dict, headers: dict, auth: tuple[str, str] | None
+    ) -> bytes:
+        response = self._send("POST", endpoint, auth, data=data, headers=headers)
+        return response.content
+
+    async def _apost(
+        self, endpoint: str, data: dict, headers: dict, auth: tuple[str, str] | None
+    ) -> bytes:
+        attempt = 0
+
+        while True:
+            try:
+                response = await self.async_client.post(
+                    endpoint, data=data, headers=headers, auth=auth
+                )
+                response.raise_for_status()
+                return response.content
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                if attempt == self.retries or not self._is_retryable(e):
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt, endpoint, e))
+                attempt += 1
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        auth: _Auth = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request (e.g. a store update) over the pooled client with retries.
+
+        Additional kwargs are passed to httpx.Client.request; responses are not cached.
+        """
+        return self._send(method, endpoint, _resolve_auth(auth), **kwargs)
+
+    def update(self, endpoint: str, update: str, *, auth: _Auth = None) -> None:
+        """Run a SPARQL Update request against an update endpoint.
+
+        E.g. GraphDB's '/repositories/<id>/statements'; updates are never cached.
+        """
+        with (
+            tracer.span(
+                "sparql update",
+                "query",
+                endpoint=endpoint,
+                query=_query_excerpt(update),
+            ),
+            progress.query(),
+        ):
+            if (mirror := self.mirrors.get(endpoint)) is not None:
+                mirror.update(update)
+                return
+
+            self._send(
+                "POST",
+                endpoint,
+                _resolve_auth(auth),
+                content=update.encode("utf-8"),
+                headers={"Content-Type": "application/sparql-update"},
+            )
+
+    @contextmanager
+    def _open_stream(
+        self, endpoint: str, data: dict, headers: dict, auth: tuple[str, str] | None
+    ) -> Iterator[httpx.Response]:
+        """Open a streamed POST response.
+
+        Only opening the response (i.e. until headers are received) is retried.
+        """
+        attempt = 0
+
+        while True:
+            request = self.client.build_request(
+                "POST", endpoint, data=data, headers=headers
+            )
+            try:
+                response = self.client.send(request, auth=auth, stream=True)
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError:
+                    response.close()
+                    raise
+                break
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                if attempt == self.retries or not self._is_retryable(e):
+                    raise
+                time.sleep(self._retry_delay(attempt, endpoint, e))
+                attempt += 1
+
+        try:
+            yield response
+        finally:
+            response.close()
+
+    def query(
+        self,
+        endpoint: str,
+        query: str,
+        *,
+        accept: str = "application/sparql-results+json",
+        auth: _Auth = None,
+        params: dict | None = None,
+        cached: bool = True,
+    ) -> bytes:
+        """Run a SPARQL query against an endpoint and return the raw response body.
+
+        Additional form parameters for the request can be passed as params;
+        they are part of the cache key. If cached is False, the response cache is bypassed (e.g. for queries
+        whose results change with updates of the same run).
+        """
+        with (
+            tracer.span(
+                "sparql query", "query", endpoint=endpoint, query=_query_excerpt(query)
+            ),
+            progress.query(),
+        ):
+            if (mirror := self.mirrors.get(endpoint)) is not None:
+                return mirror.query(query, accept)
+
+            data = {**(params or {}), "query": query}
+            headers = {"Accept": accept}
+
+            if not cached:
+                return self._post(endpoint, data, headers, _resolve_auth(auth))
+
+            return self.cache.fetch(
+                endpoint,
+                query,
+                lambda: self._post(endpoint, data, headers, _resolve_auth(auth)),
+                _cache_variant(accept, params),
+            )
+
+    async def aquery(
+        self,
+        endpoint: str,
+        query: str,
+        *,
+        accept: str = "application/sparql-results+json",
+        auth: _Auth = None,
+        params: dict | None = None,
+        cached: bool = True,
+    ) -> bytes:
+        """Async version of SPARQLClient.query; responses share the same cache."""
+        with (
+            tracer.span(
+                "sparql query", "query", endpoint=endpoint, query=_query_excerpt(query)
+            ),
+            progress.query(),
+        ):
+            if (mirror := self.mirrors.get(endpoint)) is not None:
+                return mirror.query(query, accept)
+
+            data = {**(params or {}), "query": query}
+            headers = {"Accept": accept}
+
+            if not cached:
+                return await self._apost(endpoint, data, headers, _resolve_auth(auth))
+
+            return await self.cache.afetch(
+                endpoint,
+                query,
+                lambda: self._apost(endpoint, data, headers, _resolve_auth(auth)),
+                _cache_variant(accept, params),
+            )
+
+    def stream(
+        self,
+        endpoint: str,
+        query: str,
+        *,
+        accept: str = "application/sparql-results+json",
+        auth: _Auth = None,
+        params: dict | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[bytes]:
+        """Run a SPARQL query against an endpoint and stream the raw response body.
+
+        Chunks are yielded as they arrive, so consumers can start processing
+        before the response is complete. Cached responses are yielded as a single chunk;
+        a streamed response is spooled to a temporary file (instead of being buffered
+        in memory) and only cached once it has been consumed completely.
+        Responses larger than the cache size are not cached.
+        """
+        with (
+            tracer.span(
+                "sparql stream", "query", endpoint=endpoint, query=_query_excerpt(query)
+            ),
+            progress.query(),
+        ):
+            yield from self._stream(
+                endpoint,
+                query,
+                accept=accept,
+                auth=auth,
+                params=params,
+                chunk_size=chunk_size,
+            )
+
+    def _stream(
+        self,
+        endpoint: str,
+        query: str,
+        *,
+        accept: str = "application/sparql-results+json",
+        auth: _Auth = None,
+        params: dict | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[bytes]:
+        if (mirror := self.mirrors.get(endpoint)) is not None:
+            yield mirror.query(query, accept)
+            return
+
+        data = {**(params or {}), "query": query}
+        headers = {"Accept": accept}
+        cache = self.cache
+        key = None
+
+        if cache.mode != CacheMode.bypass:
+            key = cache_key(endpoint, query, _cache_variant(accept, params))
+
+            if cache.mode == CacheMode.use and (body := cache.get(key)) is not None:
+                cache.hits += 1
+                yield body
+                return
+
+            cache.misses += 1
+
+        with tempfile.SpooledTemporaryFile(max_size=_max_spool_memory) as spool:
+            with self._open_stream(
+                endpoint, data, headers, _resolve_auth(auth)
+            ) as response:
+                for chunk in response.iter_bytes(chunk_size):
+                    if key is not None:
+                        if spool.tell() + len(chunk) > cache.max_size:
+                            # responses exceeding the cache size are not cached
+                            key = None
+                        else:
+                            spool.write(chunk)
+                    yield chunk
+
+            if key is not None:
+                cache.set_file(key, endpoint, spool)
+
+
+def graphdb_auth() -> tuple[str, str]:
+    """Get GraphDB credentials from Settings."""
+    return r11data.settings.GRAPHDB_USER, r11data.settings.GRAPHDB_PASSWD
+
+
+sparql_client = SPARQLClient()
@@ -0,0 +1,85 @@
+"""Incremental parsing of SPARQL JSON results."""
+
+from collections.abc import Iterable, Iterator
+import codecs
+import json
+import re
+
+
+_bindings_pattern = re.compile(r'"bindings"\s*:\s*\[')
+_skip_pattern = re.compile(r"[\s,]*")
+
+_decoder = json.JSONDecoder()
+
+
+def iter_raw_bindings(chunks: Iterable[bytes]) -> Iterator[dict]:
+    """Incrementally parse SPARQL JSON results and yield binding objects.
+
+    Only the current binding object is held in memory;
+    the bytes chunks can e.g. come from a streamed HTTP response.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    offset = 0  # read position in buffer
+    exhausted = False
+
+    def _read() -> bool:
+        """Append the next chunk to buffer; consumed input is dropped only here."""
+        nonlocal buffer, offset, exhausted
+        buffer = buffer[offset:]
+        offset = 0
+
+        for chunk in chunks:
+            if chunk:
+                buffer += decoder.decode(chunk)
+                return True
+        buffer += decoder.decode(b"", final=True)
+        exhausted = True
+        return False
+
+    # seek to the start of the bindings array
+    while (match := _bindings_pattern.search(buffer)) is None:
+        if exhausted:
+            raise ValueError("No 'bindings' array found in SPARQL JSON results.")
+        # keep a tail in case the key is split between chunks
+        offset = max(len(buffer) - 32, 0)
+        _read()
+
+    offset = match.end()
+
+    while True:
+        position = _skip_pattern.match(buffer, offset).end()
+
+        if position == len(buffer):
+            if exhausted:
+                raise ValueError(
+                    "Unterminated 'bindings' array in SPARQL JSON results."
+                )
+            offset = position
+            _read()
+            continue
+
+        if buffer[position] == "]":
+            # consume the remainder so that the chunk source can complete
+            for _ in chunks:
+                pass
+            return
+
+        try:
+            binding, end = _decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if exhausted:
+                raise
+            offset = position
+            _read()
+            continue
+
+        offset = end
+        yield binding
+
+
+def iter_bindings(chunks: Iterable[bytes]) -> Iterator[dict]:
+    """Incrementally parse SPARQL JSON results and yield flat bindings."""
+    for binding in iter_raw_bindings(chunks):
+        yield {k: v["value"] for k, v in binding.items()}
@@ -0,0 +1,180 @@
+"""Span/timer instrumentation for R11Data runners.
+
+Spans are recorded as Chrome trace events ('X' phase) and can be exported
+as a JSON trace file (chrome://tracing, Perfetto) with a summary attached,
+i.e. per-span totals and the slowest spans per category (e.g. rows and queries).
+
+Tracing is disabled by default; disabled spans are no-ops.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+import functools
+import heapq
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, ParamSpec, TypeVar
+
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+_null_span = nullcontext()
+
+
+class Tracer:
+    """Recorder for timed spans.
+
+    Spans have a name, a category (e.g. 'stage', 'row', 'query')
+    and optional args which are shown in trace viewers and summaries.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.events: list[dict[str, Any]] = []
+
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def span(
+        self, name: str, category: str = "stage", **args: Any
+    ) -> AbstractContextManager:
+        """Time the enclosed block as a span (if tracing is enabled)."""
+        if not self.enabled:
+            return _null_span
+        return self._span(name, category, args)
+
+    @contextmanager
+    def _span(self, name: str, category: str, args: dict[str, Any]) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+            with self._lock:
+                self.events.append(event)
+
+    def traced(
+        self,
+        name: str,
+        category: str = "stage",
+        args: Callable[..., dict[str, Any]] | None = None,
+    ) -> Callable[[Callable[P, T]], Callable[P, T]]:
+        """Decorate a callable to run in a span.
+
+        If given, args is called with the arguments of the decorated callable
+        and returns the span args.
+        """
+
+        def _decorator(f: Callable[P, T]) -> Callable[P, T]:
+            @functools.wraps(f)
+            def _wrapper(*f_args: P.args, **f_kwargs: P.kwargs) -> T:
+                if not self.enabled:
+                    return f(*f_args, **f_kwargs)
+
+                span_args = {} if args is None else args(*f_args, **f_kwargs)
+                with self._span(name, category, span_args):
+                    return f(*f_args, **f_kwargs)
+
+            return _wrapper
+
+        return _decorator
+
+    def summary(self, top: int = 20) -> dict[str, Any]:
+        """Summarize recorded spans.
+
+        'spans' holds count/total/mean/max milliseconds per span name,
+        'slowest' holds the top slowest spans per category (except 'stage').
+        """
+        with self._lock:
+            events = list(self.events)
+
+        durations: defaultdict[str, list[float]] = defaultdict(list)
+        by_category: defaultdict[str, list[dict]] = defaultdict(list)
+
+        for event in events:
+            durations[event["name"]].append(event["dur"] / 1e3)
+            if event["cat"] != "stage":
+                by_category[event["cat"]].append(event)
+
+        spans = {
+            name: {
+                "count": len(values),
+                "total_ms": sum(values),
+                "mean_ms": sum(values) / len(values),
+                "max_ms": max(values),
+            }
+            for name, values in sorted(
+                durations.items(), key=lambda item: sum(item[1]), reverse=True
+            )
+        }
+        slowest = {
+            category: [
+                {"name": e["name"], "dur_ms": e["dur"] / 1e3, "args": e["args"]}
+                for e in heapq.nlargest(top, category_events, key=lambda e: e["dur"])
+            ]
+            for category, category_events in by_category.items()
+        }
+
+        return {"spans": spans, "slowest": slowest}
+
+    def export(self, trace_file: Path, top: int = 20) -> Path:
+        """Write recorded spans as a Chrome trace file with a summary."""
+        with self._lock:
+            events = list(self.events)
+
+        trace_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(trace_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "traceEvents": events,
+                    "displayTimeUnit": "ms",
+                    "summary": self.summary(top),
+                },
+                f,
+                default=str,
+                ensure_ascii=False,
+            )
+
+        return trace_file
+
+    def clear(self) -> None:
+        """Drop recorded spans."""
+        with self._lock:
+            self.events.clear()
+            self._origin = time.perf_counter()
+
+
+tracer = Tracer()
+
+
+def format_summary(summary: dict[str, Any], top: int = 10) -> str:
+    """Format a Tracer summary as a plain-text report."""
+    lines = ["Span totals:"]
+    for name, stats in list(summary["spans"].items())[:top]:
+        lines.append(
+            f"    {name}: {stats['total_ms']:.1f}ms total, {stats['count']} spans, "
+            f"{stats['mean_ms']:.2f}ms mean, {stats['max_ms']:.1f}ms max"
+        )
+
+    for category, spans in summary["slowest"].items():
+        lines.append(f"Slowest {category} spans:")
+        for span in spans[:top]:
+            args = ", ".join(f"{k}={v}" for k, v in span["args"].items())
+            lines.append(f"    {span['dur_ms']:.1f}ms {span['name']} ({args})")
+
+    return "\n".join(lines)
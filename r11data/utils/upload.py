@@ -0,0 +1,217 @@
+"""Chunked triple uploads to triple stores.
+
+GraphStoreSink buffers triples as N-Triples lines and uploads them
+in gzip-compressed chunks, either via the SPARQL 1.1 Graph Store HTTP Protocol
+(POST application/n-triples) or as SPARQL 1.1 Update INSERT DATA requests.
+
+Chunks are uploaded concurrently while triples are still being written,
+so uploads overlap generation; at most max_workers chunks are in flight,
+further writes block until the oldest upload has finished.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import gzip
+import threading
+from typing import Literal, Self
+
+import httpx
+from lodkit import _Triple
+from r11data.utils.sinks import nt_line
+from r11data.utils.sparql_client import SPARQLClient, sparql_client
+
+
+_UploadProtocol = Literal["gsp", "update"]
+
+graph_namespace = "https://r11.eu/rdf/graph/"
+
+
+def runner_graph(name: str) -> str:
+    """Get the named graph URI for a runner."""
+    return f"{graph_namespace}{name}"
+
+
+@dataclass
+class UploadStats:
+    """Numbers of uploaded chunks and triples and of compressed bytes sent."""
+
+    chunks: int = 0
+    triples: int = 0
+    bytes: int = 0
+
+
+class GraphStoreSink:
+    """Sink for uploading triples to a triple store in gzip-compressed chunks.
+
+    For protocol "gsp", endpoint is a Graph Store Protocol service
+    (e.g. GraphDB's '/repositories/<id>/rdf-graphs/service'),
+    for protocol "update", endpoint is a SPARQL Update endpoint
+    (e.g. GraphDB's '/repositories/<id>/statements').
+
+    Triples go into graph or, if graph is None, into the default graph;
+    if clear is True, the target graph is cleared when the sink is opened.
+
+    Every chunk request is retried by the SPARQLClient on transient failures;
+    errors of failed chunks are raised by write/close.
+    Note that chunks may arrive in any order and a failed upload can leave
+    the store partially updated.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        graph: str | None = None,
+        protocol: _UploadProtocol = "gsp",
+        chunk_size: int = 50_000,
+        max_workers: int = 4,
+        clear: bool = False,
+        auth: tuple[str, str] | None = None,
+        client: SPARQLClient = sparql_client,
+        compresslevel: int = 6,
+    ) -> None:
+        self.endpoint = endpoint
+        self.graph = graph
+        self.protocol = protocol
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.clear = clear
+        self.auth = auth
+        self.client = client
+        self.compresslevel = compresslevel
+
+        self.stats = UploadStats()
+
+        self._buffer: list[str] = []
+        self._pending: deque[Future[None]] = deque()
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._abort()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            raise RuntimeError(
+                f"{type(self).__name__} for '{self.endpoint}' is not open."
+            )
+        return self._executor
+
+    def open(self) -> None:
+        """Start the upload workers and clear the target graph if applicable."""
+        self.stats = UploadStats()
+
+        if self.clear:
+            self._clear_graph()
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="r11data-upload"
+        )
+
+    def close(self) -> None:
+        """Upload remaining buffered triples and wait for all uploads."""
+        if self._executor is None:
+            return
+
+        try:
+            self._submit()
+            while self._pending:
+                self._pending.popleft().result()
+        finally:
+            self._abort()
+
+    def write(self, triples: Iterable[_Triple]) -> None:
+        """Buffer triples, submitting a chunk upload for every chunk_size triples."""
+        for triple in triples:
+            self._buffer.append(nt_line(triple))
+            if len(self._buffer) >= self.chunk_size:
+                self._submit()
+
+    def _abort(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._buffer = []
+        self._pending.clear()
+
+    def _submit(self) -> None:
+        if not self._buffer:
+            return
+
+        lines, self._buffer = self._buffer, []
+
+        while len(self._pending) >= self.max_workers:
+            self._pending.popleft().result()
+
+        self._pending.append(self.executor.submit(self._upload, lines))
+
+    def _graph_params(self) -> dict[str, str]:
+        return {"default": ""} if self.graph is None else {"graph": self.graph}
+
+    def _graph_clause(self, lines: str) -> str:
+        return lines if self.graph is None else f"GRAPH <{self.graph}> {{\n{lines}}}\n"
+
+    def _request_body(self, lines: list[str]) -> tuple[str, str]:
+        """Get the content type and request body for a chunk."""
+        match self.protocol:
+            case "gsp":
+                return "application/n-triples", "".join(lines)
+            case "update":
+                data = self._graph_clause("".join(lines))
+                return "application/sparql-update", f"INSERT DATA {{\n{data}}}\n"
+            case _:
+                raise ValueError(f"Unknown upload protocol '{self.protocol}'.")
+
+    def _upload(self, lines: list[str]) -> None:
+        content_type, body = self._request_body(lines)
+        content = gzip.compress(body.encode("utf-8"), compresslevel=self.compresslevel)
+
+        self.client.request(
+            "POST",
+            self.endpoint,
+            auth=self.auth,
+            params=self._graph_params() if self.protocol == "gsp" else None,
+            content=content,
+            headers={"Content-Type": content_type, "Content-Encoding": "gzip"},
+        )
+
+        with self._lock:
+            self.stats.chunks += 1
+            self.stats.triples += len(lines)
+            self.stats.bytes += len(content)
+
+    def _clear_graph(self) -> None:
+        match self.protocol:
+            case "gsp":
+                try:
+                    self.client.request(
+                        "DELETE",
+                        self.endpoint,
+                        auth=self.auth,
+                        params=self._graph_params(),
+                    )
+                except httpx.HTTPStatusError as e:
+                    # a graph which does not exist yet is cleared already
+                    if e.response.status_code != 404:
+                        raise
+            case "update":
+                target = "DEFAULT" if self.graph is None else f"GRAPH <{self.graph}>"
+                self.client.request(
+                    "POST",
+                    self.endpoint,
+                    auth=self.auth,
+                    content=f"CLEAR SILENT {target}".encode("utf-8"),
+                    headers={"Content-Type": "application/sparql-update"},
+                )
+            case _:
+                raise ValueError(f"Unknown upload protocol '{self.protocol}'.")
@@ -0,0 +1,147 @@
+"""Batched deaths URI resolution against per-row resolution."""
+
+from pathlib import Path
+
+import pytest
+from r11data.tabular.deaths.query_templates import (
+    editor_deaths_batch_template,
+    editor_deaths_template,
+    source_deaths_batch_template,
+    source_deaths_template,
+)
+from r11data.tabular.deaths.utils.utils import (
+    get_uris_from_service,
+    get_uris_from_service_batched,
+)
+from r11data.utils.mirror import MirrorStore
+from r11data.utils.sparql_client import sparql_client
+from rdflib import URIRef
+
+
+endpoint = "mirror://test-deaths"
+
+prefixes = """
+@prefix crm: <http://www.cidoc-crm.org/cidoc-crm/> .
+@prefix star: <https://r11.eu/ns/star/> .
+@prefix : <https://r11.eu/rdf/resource/> .
+"""
+
+
+def _death(n: int, pbw_desc: str, identifier: str, assignments: int = 1) -> str:
+    """Turtle for a death (with source and editor) resolvable by (pbw_desc, identifier)."""
+    literal = pbw_desc.replace("\\", "\\\\").replace('"', '\\"')
+    turtle = f"""
+    :death-{n} a crm:E69_Death .
+    :a2-{n} a star:E13_crm_P100 ;
+        crm:P140_assigned_attribute_to :death-{n} ;
+        crm:P141_assigned :person-{n} .
+    :person-{n} a crm:E21_Person .
+    :id-{n} a crm:E15_Identifier_Assignment ;
+        crm:P140_assigned_attribute_to :person-{n} ;
+        crm:P37_assigned :e42-{n} .
+    :e42-{n} a crm:E42_Identifier ;
+        crm:P190_has_symbolic_content "{identifier}" .
+    """
+    for i in range(assignments):
+        turtle += f"""
+        :attr-{n}-{i} a star:E13_crm_P3 ;
+            crm:P140_assigned_attribute_to :death-{n} ;
+            crm:P141_assigned "{literal}"@en ;
+            crm:P14_carried_out_by :authority-{n}-{i} ;
+            crm:P17_was_motivated_by :source-{n}-{i} .
+        :a3-{n}-{i} a star:E13_lrmoo_R15 ;
+            crm:P140_assigned_attribute_to :pub-{n}-{i} ;
+            crm:P141_assigned :source-{n}-{i} .
+        :a4-{n}-{i} a star:E13_lrmoo_R24 ;
+            crm:P17_was_motivated_by :pub-{n}-{i} ;
+            crm:P14_carried_out_by :editor-{n}-{i} .
+        :editor-{n}-{i} crm:P3_has_note "Editor {n}-{i}" .
+        """
+    return turtle
+
+
+keys = [
+    ("Died in battle", "Ioannes", "101"),
+    ('Called "the Younger"; died in exile', "Basileios", "102"),
+    ("Died at sea", "Michael", "103"),
+]
+missing_key = ("No such death", "Nobody", "999")
+ambiguous_key = ("Died twice", "Konstantinos", "104")
+
+
+@pytest.fixture(autouse=True)
+def mirror(tmp_path: Path):
+    dump = tmp_path / "deaths.ttl"
+    dump.write_text(
+        prefixes
+        + "".join(
+            _death(n, pbw_desc, f"{name} {code}")
+            for n, (pbw_desc, name, code) in enumerate(keys)
+        )
+        + _death(len(keys), ambiguous_key[0], " ".join(ambiguous_key[1:]), 2)
+    )
+
+    sparql_client.mirrors[endpoint] = MirrorStore(dump, snapshot_dir=None)
+    yield
+    del sparql_client.mirrors[endpoint]
+
+
+@pytest.mark.parametrize(
+    ("template", "batch_template"),
+    [
+        (source_deaths_template, source_deaths_batch_template),
+        (editor_deaths_template, editor_deaths_batch_template),
+    ],
+    ids=["source", "editor"],
+)
+def test_batched_lookup(template, batch_template):
+    """The batched lookup resolves keys like the per-row lookup."""
+    batched = get_uris_from_service_batched(
+        batch_template, [*keys, missing_key], endpoint=endpoint
+    )
+    expected = {
+        key: result
+        for key in (*keys, missing_key)
+        if (result := get_uris_from_service(template, *key, "test", endpoint))
+        is not None
+    }
+
+    assert len(expected) == len(keys)
+    assert missing_key not in batched
+    assert batched == expected
+
+
+def test_batched_lookup_ambiguous():
+    """Keys with several results resolve to one complete (unmixed) result."""
+    batched = get_uris_from_service_batched(
+        source_deaths_batch_template, [ambiguous_key], endpoint=endpoint
+    )
+
+    n = len(keys)
+    assert batched[ambiguous_key] in [
+        {
+            "attrassign_uri": URIRef(f"https://r11.eu/rdf/resource/attr-{n}-{i}"),
+            "death_uri": URIRef(f"https://r11.eu/rdf/resource/death-{n}"),
+            "authority_uri": URIRef(f"https://r11.eu/rdf/resource/authority-{n}-{i}"),
+            "source_uri": URIRef(f"https://r11.eu/rdf/resource/source-{n}-{i}"),
+        }
+        for i in range(2)
+    ]
+
+
+def test_batched_lookup_unknown_bindings():
+    """Bindings for keys which were not asked for are skipped."""
+    template = """
+    select ?pbw_desc ?identifier ?uri
+    where {{
+        {{ values (?pbw_desc ?identifier) {{
+{values}
+        }} }}
+        union
+        {{ bind("Unknown" as ?pbw_desc) bind("Nobody 1" as ?identifier) }}
+        bind(<https://r11.eu/rdf/resource/x> as ?uri)
+    }}
+    """
+    batched = get_uris_from_service_batched(template, keys[:1], endpoint=endpoint)
+
+    assert batched == {keys[0]: {"uri": URIRef("https://r11.eu/rdf/resource/x")}}
@@ -0,0 +1,69 @@
+"""Bulk date parsing against the scalar R11DateParser."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from r11data.benchmarks.suite import generate_date_strings
+from r11data.tabular.deaths.bulk_date_parser import DateLookup, ParsedDate, parse_dates
+from r11data.tabular.deaths.date_cache import DateParseFailure, parse_date
+
+
+examples = [
+    "J 1043, April 11-12 [TAQ]",
+    "J 1043, April-May",
+    "J 1043/1044",
+    "J 1044, February 29",
+    "AM 6551, April 3",
+    "AM 6551-6552 [TPQ]",
+    "A 500",
+    "J 1043, February 29",
+    "J 1043, Aprl 3",
+    "J 1043, April 31",
+    "J 1044-1043",
+    "X 1043",
+    "J",
+    "",
+    "UNDATED",
+    "J 1043 [XYZ]",
+    "J １０４３",
+]
+
+
+@pytest.fixture(scope="module")
+def date_strings() -> list[str]:
+    return examples + generate_date_strings(500)
+
+
+def test_parse_dates(date_strings):
+    """Bulk results and errors equal R11DateParser outcomes."""
+    bulk_dates = parse_dates(pd.Series(date_strings))
+
+    for date_string, jd_begin, jd_end, known_limit, error in zip(
+        date_strings, *bulk_dates
+    ):
+        outcome = parse_date(date_string)
+
+        assert error == isinstance(outcome, DateParseFailure), date_string
+        if not error:
+            assert outcome == ParsedDate(int(jd_begin), int(jd_end), known_limit)
+
+    assert not bulk_dates.error[: examples.index("J 1043, February 29")].any()
+    assert bulk_dates.error[examples.index("J 1043, February 29") : len(examples)].all()
+
+
+def test_parse_dates_non_strings():
+    """Non-string values are errors; components may be absent in all rows."""
+    values = pd.Series([None, np.nan, 1043, "J 1043"], index=[3, 2, 1, 0])
+    bulk_dates = parse_dates(values)
+
+    assert bulk_dates.error.tolist() == [True, True, True, False]
+    assert bulk_dates.jd_begin[3] == parse_date("J 1043").jd_begin
+
+
+def test_date_lookup():
+    lookup = DateLookup()
+    lookup.update(pd.Series(["J 1043, April 3", "J 1043, Aprl 3", "J 1043, April 3"]))
+
+    assert len(lookup) == 1
+    assert lookup.get("J 1043, April 3") == parse_date("J 1043, April 3")
+    assert lookup.get("J 1043, Aprl 3") is None
@@ -0,0 +1,125 @@
+"""Cross-checks of the Julian day lookup tables against convertdate."""
+
+import convertdate
+import numpy as np
+import pytest
+from r11data.tabular.deaths.calendars import (
+    armenian_table,
+    armenian_to_jd,
+    byzantine_julian_days_delta,
+    byzantine_to_jd,
+    julian_table,
+    julian_to_jd,
+)
+
+
+def _julian_dates(years: range) -> list[tuple[int, int, int]]:
+    """First, middle and last day (leap-year aware) of every month in years."""
+    return [
+        (year, month, day)
+        for year in years
+        for month in range(1, 13)
+        for day in sorted({1, 15, convertdate.julian.month_length(year, month)})
+    ]
+
+
+def _armenian_dates(years: range) -> list[tuple[int, int, int]]:
+    """First, middle and last day of every month (incl. epagomenal days) in years."""
+    return [
+        (year, month, day)
+        for year in years
+        for month in range(1, 14)
+        for day in ((1, 3, 5) if month == 13 else (1, 15, 30))
+    ]
+
+
+julian_dates = _julian_dates(range(julian_table.first_year, julian_table.last_year + 1))
+armenian_dates = _armenian_dates(
+    range(armenian_table.first_year, armenian_table.last_year + 1)
+)
+
+
+def _reference_byzantine_to_jd(year: int, month: int, day: int) -> float:
+    return convertdate.julian.to_jd(year, month, day) - byzantine_julian_days_delta
+
+
+@pytest.mark.parametrize(
+    ("converter", "reference", "dates"),
+    [
+        (julian_to_jd, convertdate.julian.to_jd, julian_dates),
+        (byzantine_to_jd, _reference_byzantine_to_jd, julian_dates),
+        (armenian_to_jd, convertdate.armenian.to_jd, armenian_dates),
+    ],
+)
+def test_table_range(converter, reference, dates):
+    """Scalar and array conversions match convertdate for the whole table range."""
+    expected = [reference(*date) for date in dates]
+
+    years, months, days = np.array(dates).T
+    assert converter(years, months, days).tolist() == expected
+    assert [converter(*date) for date in dates] == expected
+
+
+boundary_dates = [
+    # leap years: every fourth year in the Julian calendar, incl. centuries
+    (4, 2, 29),
+    (100, 2, 29),
+    (1500, 2, 29),
+    (1700, 2, 29),
+    (2000, 2, 29),
+    (1043, 2, 28),
+    (1043, 3, 1),
+    # AD/BC and AM era boundaries (AM 5508 = 1 BC, AM 5509 = AD 1)
+    (0, 1, 1),
+    (0, 12, 31),
+    (1, 1, 1),
+    (5508, 12, 31),
+    (5509, 1, 1),
+    # table boundaries and fallback to the closed-form formula
+    (julian_table.first_year, 1, 1),
+    (julian_table.last_year, 12, 31),
+    (julian_table.last_year + 1, 1, 1),
+    (-1, 12, 31),
+    (-4, 2, 29),
+    (9000, 2, 29),
+]
+
+
+@pytest.mark.parametrize("date", boundary_dates)
+def test_julian_boundaries(date):
+    assert julian_to_jd(*date) == convertdate.julian.to_jd(*date)
+    assert byzantine_to_jd(*date) == _reference_byzantine_to_jd(*date)
+
+    years, months, days = (np.array([value]) for value in date)
+    assert julian_to_jd(years, months, days).tolist() == [
+        convertdate.julian.to_jd(*date)
+    ]
+
+
+@pytest.mark.parametrize(
+    "date",
+    [
+        (armenian_table.first_year, 1, 1),
+        (armenian_table.last_year, 13, 5),
+        (armenian_table.last_year + 1, 1, 1),
+        (3000, 13, 5),
+    ],
+)
+def test_armenian_boundaries(date):
+    assert armenian_to_jd(*date) == convertdate.armenian.to_jd(*date)
+
+
+@pytest.mark.parametrize(
+    ("converter", "date"),
+    [
+        (julian_to_jd, (1043, 2, 29)),
+        (julian_to_jd, (1043, 6, 31)),
+        (byzantine_to_jd, (6551, 4, 31)),
+        (armenian_to_jd, (500, 13, 6)),
+        (armenian_to_jd, (500, 1, 31)),
+    ],
+)
+def test_invalid_dates(converter, date):
+    """Scalar conversions reject invalid dates like convertdate."""
+    with pytest.raises(ValueError):
+        converter(*date)
@@ -0,0 +1,97 @@
+"""Concurrent and batched deaths row conversion in row order."""
+
+import random
+import threading
+import time
+
+import pandas as pd
+import pytest
+from r11data.tabular.deaths import batching
+from r11data.tabular.deaths.batching import BatchedRowGraphConverter
+from r11data.tabular.deaths.concurrency import ConcurrentRowGraphConverter, ordered_map
+from rdflib import Graph, Literal, URIRef
+from tabulardf import RowGraphConverter
+
+
+dataframe = pd.DataFrame(
+    {
+        "Description": [f"Description {i}" for i in range(25)],
+        "Name": [f"Name {i}" for i in range(25)],
+        "Code": [str(i) for i in range(25)],
+    }
+)
+
+
+def row_rule(row_data: dict, query_results: dict | None = None) -> Graph:
+    # random delays let rows finish out of order
+    time.sleep(random.uniform(0, 0.005))
+
+    graph = Graph()
+    subject = URIRef(f"https://r11.eu/rdf/resource/{row_data['Code']}")
+    graph.add((subject, URIRef("https://r11.eu/ns/name"), Literal(row_data["Name"])))
+    if query_results is not None:
+        value = query_results[
+            (row_data["Description"], row_data["Name"], row_data["Code"])
+        ]
+        graph.add((subject, URIRef("https://r11.eu/ns/value"), Literal(value)))
+    return graph
+
+
+def test_ordered_map():
+    """Results are yielded in input order with at most max_workers calls in flight."""
+    lock = threading.Lock()
+    in_flight = max_in_flight = 0
+
+    def f(x: int) -> int:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(random.uniform(0, 0.005))
+        with lock:
+            in_flight -= 1
+        return x * x
+
+    assert list(ordered_map(f, range(50), max_workers=4)) == [x * x for x in range(50)]
+    assert max_in_flight <= 4
+
+
+def test_concurrent_converter():
+    """Concurrent row graphs equal sequential row graphs, in row order."""
+    sequential = RowGraphConverter(dataframe=dataframe, row_rule=row_rule)
+    concurrent = ConcurrentRowGraphConverter(
+        dataframe=dataframe, row_rule=row_rule, max_workers=4
+    )
+
+    assert [set(graph) for graph in concurrent._generate_graphs()] == [
+        set(graph) for graph in sequential._generate_graphs()
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 4])
+def test_batched_converter(monkeypatch, max_workers):
+    """Batched row graphs (with or without workers) are generated in row order."""
+    queries = []
+
+    def get_uris(query_template, keys):
+        keys = list(keys)
+        queries.append(keys)
+        return {key: f"{key[0]}: resolved" for key in keys}
+
+    monkeypatch.setattr(batching, "get_uris_from_service_batched", get_uris)
+
+    converter = BatchedRowGraphConverter(
+        dataframe=dataframe,
+        row_rule=row_rule,
+        query_template="",
+        batch_size=10,
+        max_workers=max_workers,
+    )
+    graphs = list(converter._generate_graphs())
+
+    assert len(queries) == 3
+    assert [len(keys) for keys in sorted(queries, key=len, reverse=True)] == [10, 10, 5]
+    assert [
+        str(next(graph.objects(predicate=URIRef("https://r11.eu/ns/value"))))
+        for graph in graphs
+    ] == [f"Description {i}: resolved" for i in range(25)]
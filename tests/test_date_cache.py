@@ -0,0 +1,85 @@
+"""Memoized and persisted date parser outcomes."""
+
+import inspect
+
+import convertdate
+from r11data.tabular.deaths import calendars, date_cache
+from r11data.tabular.deaths.date_cache import (
+    DateParseFailure,
+    DateParserCache,
+    _parser_version,
+    parse_date,
+)
+
+
+def test_get():
+    """Outcomes (incl. failures) are cached per raw value."""
+    cache = DateParserCache()
+
+    assert cache.get("J 1043, April 3") == parse_date("J 1043, April 3")
+    assert cache.get("J 1043, April 3") == parse_date("J 1043, April 3")
+    assert isinstance(cache.get("J 1043, Aprl 3"), DateParseFailure)
+    assert isinstance(cache.get("J 1043, Aprl 3"), DateParseFailure)
+
+    assert cache.stats() == {"hits": 2, "misses": 2, "size": 2}
+
+
+def test_lru():
+    cache = DateParserCache(maxsize=2)
+    cache.get("J 1043")
+    cache.get("J 1044")
+    cache.get("J 1043")
+    cache.get("J 1045")
+
+    assert list(cache.outcomes) == ["J 1043", "J 1045"]
+
+
+def test_persistence(tmp_path):
+    path = tmp_path / "dates.pickle"
+    cache = DateParserCache(path=path)
+    cache.get("J 1043")
+    cache.get("J 1043, Aprl 3")
+    cache.save()
+
+    loaded = DateParserCache(path=path)
+    assert loaded.get("J 1043") == parse_date("J 1043")
+    assert loaded.get("J 1043, Aprl 3") == cache.get("J 1043, Aprl 3")
+    assert loaded.stats() == {"hits": 2, "misses": 0, "size": 2}
+
+    assert len(DateParserCache(maxsize=1, path=path).outcomes) == 1
+
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / "dates.pickle"
+    path.write_bytes(b"not a pickle")
+
+    assert len(DateParserCache(path=path).outcomes) == 0
+
+
+def test_invalidation(tmp_path, monkeypatch):
+    """Persisted outcomes of other parser versions are discarded."""
+    path = tmp_path / "dates.pickle"
+    cache = DateParserCache(path=path)
+    cache.get("J 1043")
+    cache.save()
+
+    monkeypatch.setattr(date_cache, "_parser_version", lambda: "other")
+    assert len(DateParserCache(path=path).outcomes) == 0
+
+
+def test_parser_version(monkeypatch):
+    """The parser version covers date_parser, calendars and convertdate."""
+    version = _parser_version()
+    assert _parser_version() == version
+
+    monkeypatch.setattr(convertdate, "__version__", "0.0.0")
+    assert _parser_version() != version
+    monkeypatch.undo()
+
+    getsource = inspect.getsource
+    monkeypatch.setattr(
+        date_cache.inspect,
+        "getsource",
+        lambda module: getsource(module) + ("#" if module is calendars else ""),
+    )
+    assert _parser_version() != version
@@ -0,0 +1,104 @@
+"""Deterministic URI minting and N-Triples deltas."""
+
+import random
+
+import pytest
+from r11data.utils.delta import (
+    compute_delta,
+    diff_sorted,
+    external_sort,
+    write_changeset,
+)
+from r11data.utils.minting import Minter
+from rdflib import Graph
+
+
+@pytest.fixture
+def minter():
+    return Minter(deterministic=True)
+
+
+def test_deterministic_minting(minter):
+    row = {"Name": "Ioannes", "Date": "AM 6551"}
+
+    assert minter("source e13", row) == minter(
+        "source e13", dict(reversed(row.items()))
+    )
+    assert minter("source e13", row) != minter("source e52", row)
+    assert minter("source e13", row) != minter(
+        "source e13", {**row, "Name": "Basileios"}
+    )
+    assert minter("a", "b") != minter("ab")
+    assert minter.hash_value("a", 1) == "a\x1f1"
+
+
+def test_random_minting():
+    minter = Minter()
+
+    assert minter("source e13") != minter("source e13")
+    assert minter.hash_value("source e13") is None
+
+
+def test_external_sort(tmp_path):
+    lines = [f"{i % 50:03}\n" for i in range(200)]
+    random.Random(0).shuffle(lines)
+
+    output = external_sort(lines, tmp_path / "sorted.nt", chunk_size=7)
+
+    assert output.read_text().splitlines(keepends=True) == sorted(set(lines))
+
+
+def test_diff_sorted():
+    old = ["a\n", "b\n", "d\n"]
+    new = ["b\n", "c\n", "d\n", "e\n"]
+
+    assert list(diff_sorted(old, new)) == [
+        ("-", "a\n"),
+        ("+", "c\n"),
+        ("+", "e\n"),
+    ]
+    assert list(diff_sorted([], new)) == [("+", line) for line in new]
+    assert list(diff_sorted(old, [])) == [("-", line) for line in old]
+
+
+def test_write_changeset(tmp_path):
+    changes = [("+", "i1\n"), ("-", "d1\n"), ("+", "i2\n"), ("+", "i3\n")]
+
+    stats = write_changeset(changes, tmp_path / "changeset.ru", chunk_size=2)
+
+    assert (stats.deleted, stats.inserted) == (1, 3)
+    assert (tmp_path / "changeset.ru").read_text() == (
+        "DELETE DATA {\nd1\n};\n"
+        "INSERT DATA {\ni1\ni2\n};\n"
+        "INSERT DATA {\ni3\n};\n"
+    )
+
+
+def _nt(*objects: str) -> str:
+    return "".join(
+        f'<https://r11.eu/rdf/resource/s> <https://r11.eu/ns/p> "{o}" .\n'
+        for o in objects
+    )
+
+
+def test_compute_delta(tmp_path):
+    """Applying the changeset to the previous output yields the current output."""
+    output, snapshot = tmp_path / "output.nt", tmp_path / "snapshots" / "output.nt"
+    changeset = tmp_path / "changeset.ru"
+
+    output.write_text(_nt("a", "b", "c", "a"))
+    stats = compute_delta(output, snapshot, changeset)
+    assert (stats.deleted, stats.inserted) == (0, 3)
+    assert snapshot.read_text() == _nt("a", "b", "c")
+
+    graph = Graph()
+    graph.update(changeset.read_text())
+    assert len(graph) == 3
+
+    output.write_text(_nt("d", "b", "a"))
+    stats = compute_delta(output, snapshot, changeset)
+    assert (stats.deleted, stats.inserted) == (1, 1)
+
+    graph.update(changeset.read_text())
+    assert set(graph) == set(Graph().parse(output, format="nt"))
+    assert not list(snapshot.parent.glob("*.tmp"))
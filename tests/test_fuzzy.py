@@ -0,0 +1,74 @@
+"""MinHash/LSH fuzzy matching for Kekaumenos alignment."""
+
+import numpy as np
+import pytest
+from r11data.kekaumenos.utils.fuzzy import (
+    FuzzyIndex,
+    MinHasher,
+    char_ngrams,
+    normalize_text,
+)
+
+
+segments = [
+    "Ἐὰν ἔχῃς φίλον ἐν τόπῳ τινί, καὶ διέρχεται ἐκ τῆς χώρας σου,",
+    "μὴ ἀπλήκευε εἰς τὸν οἶκον αὐτοῦ, ἀλλ' ἀπλήκευε ἔξωθεν",
+    "καὶ ὁ λόγος οὗτος ἀληθής ἐστιν καὶ πιστός",
+    "",
+]
+
+
+def test_normalize_text():
+    """Diacritics, editorial sigla, case, final sigma and whitespace are normalized."""
+    assert normalize_text("  Ὁ ΛΌΓΟΣ [καὶ]  ⟨οὗτος⟩\n") == "ο λογοσ και ουτοσ"
+    assert normalize_text("λόγος") == normalize_text("ΛΟΓΟΣ")
+
+
+def test_char_ngrams():
+    assert char_ngrams("ab") == {" ab", "ab "}
+    assert char_ngrams("") == {"  "}
+
+
+def test_signature_similarity():
+    """The share of equal MinHash values estimates the Jaccard similarity."""
+    hasher = MinHasher(num_perm=512)
+    a, b = "kai o logos outos", "kai o logos outos alhqhs"
+
+    ngrams_a, ngrams_b = char_ngrams(a), char_ngrams(b)
+    jaccard = len(ngrams_a & ngrams_b) / len(ngrams_a | ngrams_b)
+    estimate = (hasher.signature(a) == hasher.signature(b)).mean()
+
+    assert np.array_equal(hasher.signature(a), hasher.signature(a))
+    assert estimate == pytest.approx(jaccard, abs=0.1)
+
+
+def test_query():
+    """Near-verbatim quotations match their segment best."""
+    index = FuzzyIndex(segments)
+
+    matches = index.query("ὁ λόγος οὗτος ἀληθὴς", top_k=3, threshold=0.3)
+    assert matches[0][0] == 2
+    assert matches[0][1] > 0.5
+    assert [score for _, score in matches] == sorted(
+        (score for _, score in matches), reverse=True
+    )
+
+    assert index.query(segments[1].upper())[0] == (1, 1.0)
+
+
+def test_query_top_k_threshold():
+    index = FuzzyIndex(segments)
+
+    assert len(index.query("καὶ", top_k=1, threshold=0)) <= 1
+    assert index.query("ξξξξξξ ψψψψψψ", threshold=0.5) == []
+    assert all(score >= 0.9 for _, score in index.query("ὁ λόγος οὗτος", threshold=0.9))
+
+
+def test_empty_index():
+    assert FuzzyIndex([]).query("λόγος") == []
+    assert FuzzyIndex(["", " "]).query("λόγος") == []
+
+
+def test_invalid_bands():
+    with pytest.raises(ValueError):
+        FuzzyIndex(segments, num_perm=64, bands=10)
@@ -0,0 +1,108 @@
+"""Incremental deaths rebuilds from a row manifest."""
+
+import json
+
+import pandas as pd
+from r11data.tabular.deaths.incremental import (
+    IncrementalRowGraphConverter,
+    RowManifest,
+    row_digest,
+)
+from r11data.utils.sinks import NTriplesSink, nt_line
+from rdflib import XSD, BNode, Graph, Literal, URIRef
+from tabulardf import RowGraphConverter
+
+
+calls: list[str] = []
+
+
+def row_rule(row_data: dict) -> Graph:
+    calls.append(row_data["Name"])
+
+    graph = Graph()
+    subject = URIRef(f"https://r11.eu/rdf/resource/{row_data['Code']}")
+    graph.add((subject, URIRef("https://r11.eu/ns/name"), Literal(row_data["Name"])))
+    graph.add(
+        (
+            subject,
+            URIRef("https://r11.eu/ns/note"),
+            Literal('"multi"\nline\r\\', lang="en"),
+        )
+    )
+    return graph
+
+
+def _converter(names: list[str]) -> RowGraphConverter:
+    dataframe = pd.DataFrame({"Name": names, "Code": [name.lower() for name in names]})
+    return RowGraphConverter(dataframe=dataframe, row_rule=row_rule)
+
+
+def _run(names: list[str], manifest: RowManifest) -> list[set]:
+    converter = IncrementalRowGraphConverter(
+        _converter(names), manifest=manifest, key="test"
+    )
+    return [set(graph) for graph in converter._generate_graphs()]
+
+
+def test_row_digest():
+    assert row_digest("a", {"x": 1, "y": 2}) == row_digest("a", {"y": 2, "x": 1})
+    assert row_digest("a", {"x": 1}) != row_digest("b", {"x": 1})
+    assert row_digest("a", {"x": 1}) != row_digest("a", {"x": 2})
+
+
+def test_incremental(tmp_path):
+    """Only added or changed rows are regenerated; output equals a full run."""
+    path = tmp_path / "manifest.json"
+    manifest = RowManifest(path, use_previous=False)
+    _run(["Ioannes", "Basileios", "Michael"], manifest)
+    manifest.save()
+
+    calls.clear()
+    names = ["Ioannes", "Basileios", "Nikolaos", "Nikolaos"]
+    manifest = RowManifest(path)
+    graphs = _run(names, manifest)
+
+    assert calls == ["Nikolaos", "Nikolaos"]
+    assert (manifest.reused, manifest.generated, manifest.removed) == (2, 2, 1)
+    assert graphs == [set(row_rule(dict(Name=n, Code=n.lower()))) for n in names]
+
+    # duplicate rows are recorded separately
+    manifest.save()
+    calls.clear()
+    assert _run(names, RowManifest(path)) == graphs
+    assert calls == []
+
+
+def test_manifest_version(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"version": 1, "rows": {"x-1": []}}))
+    assert RowManifest(path).previous == {}
+
+    path.write_text("{")
+    assert RowManifest(path).previous == {}
+
+
+def test_nt_line(tmp_path):
+    """N-Triples lines are single lines which parse back to the same triples."""
+    subject = URIRef("https://r11.eu/rdf/resource/1")
+    predicate = URIRef("https://r11.eu/ns/p")
+    triples = [
+        (subject, predicate, Literal('"multi"\nline\r\\ \t λόγος')),
+        (subject, predicate, Literal("λόγος", lang="grc")),
+        (subject, predicate, Literal("2020-01-01", datatype=XSD.date)),
+        (subject, predicate, Literal(1)),
+        (subject, predicate, BNode("b1")),
+        (BNode("b2"), predicate, subject),
+    ]
+
+    for triple in triples:
+        assert nt_line(triple).count("\n") == 1
+
+    with NTriplesSink(tmp_path / "out.nt") as sink:
+        sink.write(triples)
+
+    graph = Graph().parse(tmp_path / "out.nt", format="nt")
+    assert len(graph) == len(triples)
+    assert {o for o in graph.objects() if isinstance(o, Literal)} == {
+        o for _, _, o in triples if isinstance(o, Literal)
+    }
@@ -0,0 +1,44 @@
+"""Aho-Corasick matching against naive substring containment."""
+
+import random
+
+from r11data.kekaumenos.utils.matching import AhoCorasick
+
+
+def _contained(patterns: list[str], text: str) -> set[int]:
+    return {index for index, pattern in enumerate(patterns) if pattern in text}
+
+
+def test_contained():
+    patterns = ["he", "she", "his", "hers", "καὶ", "λόγος", "ς", "ers h", " "]
+    texts = ["ushers", "his hers", "ὁ λόγος καὶ", "", "h", "καί", "she   his"]
+    automaton = AhoCorasick(patterns)
+
+    for text in texts:
+        assert automaton.contained(text) == _contained(patterns, text)
+
+
+def test_contained_random():
+    """Overlapping patterns over a small alphabet match like 'pattern in text'."""
+    rng = random.Random(0)
+
+    def word(max_length: int) -> str:
+        return "".join(rng.choices("abc ", k=rng.randint(1, max_length)))
+
+    patterns = list({word(5) for _ in range(200)})
+    automaton = AhoCorasick(patterns)
+
+    for _ in range(200):
+        text = word(30)
+        assert automaton.contained(text) == _contained(patterns, text)
+
+
+def test_empty_patterns():
+    """Empty patterns are contained in every text, including the empty text."""
+    patterns = ["", "a", ""]
+    automaton = AhoCorasick(patterns)
+
+    assert automaton.contained("a") == {0, 1, 2}
+    assert automaton.contained("b") == {0, 2}
+    assert automaton.contained("") == {0, 2}
+    assert list(automaton.iter_matches("a")) == [(0, 1)]
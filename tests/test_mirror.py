@@ -0,0 +1,93 @@
+"""In-process SPARQL mirrors of RDF dumps."""
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+from pathlib import Path
+
+import pytest
+from r11data.utils.endpoints import endpoints
+from r11data.utils.mirror import MirrorStore, mount_mirror
+from r11data.utils.sparql_client import SPARQLClient
+from rdflib import Dataset, Graph
+
+
+trig = """
+@prefix : <https://r11.eu/rdf/resource/> .
+
+:g1 { :a :p "1" . }
+:g2 { :b :p "2" . }
+"""
+
+select = "select ?s where { ?s <https://r11.eu/rdf/resource/p> ?o } order by ?s"
+
+
+@pytest.fixture
+def dump(tmp_path) -> Path:
+    path = tmp_path / "dump.trig"
+    path.write_text(trig)
+    return path
+
+
+def _subjects(body: bytes) -> list[str]:
+    bindings = json.loads(body)["results"]["bindings"]
+    return [binding["s"]["value"].rsplit("/", 1)[-1] for binding in bindings]
+
+
+def test_query(dump):
+    """The default graph is the union of named graphs."""
+    store = MirrorStore(dump, snapshot_dir=None)
+
+    assert _subjects(store.query(select)) == ["a", "b"]
+
+    construct = "construct { ?s ?p ?o } where { ?s ?p ?o }"
+    assert len(Graph().parse(data=store.query(construct), format="turtle")) == 2
+    assert store.query(select, accept="text/csv").splitlines()[0] == b"s"
+
+
+def test_update(dump):
+    store = MirrorStore(dump, snapshot_dir=None)
+    store.update(
+        "insert data { <https://r11.eu/rdf/resource/c> <https://r11.eu/rdf/resource/p> 3 }"
+    )
+
+    assert _subjects(store.query(select)) == ["a", "b", "c"]
+    assert dump.read_text() == trig
+
+
+def test_snapshot(dump, tmp_path, monkeypatch):
+    """Snapshots are reused for unchanged dumps and written via unique temp files."""
+    snapshot_dir = tmp_path / "snapshots"
+
+    with ThreadPoolExecutor(4) as executor:
+        stores = [MirrorStore(dump, snapshot_dir=snapshot_dir) for _ in range(4)]
+        list(executor.map(lambda store: store.dataset, stores))
+
+    assert [path.suffix for path in snapshot_dir.iterdir()] == [".pickle"]
+
+    def parse(*args, **kwargs):
+        raise AssertionError("dump parsed despite snapshot")
+
+    with monkeypatch.context() as m:
+        m.setattr(Dataset, "parse", parse)
+        assert _subjects(
+            MirrorStore(dump, snapshot_dir=snapshot_dir).query(select)
+        ) == [
+            "a",
+            "b",
+        ]
+
+    dump.write_text(trig.replace('"2"', '"3"'))
+    MirrorStore(dump, snapshot_dir=snapshot_dir).dataset
+    assert len(list(snapshot_dir.iterdir())) == 2
+
+
+def test_mount_mirror(dump, monkeypatch):
+    client = SPARQLClient()
+    monkeypatch.setitem(endpoints, "releven", endpoints["releven"])
+
+    url = mount_mirror(MirrorStore(dump, snapshot_dir=None), "releven", client=client)
+
+    assert endpoints["releven"] == url
+    assert _subjects(client.query(url, select)) == ["a", "b"]
+    client.update(url, "delete where { ?s ?p ?o }")
+    assert _subjects(client.query(url, select)) == []
@@ -0,0 +1,42 @@
+"""Log output while live progress is displayed."""
+
+import io
+import logging
+import sys
+
+from loguru import logger as loguru_logger
+from r11data.utils import progress as progress_module
+from r11data.utils.progress import ProgressReporter, StderrHandler
+from rich.console import Console
+
+
+def test_stderr_handler(monkeypatch):
+    handler = StderrHandler()
+    stream = io.StringIO()
+    monkeypatch.setattr(sys, "stderr", stream)
+
+    handler.emit(logging.makeLogRecord({"msg": "message"}))
+    assert stream.getvalue() == "message\n"
+
+
+def test_live_logging(monkeypatch):
+    """Log records are written through the live display, not around it."""
+    monkeypatch.setattr(progress_module, "_loguru_routed", False)
+    stdlib_logger = logging.getLogger("test_live_logging")
+    monkeypatch.setattr(stdlib_logger, "handlers", [StderrHandler()])
+
+    stdout = io.StringIO()
+    console = Console(file=stdout, force_terminal=True, width=200)
+    reporter = ProgressReporter(enabled=True)
+
+    with reporter.live(console=console):
+        stdlib_logger.warning("stdlib message")
+        loguru_logger.warning("loguru message")
+
+    assert "stdlib message" in stdout.getvalue()
+    assert "loguru message" in stdout.getvalue()
+
+    # routing is set up once
+    with reporter.live(console=console):
+        pass
+    assert progress_module._loguru_routed
@@ -0,0 +1,88 @@
+"""Dependency-ordered runner scheduling."""
+
+from functools import partial
+import graphlib
+from pathlib import Path
+import time
+
+import pytest
+from r11data.scheduler import JobReport, format_reports, job_order, run_jobs
+
+
+def _record(log: Path, name: str, seconds: float = 0) -> None:
+    """Job recording its start and end (module-level, i.e. picklable)."""
+    with open(log, "a") as f:
+        f.write(f"start {name}\n")
+    time.sleep(seconds)
+    with open(log, "a") as f:
+        f.write(f"end {name}\n")
+
+
+def _fail() -> None:
+    raise ValueError("broken")
+
+
+def test_job_order():
+    dependencies = {"c": {"b"}, "b": {"a"}, "a": {"unscheduled"}}
+
+    assert job_order(["c", "b", "a"], dependencies) == ["a", "b", "c"]
+    assert job_order(["c", "a"], dependencies) in (["c", "a"], ["a", "c"])
+
+    with pytest.raises(graphlib.CycleError):
+        job_order(["a", "b"], {"a": {"b"}, "b": {"a"}})
+
+
+def test_run_jobs(tmp_path):
+    """Dependents start only after their dependencies succeeded."""
+    log = tmp_path / "log"
+    jobs = {
+        "a": partial(_record, log, "a", 0.5),
+        "b": partial(_record, log, "b"),
+        "c": partial(_record, log, "c"),
+    }
+
+    reports = run_jobs(jobs, max_jobs=3, dependencies={"b": {"a"}, "c": {"x"}})
+    lines = log.read_text().splitlines()
+
+    assert [report.status for report in reports] == ["succeeded"] * 3
+    assert lines.index("end a") < lines.index("start b")
+    assert all(report.seconds is not None for report in reports)
+
+
+def test_run_jobs_failure(tmp_path):
+    """Dependents of failed jobs are skipped; independent jobs still run."""
+    log = tmp_path / "log"
+    jobs = {
+        "a": _fail,
+        "b": partial(_record, log, "b"),
+        "c": partial(_record, log, "c"),
+        "d": partial(_record, log, "d"),
+    }
+
+    reports = {
+        report.name: report
+        for report in run_jobs(jobs, max_jobs=2, dependencies={"b": {"a"}, "c": {"b"}})
+    }
+
+    assert {name: report.status for name, report in reports.items()} == {
+        "a": "failed",
+        "b": "skipped",
+        "c": "skipped",
+        "d": "succeeded",
+    }
+    assert reports["a"].error == "ValueError: broken"
+    assert reports["c"].error == "Dependencies failed: b"
+    assert log.read_text() == "start d\nend d\n"
+
+
+def test_format_reports():
+    reports = [
+        JobReport("a", "succeeded", 1.25, 3 * 1024**2),
+        JobReport("b", "skipped", error="Dependencies failed: a"),
+    ]
+
+    assert format_reports(reports) == (
+        "Job report:\n"
+        "    a: succeeded, 1.2s wall time, 3 MiB peak\n"
+        "    b: skipped, - wall time, - peak (Dependencies failed: a)"
+    )
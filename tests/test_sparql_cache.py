@@ -0,0 +1,156 @@
+"""SQLite SPARQL response cache and its use by the SPARQLClient."""
+
+import asyncio
+import io
+
+import pytest
+from r11data.benchmarks.standin import StandInEndpoint
+from r11data.utils import sparql_cache as sparql_cache_module
+from r11data.utils.sparql_cache import CacheMode, SPARQLCache, cache_key
+from r11data.utils.sparql_client import SPARQLClient
+
+
+class Fetch:
+    """Fetch callable counting its calls."""
+
+    def __init__(self, body: bytes = b"body") -> None:
+        self.body = body
+        self.calls = 0
+
+    def __call__(self) -> bytes:
+        self.calls += 1
+        return self.body
+
+
+class Clock:
+    """Settable stand-in for time.time."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(sparql_cache_module.time, "time", clock)
+    return clock
+
+
+def test_cache_key():
+    """Keys ignore indentation and empty lines, but not endpoints and variants."""
+    query = "select *\nwhere {\n    ?s ?p 'a  b' .\n}"
+    indented = "\n    select *\n    where {\n\n        ?s ?p 'a  b' .\n    }\n"
+
+    assert cache_key("e", query) == cache_key("e", indented)
+    assert cache_key("e", query) != cache_key("f", query)
+    assert cache_key("e", query) != cache_key("e", query, "text/csv")
+    assert cache_key("e", query) != cache_key("e", query.replace("a  b", "a b"))
+
+
+def test_fetch(tmp_path):
+    cache = SPARQLCache(tmp_path / "cache.sqlite")
+    fetch = Fetch()
+
+    assert cache.fetch("e", "q", fetch) == b"body"
+    assert cache.fetch("e", "q", fetch) == b"body"
+    assert fetch.calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl(tmp_path, clock):
+    cache = SPARQLCache(tmp_path / "cache.sqlite", ttl=10)
+    cache.set("key", "e", b"body")
+
+    clock.now = 10
+    assert cache.get("key") == b"body"
+    clock.now = 11
+    assert cache.get("key") is None
+    # expired entries are deleted
+    assert cache.connection.execute("select count(*) from responses").fetchone() == (0,)
+
+
+def test_eviction(tmp_path, clock):
+    """Least recently accessed entries are evicted beyond max_size."""
+    cache = SPARQLCache(tmp_path / "cache.sqlite", max_size=10)
+    cache.set("a", "e", b"aaaa")
+    clock.now = 1
+    cache.set("b", "e", b"bbbb")
+    clock.now = 2
+    cache.get("a")
+    clock.now = 3
+    cache.set("c", "e", b"cccc")
+
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"cccc"
+
+
+def test_bypass(tmp_path):
+    cache = SPARQLCache(tmp_path / "cache.sqlite", mode=CacheMode.bypass)
+    fetch = Fetch()
+
+    cache.fetch("e", "q", fetch)
+    cache.fetch("e", "q", fetch)
+
+    assert fetch.calls == 2
+    assert cache.get(cache_key("e", "q")) is None
+
+
+def test_refresh(tmp_path):
+    cache = SPARQLCache(tmp_path / "cache.sqlite")
+    cache.fetch("e", "q", Fetch(b"old"))
+
+    cache.mode = CacheMode.refresh
+    fetch = Fetch(b"new")
+    assert cache.fetch("e", "q", fetch) == b"new"
+    assert cache.fetch("e", "q", fetch) == b"new"
+    assert fetch.calls == 2
+
+    cache.mode = CacheMode.use
+    assert cache.fetch("e", "q", Fetch(b"other")) == b"new"
+
+
+def test_afetch(tmp_path):
+    cache = SPARQLCache(tmp_path / "cache.sqlite")
+    fetch = Fetch()
+
+    async def afetch() -> bytes:
+        return fetch()
+
+    async def main() -> list[bytes]:
+        return [await cache.afetch("e", "q", afetch) for _ in range(2)]
+
+    assert asyncio.run(main()) == [b"body", b"body"]
+    assert fetch.calls == 1
+
+
+def test_set_file(tmp_path):
+    cache = SPARQLCache(tmp_path / "cache.sqlite")
+    body = bytes(range(256)) * 1000
+
+    cache.set_file("key", "e", io.BytesIO(body), chunk_size=1000)
+
+    assert cache.get("key") == body
+
+
+def test_client_params(tmp_path):
+    """Responses to the same query with different params are cached apart."""
+    client = SPARQLClient(cache=SPARQLCache(tmp_path / "cache.sqlite"))
+    query = "select ?s where { ?s ?p ?o }"
+
+    with StandInEndpoint() as endpoint:
+        for params in (None, {"infer": "true"}, {"infer": "false"}):
+            client.query(endpoint.url, query, params=params)
+            client.query(endpoint.url, query, params=params)
+
+        assert endpoint.requests == 3
+        assert [request.params.get("infer") for request in endpoint.received] == [
+            None,
+            ["true"],
+            ["false"],
+        ]
+
+    client.close()
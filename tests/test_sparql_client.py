@@ -0,0 +1,65 @@
+"""SPARQLClient requests against a local stand-in endpoint."""
+
+import asyncio
+
+import httpx
+import pytest
+from r11data.benchmarks.standin import StandInEndpoint
+from r11data.utils.sparql_cache import SPARQLCache
+from r11data.utils.sparql_client import SPARQLClient
+
+
+query = "select ?s where { ?s ?p ?o }"
+
+
+@pytest.fixture
+def client(tmp_path):
+    client = SPARQLClient(retries=2, backoff=0, cache=SPARQLCache(tmp_path / "c.db"))
+    yield client
+    client.close()
+
+
+def test_aquery_cache(client):
+    """Sync and async queries share cached responses."""
+
+    async def aquery(url: str, cached: bool = True) -> bytes:
+        try:
+            return await client.aquery(url, query, cached=cached)
+        finally:
+            await client.aclose()
+
+    with StandInEndpoint() as endpoint:
+        body = client.query(endpoint.url, query)
+
+        assert asyncio.run(aquery(endpoint.url)) == body
+        assert endpoint.requests == 1
+
+        assert asyncio.run(aquery(endpoint.url, cached=False)) == body
+        assert endpoint.requests == 2
+
+
+def test_retries(client):
+    """Server errors are retried up to client.retries times."""
+    with StandInEndpoint(failures=2) as endpoint:
+        body = client.query(endpoint.url, query, cached=False)
+
+        assert endpoint.requests == 3
+        assert body == client.query(endpoint.url, query, cached=False)
+
+
+def test_retries_exhausted(client):
+    with StandInEndpoint(failures=3) as endpoint:
+        with pytest.raises(httpx.HTTPStatusError):
+            client.query(endpoint.url, query, cached=False)
+
+        assert endpoint.requests == 3
+
+
+def test_stream_retries(client):
+    """Opening a streamed response is retried; the body is streamed in chunks."""
+    with StandInEndpoint(failures=1) as endpoint:
+        chunks = list(client.stream(endpoint.url, query, chunk_size=16))
+
+        assert endpoint.requests == 2
+        assert len(chunks) > 1
+        assert b"".join(chunks) == client.query(endpoint.url, query)
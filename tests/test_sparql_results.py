@@ -0,0 +1,73 @@
+"""Incremental SPARQL JSON results parsing."""
+
+import json
+
+import pytest
+from r11data.utils.sparql_results import iter_bindings, iter_raw_bindings
+
+
+bindings = [
+    {
+        "s": {"type": "uri", "value": f"https://r11.eu/rdf/resource/{i}"},
+        "label": {"type": "literal", "xml:lang": "grc", "value": f'λόγος {i} "}}" ,]'},
+    }
+    for i in range(20)
+] + [{}]
+
+body = json.dumps(
+    {"head": {"vars": ["s", "label"]}, "results": {"bindings": bindings}},
+    ensure_ascii=False,
+    indent=1,
+).encode("utf-8")
+
+
+def _chunks(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096, len(body)])
+def test_chunked(size):
+    """Results split at any byte (incl. within multi-byte characters) parse alike."""
+    assert list(iter_raw_bindings(_chunks(body, size))) == bindings
+
+
+def test_empty_chunks():
+    chunks = [b"", *_chunks(body, 5), b""]
+    assert list(iter_raw_bindings(chunks)) == bindings
+
+
+def test_iter_bindings():
+    assert next(iter_bindings([body])) == {
+        "s": "https://r11.eu/rdf/resource/0",
+        "label": 'λόγος 0 "}" ,]',
+    }
+
+
+def test_no_bindings():
+    empty = b'{"head": {"vars": []}, "results": {"bindings": [ ]}}'
+    assert list(iter_raw_bindings(_chunks(empty, 3))) == []
+
+
+def test_consumes_chunks():
+    """The chunk source is consumed completely, e.g. so that responses are cached."""
+    consumed = []
+
+    def chunks():
+        yield from _chunks(body, 100)
+        consumed.append(True)
+
+    list(iter_raw_bindings(chunks()))
+    assert consumed
+
+
+@pytest.mark.parametrize(
+    "invalid",
+    [
+        b'{"head": {"vars": []}, "boolean": true}',
+        b'{"head": {"vars": []}, "results": {"bindings": [{}, ',
+        b'{"head": {"vars": []}, "results": {"bindings": [{"s": ',
+    ],
+)
+def test_invalid(invalid):
+    with pytest.raises(ValueError):
+        list(iter_raw_bindings(_chunks(invalid, 4)))
@@ -0,0 +1,145 @@
+"""Starlegs runner graph generation with stubbed construct queries."""
+
+import pytest
+from r11data.starlegs import runner as starlegs_runner
+from r11data.starlegs.runner import StarlegsRunner
+from r11data.starlegs.utils._types import StarlegsQuery
+from r11data.starlegs.utils.checkpoint import PartitionCheckpoint
+from r11data.starlegs.utils.sparql_templates import partition_queries
+from rdflib import Graph, URIRef
+
+
+def _triple(n: int, predicate: str = "P140_assigned_attribute_to"):
+    return (
+        URIRef(f"https://r11.eu/rdf/resource/{n}"),
+        URIRef(f"http://www.cidoc-crm.org/cidoc-crm/{predicate}"),
+        URIRef("https://r11.eu/rdf/resource/x"),
+    )
+
+
+def _graph(*triples) -> Graph:
+    graph = Graph()
+    for triple in triples:
+        graph.add(triple)
+    return graph
+
+
+@pytest.fixture
+def final_counts(monkeypatch) -> list[dict]:
+    counts: list[dict] = []
+    monkeypatch.setattr(
+        starlegs_runner,
+        "starlegs_final_count_log",
+        lambda count_mapping, total: counts.append({**count_mapping, "total": total}),
+    )
+    return counts
+
+
+def test_final_count_distinct(monkeypatch, final_counts):
+    """Triples returned by several queries are counted once, like in a merged graph."""
+    graphs = [
+        _graph(_triple(1), _triple(2)),
+        _graph(_triple(2), _triple(3, "P141_assigned")),
+    ]
+    monkeypatch.setattr(
+        starlegs_runner, "generate_starlegs_graphs", lambda queries: iter(graphs)
+    )
+
+    generated = list(StarlegsRunner().generate_graphs())
+
+    merged = Graph()
+    for graph in generated:
+        merged += graph
+
+    assert final_counts == [
+        {"P140_assigned_attribute_to": 2, "P141_assigned": 1, "total": len(merged)}
+    ]
+
+
+class StubClient:
+    """SPARQL client answering partition queries with one triple each."""
+
+    def __init__(
+        self, queries: list[str], failing: frozenset[int] = frozenset()
+    ) -> None:
+        self.queries = queries
+        self.failing = failing
+        self.received: list[int] = []
+        self.graph: Graph | None = None
+
+    def query(self, endpoint, query, accept, auth) -> bytes:
+        index = self.queries.index(query)
+        self.received.append(index)
+        if index in self.failing:
+            raise ConnectionError(f"partition {index}")
+        return _graph(_triple(index)).serialize(format="turtle").encode()
+
+
+@pytest.fixture
+def partitioned(monkeypatch, tmp_path):
+    """Run a partitioned starlegs runner with 4 partitions against a StubClient."""
+    query = StarlegsQuery(
+        "construct { ?o ?p ?x } where { ?o ?p ?x }", target_class="crm:E21_Person"
+    )
+    queries = [str(q) for q in partition_queries(query, 4)]
+    monkeypatch.setattr(StarlegsRunner, "queries", [query])
+    monkeypatch.setattr(StarlegsRunner, "checkpoint_dir", tmp_path / "partitions")
+
+    def _run(failing: frozenset[int] = frozenset(), resume: bool = False) -> StubClient:
+        client = StubClient(queries, failing)
+        monkeypatch.setattr(starlegs_runner, "sparql_client", client)
+        runner = StarlegsRunner(partitions=4, resume=resume, max_concurrency=2)
+        client.graph = runner.run()
+        return client
+
+    return _run
+
+
+def test_checkpoint(tmp_path):
+    checkpoint = PartitionCheckpoint(tmp_path / "partitions")
+    graph = _graph(_triple(1), _triple(2))
+
+    assert checkpoint.get("endpoint", "query") is None
+    assert len(checkpoint) == 0
+
+    checkpoint.set("endpoint", "query", graph)
+    assert set(checkpoint.get("endpoint", " query ")) == set(graph)
+    assert checkpoint.get("other endpoint", "query") is None
+    assert len(checkpoint) == 1
+
+    checkpoint.clear()
+    assert len(checkpoint) == 0
+
+
+def test_partitioned_resume(partitioned, final_counts):
+    """Failed partitions are reported at the end and only they are rerun on resume."""
+    with pytest.raises(RuntimeError, match="2 starlegs partitions failed"):
+        partitioned(failing={1, 3})
+
+    client = partitioned(resume=True)
+    assert sorted(client.received) == [1, 3]
+    assert set(client.graph) == {_triple(n) for n in range(4)}
+    assert final_counts[-1]["total"] == 4
+
+    # completed runs leave no checkpoint behind
+    assert sorted(partitioned().received) == [0, 1, 2, 3]
+
+
+def test_partitioned_no_resume(partitioned):
+    with pytest.raises(RuntimeError):
+        partitioned(failing={0})
+
+    assert sorted(partitioned().received) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"mode": "count", "partitions": 4},
+        {"mode": "insert", "resume": True},
+        {"resume": True},
+    ],
+)
+def test_invalid_options(kwargs):
+    with pytest.raises(ValueError):
+        StarlegsRunner(**kwargs)
@@ -0,0 +1,75 @@
+"""GraphStoreSink uploads to a local stand-in Graph Store Protocol service."""
+
+import gzip
+
+from r11data.benchmarks.standin import StandInEndpoint
+from r11data.utils.sparql_cache import CacheMode, SPARQLCache
+from r11data.utils.sparql_client import SPARQLClient
+from r11data.utils.upload import GraphStoreSink
+from rdflib import Graph, Literal, URIRef
+
+
+graph_uri = "https://r11.eu/rdf/graph/test"
+
+
+def _graph() -> Graph:
+    graph = Graph()
+    for i in range(3):
+        graph.add(
+            (
+                URIRef(f"https://r11.eu/rdf/resource/{i}"),
+                URIRef("http://www.w3.org/2000/01/rdf-schema#label"),
+                Literal(f"label {i}", lang="en"),
+            )
+        )
+    return graph
+
+
+def _client(tmp_path) -> SPARQLClient:
+    cache = SPARQLCache(tmp_path / "cache.sqlite", mode=CacheMode.bypass)
+    return SPARQLClient(retries=2, backoff=0, cache=cache)
+
+
+def _upload(endpoint: StandInEndpoint, client: SPARQLClient, graph: Graph) -> None:
+    with GraphStoreSink(
+        endpoint.url, graph=graph_uri, chunk_size=2, max_workers=1, client=client
+    ) as sink:
+        sink.write(graph)
+
+
+def test_gsp_upload(tmp_path):
+    """Chunks are POSTed as gzipped N-Triples into the named graph."""
+    graph = _graph()
+
+    with StandInEndpoint() as endpoint:
+        _upload(endpoint, _client(tmp_path), graph)
+
+    assert len(endpoint.received) == 2
+
+    uploaded = Graph()
+    for request in endpoint.received:
+        assert request.method == "POST"
+        assert request.params == {"graph": [graph_uri]}
+        assert request.headers["content-type"] == "application/n-triples"
+        assert request.headers["content-encoding"] == "gzip"
+        uploaded.parse(data=gzip.decompress(request.body), format="nt")
+
+    assert set(uploaded) == set(graph)
+
+
+def test_gsp_upload_retries_server_errors(tmp_path):
+    """A chunk answered with a 5xx status is sent again."""
+    graph = _graph()
+
+    with StandInEndpoint(failures=1) as endpoint:
+        _upload(endpoint, _client(tmp_path), graph)
+
+    failed, retried, *_ = endpoint.received
+    assert len(endpoint.received) == 3
+    assert retried.body == failed.body
+    assert retried.params == failed.params == {"graph": [graph_uri]}
+
+    uploaded = Graph()
+    for request in endpoint.received[1:]:
+        uploaded.parse(data=gzip.decompress(request.body), format="nt")
+    assert set(uploaded) == set(graph)